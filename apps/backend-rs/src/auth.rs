@@ -277,6 +277,22 @@ async fn resolve_clerk_user(state: &AppState, claims: ClerkJwtClaims) -> Option<
     let pool = state.db_pool.as_ref()?;
     let user_metadata = clerk_user_metadata(&claims);
 
+    // Fastest path: the Clerk subject was resolved recently. The mapping is
+    // stable, so this skips the app_users lookup on most requests.
+    let cache_key = format!("clerk:{subject}");
+    if let Some(cached) = state.auth_user_cache.get(&cache_key).await {
+        if let Some(id) = cached.get("id").and_then(Value::as_str) {
+            return Some(AuthenticatedUser {
+                id: id.to_string(),
+                email: cached
+                    .get("email")
+                    .and_then(Value::as_str)
+                    .map(ToOwned::to_owned),
+                user_metadata,
+            });
+        }
+    }
+
     // Fast path: existing Clerk mapping already linked to an internal UUID.
     if let Ok(Some(row)) = sqlx::query(
         "SELECT id::text AS id, email::text AS email
@@ -290,6 +306,10 @@ async fn resolve_clerk_user(state: &AppState, claims: ClerkJwtClaims) -> Option<
     {
         let id = row.try_get::<String, _>("id").ok()?;
         let email = row.try_get::<Option<String>, _>("email").ok().flatten();
+        state
+            .auth_user_cache
+            .insert(cache_key, json!({ "id": id, "email": email }))
+            .await;
         return Some(AuthenticatedUser {
             id,
             email,
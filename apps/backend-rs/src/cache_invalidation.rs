@@ -9,7 +9,7 @@ const CHANNEL: &str = "cache_invalidate";
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct InvalidationEvent {
     /// Which cache to invalidate: "org_membership", "public_listings", "reports",
-    /// "enrichment", "agent_config", "fx".
+    /// "enrichment", "agent_config", "fx", "auth_user".
     pub cache: String,
     /// Optional key to invalidate. If empty, the entire cache is cleared.
     pub key: String,
@@ -111,6 +111,7 @@ async fn apply_invalidation(state: &AppState, event: &InvalidationEvent) {
         "enrichment" => &state.enrichment_cache,
         "agent_config" => &state.agent_config_cache,
         "fx" => &state.fx_cache,
+        "auth_user" => &state.auth_user_cache,
         other => {
             tracing::debug!(cache = other, "unknown cache in invalidation event");
             return;
@@ -46,7 +46,8 @@ pub struct AppConfig {
     pub rate_limit_per_second: u64,
     pub rate_limit_burst_size: u32,
     pub marketplace_public_enabled: bool,
-    pub marketplace_whatsapp_phone_e164: Option<String>,
+    /// `https://wa.me/<digits>` built once from `MARKETPLACE_WHATSAPP_PHONE_E164`.
+    pub marketplace_whatsapp_contact_url: Option<String>,
     pub transparent_pricing_required: bool,
     pub applications_pipeline_enabled: bool,
     pub lease_collections_enabled: bool,
@@ -93,6 +94,7 @@ pub struct AppConfig {
     pub db_pool_min_connections: u32,
     pub db_pool_acquire_timeout_seconds: u64,
     pub db_pool_idle_timeout_seconds: u64,
+    pub db_pool_test_before_acquire: bool,
     pub org_membership_cache_ttl_seconds: u64,
     pub org_membership_cache_max_entries: usize,
     pub public_listings_cache_ttl_seconds: u64,
@@ -105,6 +107,12 @@ pub struct AppConfig {
     pub agent_config_cache_max_entries: usize,
     pub fx_cache_ttl_seconds: u64,
     pub fx_cache_max_entries: usize,
+    pub auth_user_cache_ttl_seconds: u64,
+    pub auth_user_cache_max_entries: usize,
+    pub audit_queue_capacity: usize,
+    pub audit_buffer_size: usize,
+    pub audit_buffer_time_seconds: u64,
+    pub lease_status_refresh_debounce_ms: u64,
     pub default_org_id: Option<String>,
     pub default_user_id: Option<String>,
     pub internal_api_key: Option<String>,
@@ -157,7 +165,9 @@ impl AppConfig {
             rate_limit_per_second: env_parse_or("RATE_LIMIT_PER_SECOND", 200),
             rate_limit_burst_size: env_parse_or("RATE_LIMIT_BURST_SIZE", 2000),
             marketplace_public_enabled: env_parse_bool_or("MARKETPLACE_PUBLIC_ENABLED", true),
-            marketplace_whatsapp_phone_e164: env_opt("MARKETPLACE_WHATSAPP_PHONE_E164"),
+            marketplace_whatsapp_contact_url: env_opt("MARKETPLACE_WHATSAPP_PHONE_E164")
+                .as_deref()
+                .and_then(whatsapp_contact_url),
             transparent_pricing_required: env_parse_bool_or("TRANSPARENT_PRICING_REQUIRED", true),
             applications_pipeline_enabled: env_parse_bool_or("APPLICATIONS_PIPELINE_ENABLED", true),
             lease_collections_enabled: env_parse_bool_or("LEASE_COLLECTIONS_ENABLED", true),
@@ -228,6 +238,7 @@ impl AppConfig {
             db_pool_min_connections: env_parse_or("DB_POOL_MIN_CONNECTIONS", 5),
             db_pool_acquire_timeout_seconds: env_parse_or("DB_POOL_ACQUIRE_TIMEOUT_SECONDS", 5),
             db_pool_idle_timeout_seconds: env_parse_or("DB_POOL_IDLE_TIMEOUT_SECONDS", 600),
+            db_pool_test_before_acquire: env_parse_bool_or("DB_POOL_TEST_BEFORE_ACQUIRE", true),
             org_membership_cache_ttl_seconds: env_parse_or("ORG_MEMBERSHIP_CACHE_TTL_SECONDS", 30),
             org_membership_cache_max_entries: env_parse_or(
                 "ORG_MEMBERSHIP_CACHE_MAX_ENTRIES",
@@ -254,7 +265,13 @@ impl AppConfig {
             agent_config_cache_ttl_seconds: env_parse_or("AGENT_CONFIG_CACHE_TTL_SECONDS", 60),
             agent_config_cache_max_entries: env_parse_or("AGENT_CONFIG_CACHE_MAX_ENTRIES", 2000),
             fx_cache_ttl_seconds: env_parse_or("FX_CACHE_TTL_SECONDS", 3600),
-            fx_cache_max_entries: env_parse_or("FX_CACHE_MAX_ENTRIES", 10),
+            fx_cache_max_entries: env_parse_or("FX_CACHE_MAX_ENTRIES", 1024),
+            auth_user_cache_ttl_seconds: env_parse_or("AUTH_USER_CACHE_TTL_SECONDS", 300),
+            auth_user_cache_max_entries: env_parse_or("AUTH_USER_CACHE_MAX_ENTRIES", 10000),
+            audit_queue_capacity: env_parse_or("AUDIT_QUEUE_CAPACITY", 20000),
+            audit_buffer_size: env_parse_or("AUDIT_BUFFER_SIZE", 200),
+            audit_buffer_time_seconds: env_parse_or("AUDIT_BUFFER_TIME_SECONDS", 1),
+            lease_status_refresh_debounce_ms: env_parse_or("LEASE_STATUS_REFRESH_DEBOUNCE_MS", 500),
             default_org_id: env_opt("DEFAULT_ORG_ID"),
             default_user_id: env_opt("DEFAULT_USER_ID"),
             internal_api_key: env_opt("INTERNAL_API_KEY"),
@@ -483,9 +500,20 @@ fn normalize_prefix(raw: &str) -> String {
     prefix
 }
 
+fn whatsapp_contact_url(phone: &str) -> Option<String> {
+    let digits = phone
+        .chars()
+        .filter(|character| character.is_ascii_digit())
+        .collect::<String>();
+    if digits.is_empty() {
+        return None;
+    }
+    Some(format!("https://wa.me/{digits}"))
+}
+
 #[cfg(test)]
 mod tests {
-    use super::normalize_prefix;
+    use super::{normalize_prefix, whatsapp_contact_url};
 
     #[test]
     fn normalizes_prefix() {
@@ -493,4 +521,13 @@ mod tests {
         assert_eq!(normalize_prefix("/v1/"), "/v1");
         assert_eq!(normalize_prefix(""), "/v1");
     }
+
+    #[test]
+    fn builds_whatsapp_contact_url() {
+        assert_eq!(
+            whatsapp_contact_url("+595 981 123-456").as_deref(),
+            Some("https://wa.me/595981123456")
+        );
+        assert_eq!(whatsapp_contact_url(" + "), None);
+    }
 }
@@ -119,7 +119,10 @@ pub fn create_pool(config: &AppConfig) -> Result<Option<PgPool>, AppError> {
         .min_connections(config.db_pool_min_connections)
         .acquire_timeout(Duration::from_secs(config.db_pool_acquire_timeout_seconds))
         .idle_timeout(Duration::from_secs(config.db_pool_idle_timeout_seconds))
-        .test_before_acquire(true)
+        // Pinging every connection on checkout costs a round trip per query.
+        // Deployments behind a stable pooler can turn it off and rely on the
+        // idle timeout to retire stale connections.
+        .test_before_acquire(config.db_pool_test_before_acquire)
         .connect_lazy_with(connect_options);
 
     Ok(Some(pool))
@@ -99,6 +99,11 @@ async fn main() -> Result<(), Box<dyn std::error::Error>> {
         tracing::info!("Background scheduler enabled");
     }
 
+    if let Some(pool) = state.db_pool.clone() {
+        services::audit_queue::spawn_writer(pool.clone(), &state.config);
+        services::lease_status_refresh::spawn_refresher(pool, &state.config);
+    }
+
     if state.db_pool.is_some() {
         let invalidation_state = state.clone();
         tokio::spawn(cache_invalidation::spawn_listener(invalidation_state));
@@ -118,6 +123,9 @@ async fn main() -> Result<(), Box<dyn std::error::Error>> {
     )
     .with_graceful_shutdown(shutdown_signal())
     .await?;
+
+    services::lease_status_refresh::flush().await;
+    services::audit_queue::flush().await;
     Ok(())
 }
 
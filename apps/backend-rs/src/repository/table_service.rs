@@ -104,6 +104,192 @@ pub async fn list_rows(
     Ok(read_rows(rows))
 }
 
+/// A `LEFT JOIN` whose fields are merged into each row returned by
+/// `list_rows_joined` / `get_row_joined`.
+///
+/// `fields` maps output keys to SQL expressions over `alias`. They are
+/// compile-time constants and never carry user input. Fields are only added
+/// when the joined row exists.
+pub struct RowJoin {
+    pub table: &'static str,
+    pub alias: &'static str,
+    pub local_column: &'static str,
+    pub fields: &'static [(&'static str, &'static str)],
+}
+
+/// Same as `list_rows` but folds the given joins into each row, replacing a
+/// follow-up `id IN (...)` lookup with a single query.
+#[allow(clippy::too_many_arguments)]
+pub async fn list_rows_joined(
+    pool: &sqlx::PgPool,
+    table: &str,
+    filters: Option<&Map<String, Value>>,
+    joins: &[RowJoin],
+    limit: i64,
+    offset: i64,
+    order_by: &str,
+    ascending: bool,
+) -> Result<Vec<Value>, AppError> {
+    let mut query =
+        build_list_rows_joined(table, filters, joins, limit, offset, order_by, ascending)?;
+    let rows = query.build().fetch_all(pool).await.map_err(map_db_error)?;
+    Ok(read_rows(rows))
+}
+
+fn build_list_rows_joined(
+    table: &str,
+    filters: Option<&Map<String, Value>>,
+    joins: &[RowJoin],
+    limit: i64,
+    offset: i64,
+    order_by: &str,
+    ascending: bool,
+) -> Result<QueryBuilder<'static, Postgres>, AppError> {
+    let table_name = validate_table(table)?;
+    let order_name = if order_by.trim().is_empty() {
+        "created_at"
+    } else {
+        validate_identifier(order_by)?
+    };
+
+    let mut query = QueryBuilder::<Postgres>::new("");
+    push_joined_select(&mut query, table_name, joins)?;
+    query.push(" WHERE 1=1");
+
+    if let Some(filter_map) = filters {
+        for (key, value) in filter_map {
+            push_filter_clause(&mut query, key, value)?;
+        }
+    }
+
+    query.push(" ORDER BY t.").push(order_name);
+    if ascending {
+        query.push(" ASC");
+    } else {
+        query.push(" DESC");
+    }
+    query
+        .push(" LIMIT ")
+        .push_bind(limit.clamp(1, 1000))
+        .push(" OFFSET ")
+        .push_bind(offset.max(0));
+    Ok(query)
+}
+
+/// Same as `get_row` but folds the given joins into the row. When `scope` is
+/// given the membership check runs in the same query.
+pub async fn get_row_joined(
+    pool: &sqlx::PgPool,
+    table: &str,
+    row_id: &str,
+    id_field: &str,
+    joins: &[RowJoin],
+    scope: Option<&MemberScope<'_>>,
+) -> Result<Value, AppError> {
+    let table_name = validate_table(table)?;
+    let id_name = validate_identifier(id_field)?;
+
+    let mut query = QueryBuilder::<Postgres>::new("");
+    push_joined_select(&mut query, table_name, joins)?;
+    query.push(" WHERE ");
+    push_scalar_filter(
+        &mut query,
+        id_name,
+        FilterOperator::Eq,
+        &infer_scalar_filter(id_name, &Value::String(row_id.to_string())),
+    );
+    if let Some(scope) = scope {
+        push_member_scope(&mut query, scope);
+    }
+    query.push(" LIMIT 1");
+
+    let row = query
+        .build()
+        .fetch_optional(pool)
+        .await
+        .map_err(map_db_error)?;
+
+    row.and_then(|value| value.try_get::<Option<Value>, _>("row").ok().flatten())
+        .ok_or_else(|| AppError::NotFound(format!("{table_name} record not found.")))
+}
+
+/// Restricts a single-row read to rows whose `organization_id` has `user_id`
+/// as a member. Role checks stay with `assert_org_role`, so a member without
+/// the role still gets a 403 rather than a 404.
+pub struct MemberScope<'a> {
+    pub user_id: &'a str,
+}
+
+/// `get_row` plus the org membership check in one query. Rows outside the
+/// caller's organizations are reported as not found.
+pub async fn get_row_for_member(
+    pool: &sqlx::PgPool,
+    table: &str,
+    row_id: &str,
+    id_field: &str,
+    scope: &MemberScope<'_>,
+) -> Result<Value, AppError> {
+    get_row_joined(pool, table, row_id, id_field, &[], Some(scope)).await
+}
+
+fn push_member_scope(query: &mut QueryBuilder<Postgres>, scope: &MemberScope<'_>) {
+    query
+        .push(
+            " AND EXISTS (SELECT 1 FROM organization_members m \
+             WHERE m.organization_id = t.organization_id AND m.user_id = ",
+        )
+        .push_bind(scope.user_id.to_string())
+        .push("::uuid)");
+}
+
+fn push_joined_select(
+    query: &mut QueryBuilder<Postgres>,
+    table_name: &str,
+    joins: &[RowJoin],
+) -> Result<(), AppError> {
+    query.push("SELECT (to_jsonb(t)");
+    for join in joins {
+        let alias = validate_join_alias(join.alias)?;
+        query
+            .push(" || CASE WHEN ")
+            .push(alias)
+            .push(".id IS NULL THEN '{}'::jsonb ELSE jsonb_build_object(");
+        {
+            let mut separated = query.separated(", ");
+            for (key, expression) in join.fields {
+                separated.push(format!("'{}', {expression}", validate_identifier(key)?));
+            }
+        }
+        query.push(") END");
+    }
+    query.push(") AS row FROM ").push(table_name).push(" t");
+    for join in joins {
+        let join_table = validate_table(join.table)?;
+        let alias = validate_join_alias(join.alias)?;
+        let local_column = validate_identifier(join.local_column)?;
+        query
+            .push(" LEFT JOIN ")
+            .push(join_table)
+            .push(" ")
+            .push(alias)
+            .push(" ON ")
+            .push(alias)
+            .push(".id = t.")
+            .push(local_column);
+    }
+    Ok(())
+}
+
+fn validate_join_alias(alias: &str) -> Result<&str, AppError> {
+    let normalized = validate_identifier(alias)?;
+    if matches!(normalized, "t" | "r" | "m") {
+        return Err(AppError::BadRequest(format!(
+            "Invalid join alias '{normalized}'."
+        )));
+    }
+    Ok(normalized)
+}
+
 pub async fn get_row(
     pool: &sqlx::PgPool,
     table: &str,
@@ -244,42 +430,126 @@ pub async fn create_row_tx(
         .ok_or_else(|| AppError::Internal(format!("Could not create {table_name} record.")))
 }
 
-pub async fn update_row(
+/// Insert many rows with a single multi-row `INSERT`.
+///
+/// The column list is the union of keys across `payloads`; a key missing
+/// from one payload is inserted as NULL for that row, so callers should pass
+/// rows with a uniform shape.
+pub async fn create_rows_bulk(
     pool: &sqlx::PgPool,
     table: &str,
-    row_id: &str,
-    payload: &Map<String, Value>,
-    id_field: &str,
-) -> Result<Value, AppError> {
+    payloads: &[Map<String, Value>],
+) -> Result<Vec<Value>, AppError> {
     let table_name = validate_table(table)?;
-    let id_name = validate_identifier(id_field)?;
-    if payload.is_empty() {
-        return Err(AppError::BadRequest("No fields to update.".to_string()));
+    if payloads.is_empty() {
+        return Ok(Vec::new());
     }
 
-    let mut keys = payload.keys().cloned().collect::<Vec<_>>();
-    keys.sort_unstable();
+    let mut query = build_bulk_insert(table_name, payloads)?;
+    let rows = query.build().fetch_all(pool).await.map_err(map_db_error)?;
+    Ok(read_rows(rows))
+}
+
+fn build_bulk_insert(
+    table_name: &str,
+    payloads: &[Map<String, Value>],
+) -> Result<QueryBuilder<'static, Postgres>, AppError> {
+    let mut keys = payloads
+        .iter()
+        .flat_map(|payload| payload.keys().cloned())
+        .collect::<std::collections::BTreeSet<_>>()
+        .into_iter()
+        .collect::<Vec<_>>();
+    if keys.is_empty() {
+        return Err(AppError::BadRequest(format!(
+            "Could not create {table_name} records."
+        )));
+    }
     for key in &keys {
         validate_identifier(key)?;
     }
 
-    let mut query = QueryBuilder::<Postgres>::new("UPDATE ");
-    query.push(table_name).push(" t SET ");
+    // jsonb_populate_recordset resolves column types from the table
+    // definition, same as the single-row path in `create_row`.
+    let mut query = QueryBuilder::<Postgres>::new("INSERT INTO ");
+    query.push(table_name).push(" (");
     {
         let mut separated = query.separated(", ");
         for key in &keys {
-            let col = validate_identifier(key)?;
-            separated.push(col);
-            separated.push_unseparated(" = r.");
-            separated.push_unseparated(col);
+            separated.push(validate_identifier(key)?);
+        }
+    }
+    query.push(") SELECT ");
+    {
+        let mut separated = query.separated(", ");
+        for key in &keys {
+            separated.push("r.");
+            separated.push_unseparated(validate_identifier(key)?);
         }
     }
     query
-        .push(" FROM jsonb_populate_record(NULL::")
+        .push(" FROM jsonb_populate_recordset(NULL::")
         .push(table_name)
         .push(", ");
-    query.push_bind(Value::Object(payload.clone()));
-    query.push(") r WHERE ");
+    query.push_bind(Value::Array(
+        payloads.iter().cloned().map(Value::Object).collect(),
+    ));
+    query
+        .push(") r RETURNING row_to_json(")
+        .push(table_name)
+        .push(".*) AS row");
+    Ok(query)
+}
+
+pub async fn update_row(
+    pool: &sqlx::PgPool,
+    table: &str,
+    row_id: &str,
+    payload: &Map<String, Value>,
+    id_field: &str,
+) -> Result<Value, AppError> {
+    let (table_name, mut query) = build_update_row(table, row_id, payload, id_field)?;
+    let row = query
+        .build()
+        .fetch_optional(pool)
+        .await
+        .map_err(map_db_error)?;
+
+    row.and_then(|value| value.try_get::<Option<Value>, _>("row").ok().flatten())
+        .ok_or_else(|| AppError::NotFound(format!("{table_name} record not found.")))
+}
+
+/// Same as `update_row` but executes within an existing transaction.
+pub async fn update_row_tx(
+    conn: &mut PgConnection,
+    table: &str,
+    row_id: &str,
+    payload: &Map<String, Value>,
+    id_field: &str,
+) -> Result<Value, AppError> {
+    let (table_name, mut query) = build_update_row(table, row_id, payload, id_field)?;
+    let row = query
+        .build()
+        .fetch_optional(&mut *conn)
+        .await
+        .map_err(map_db_error)?;
+
+    row.and_then(|value| value.try_get::<Option<Value>, _>("row").ok().flatten())
+        .ok_or_else(|| AppError::NotFound(format!("{table_name} record not found.")))
+}
+
+fn build_update_row<'a>(
+    table: &'a str,
+    row_id: &str,
+    payload: &Map<String, Value>,
+    id_field: &str,
+) -> Result<(&'a str, QueryBuilder<'static, Postgres>), AppError> {
+    let table_name = validate_table(table)?;
+    let id_name = validate_identifier(id_field)?;
+
+    let mut query = QueryBuilder::<Postgres>::new("");
+    push_update_from_record(&mut query, table_name, "t", "r", payload)?;
+    query.push(" WHERE ");
     push_scalar_filter(
         &mut query,
         id_name,
@@ -287,6 +557,48 @@ pub async fn update_row(
         &infer_scalar_filter(id_name, &Value::String(row_id.to_string())),
     );
     query.push(" RETURNING row_to_json(t) AS row");
+    Ok((table_name, query))
+}
+
+/// A row updated alongside `update_row_with_linked`'s primary row. Its `id`
+/// is read from `link_column` on the updated primary row; nothing happens
+/// when that column is null.
+pub struct LinkedUpdate<'a> {
+    pub table: &'a str,
+    pub link_column: &'a str,
+    pub payload: &'a Map<String, Value>,
+}
+
+/// `update_row` plus a dependent update in the same statement, so both land
+/// in one round-trip and a failure in either surfaces as an error.
+pub async fn update_row_with_linked(
+    pool: &sqlx::PgPool,
+    table: &str,
+    row_id: &str,
+    payload: &Map<String, Value>,
+    id_field: &str,
+    linked: &LinkedUpdate<'_>,
+) -> Result<Value, AppError> {
+    let table_name = validate_table(table)?;
+    let id_name = validate_identifier(id_field)?;
+    let linked_table = validate_table(linked.table)?;
+    let link_column = validate_identifier(linked.link_column)?;
+
+    let mut query = QueryBuilder::<Postgres>::new("WITH updated AS (");
+    push_update_from_record(&mut query, table_name, "t", "r", payload)?;
+    query.push(" WHERE ");
+    push_scalar_filter(
+        &mut query,
+        id_name,
+        FilterOperator::Eq,
+        &infer_scalar_filter(id_name, &Value::String(row_id.to_string())),
+    );
+    query.push(" RETURNING t.*), linked AS (");
+    push_update_from_record(&mut query, linked_table, "l", "lr", linked.payload)?;
+    query
+        .push(", updated WHERE l.id = updated.")
+        .push(link_column)
+        .push(" RETURNING l.id) SELECT row_to_json(updated) AS row FROM updated");
 
     let row = query
         .build()
@@ -298,6 +610,51 @@ pub async fn update_row(
         .ok_or_else(|| AppError::NotFound(format!("{table_name} record not found.")))
 }
 
+/// `UPDATE table alias SET col = source.col, ... FROM
+/// jsonb_populate_record(NULL::table, payload) source`
+fn push_update_from_record(
+    query: &mut QueryBuilder<Postgres>,
+    table_name: &str,
+    alias: &str,
+    source: &str,
+    payload: &Map<String, Value>,
+) -> Result<(), AppError> {
+    if payload.is_empty() {
+        return Err(AppError::BadRequest("No fields to update.".to_string()));
+    }
+
+    let mut keys = payload.keys().cloned().collect::<Vec<_>>();
+    keys.sort_unstable();
+    for key in &keys {
+        validate_identifier(key)?;
+    }
+
+    query
+        .push("UPDATE ")
+        .push(table_name)
+        .push(" ")
+        .push(alias)
+        .push(" SET ");
+    {
+        let mut separated = query.separated(", ");
+        for key in &keys {
+            let col = validate_identifier(key)?;
+            separated.push(col);
+            separated.push_unseparated(" = ");
+            separated.push_unseparated(source);
+            separated.push_unseparated(".");
+            separated.push_unseparated(col);
+        }
+    }
+    query
+        .push(" FROM jsonb_populate_record(NULL::")
+        .push(table_name)
+        .push(", ");
+    query.push_bind(Value::Object(payload.clone()));
+    query.push(") ").push(source);
+    Ok(())
+}
+
 pub async fn delete_row(
     pool: &sqlx::PgPool,
     table: &str,
@@ -342,6 +699,77 @@ pub async fn count_rows(
     Ok(row.try_get::<i64, _>("total").unwrap_or(0))
 }
 
+/// Whether any row matches `filters`. Stops at the first match instead of
+/// counting or fetching rows.
+pub async fn row_exists(
+    pool: &sqlx::PgPool,
+    table: &str,
+    filters: Option<&Map<String, Value>>,
+) -> Result<bool, AppError> {
+    let table_name = validate_table(table)?;
+
+    let mut query = QueryBuilder::<Postgres>::new("SELECT EXISTS (SELECT 1 FROM ");
+    query.push(table_name).push(" t WHERE 1=1");
+
+    if let Some(filter_map) = filters {
+        for (key, value) in filter_map {
+            push_filter_clause(&mut query, key, value)?;
+        }
+    }
+    query.push(") AS found");
+
+    let row = query.build().fetch_one(pool).await.map_err(map_db_error)?;
+
+    Ok(row.try_get::<bool, _>("found").unwrap_or(false))
+}
+
+/// Change marker for one organization's rows across `tables`, read from
+/// `org_table_versions`. Triggers on those tables bump the marker on every
+/// insert, update or delete, so this is one primary-key lookup per table.
+/// A table without that trigger never changes the marker.
+pub async fn org_tables_version(
+    pool: &sqlx::PgPool,
+    org_id: &str,
+    tables: &[&str],
+) -> Result<String, AppError> {
+    if tables.is_empty() {
+        return Ok(String::new());
+    }
+
+    let table_names = tables
+        .iter()
+        .map(|table| validate_table(table).map(str::to_string))
+        .collect::<Result<Vec<_>, _>>()?;
+
+    let row = sqlx::query(
+        "SELECT COALESCE(string_agg(table_name || ':' || version, '|' ORDER BY table_name), '') AS version
+         FROM org_table_versions
+         WHERE organization_id = $1::uuid AND table_name = ANY($2)",
+    )
+    .bind(org_id)
+    .bind(&table_names)
+    .fetch_one(pool)
+    .await
+    .map_err(map_db_error)?;
+    Ok(row.try_get::<String, _>("version").unwrap_or_default())
+}
+
+/// `%value%` for a LIKE / ILIKE substring match. `\`, `%` and `_` in `value`
+/// are escaped so user input matches literally under Postgres' default `\`
+/// escape character.
+pub fn like_contains_pattern(value: &str) -> String {
+    let mut pattern = String::with_capacity(value.len() + 2);
+    pattern.push('%');
+    for character in value.chars() {
+        if matches!(character, '\\' | '%' | '_') {
+            pattern.push('\\');
+        }
+        pattern.push(character);
+    }
+    pattern.push('%');
+    pattern
+}
+
 pub fn date_overlap(start: &str, end: &str, periods: &[Map<String, Value>]) -> bool {
     periods.iter().any(|period| {
         let from = period
@@ -494,6 +922,9 @@ fn push_filter_clause(
     filter_key: &str,
     value: &Value,
 ) -> Result<(), AppError> {
+    if filter_key.contains('|') {
+        return push_any_column_filter(query, filter_key, value);
+    }
     let (column, operator) = parse_filter_key(filter_key)?;
 
     if matches!(operator, FilterOperator::IsNull) {
@@ -537,6 +968,53 @@ fn push_filter_clause(
     }
 }
 
+/// `a|b|c__ilike` (or `__like`) matches rows where any of the listed columns
+/// matches the pattern.
+fn push_any_column_filter(
+    query: &mut QueryBuilder<Postgres>,
+    filter_key: &str,
+    value: &Value,
+) -> Result<(), AppError> {
+    let Some((columns, suffix)) = filter_key.rsplit_once("__") else {
+        return Err(AppError::BadRequest(format!(
+            "Filter '{filter_key}' needs a __like or __ilike suffix."
+        )));
+    };
+    let sql_operator = match suffix {
+        "ilike" => " ILIKE ",
+        "like" => " LIKE ",
+        _ => {
+            return Err(AppError::BadRequest(format!(
+                "Filter '{filter_key}' needs a __like or __ilike suffix."
+            )))
+        }
+    };
+    let columns = columns
+        .split('|')
+        .map(validate_identifier)
+        .collect::<Result<Vec<_>, _>>()?;
+    let pattern = match value {
+        Value::Null => return Ok(()),
+        Value::String(text) => text.clone(),
+        other => other.to_string(),
+    };
+
+    query.push(" AND (");
+    for (index, column) in columns.iter().enumerate() {
+        if index > 0 {
+            query.push(" OR ");
+        }
+        query
+            .push("t.")
+            .push(*column)
+            .push("::text")
+            .push(sql_operator)
+            .push_bind(pattern.clone());
+    }
+    query.push(")");
+    Ok(())
+}
+
 fn push_scalar_filter(
     query: &mut QueryBuilder<Postgres>,
     column: &str,
@@ -778,7 +1256,11 @@ fn map_db_error(error: sqlx::Error) -> AppError {
 mod tests {
     use serde_json::{json, Map, Value};
 
-    use super::{date_overlap, is_uuid_formatted};
+    use super::{
+        build_bulk_insert, date_overlap, is_uuid_formatted, like_contains_pattern,
+        push_filter_clause, push_joined_select, push_member_scope, push_update_from_record,
+        MemberScope, RowJoin,
+    };
     use sqlx::{Postgres, QueryBuilder};
 
     #[test]
@@ -895,4 +1377,106 @@ mod tests {
             "Expected col = r.col pattern in SQL but got: {sql}"
         );
     }
+
+    #[test]
+    fn bulk_insert_sql_uses_column_union() {
+        let first = Map::from_iter([
+            ("action".to_string(), Value::String("create".to_string())),
+            (
+                "entity_name".to_string(),
+                Value::String("leases".to_string()),
+            ),
+        ]);
+        let second = Map::from_iter([
+            ("action".to_string(), Value::String("update".to_string())),
+            (
+                "entity_id".to_string(),
+                json!("550e8400-e29b-41d4-a716-446655440000"),
+            ),
+        ]);
+
+        let query = build_bulk_insert("audit_logs", &[first, second]).expect("valid insert");
+        let sql = query.sql();
+        assert!(
+            sql.starts_with("INSERT INTO audit_logs (action, entity_id, entity_name)"),
+            "Expected sorted column union in SQL but got: {sql}"
+        );
+        assert!(
+            sql.contains("jsonb_populate_recordset(NULL::audit_logs"),
+            "Expected jsonb_populate_recordset in SQL but got: {sql}"
+        );
+    }
+
+    #[test]
+    fn joined_select_merges_fields_only_when_join_matches() {
+        const JOINS: &[RowJoin] = &[RowJoin {
+            table: "leases",
+            alias: "l",
+            local_column: "lease_id",
+            fields: &[("tenant_full_name", "l.tenant_full_name")],
+        }];
+
+        let mut query = QueryBuilder::<Postgres>::new("");
+        push_joined_select(&mut query, "collection_records", JOINS).expect("valid join");
+        let sql = query.sql();
+        assert!(
+            sql.contains("CASE WHEN l.id IS NULL THEN '{}'::jsonb ELSE jsonb_build_object('tenant_full_name', l.tenant_full_name) END"),
+            "Expected guarded jsonb_build_object in SQL but got: {sql}"
+        );
+        assert!(
+            sql.contains("FROM collection_records t LEFT JOIN leases l ON l.id = t.lease_id"),
+            "Expected LEFT JOIN in SQL but got: {sql}"
+        );
+    }
+
+    #[test]
+    fn like_contains_pattern_escapes_wildcards() {
+        assert_eq!(like_contains_pattern("casa"), "%casa%");
+        assert_eq!(like_contains_pattern("100%"), "%100\\%%");
+        assert_eq!(like_contains_pattern("a_b"), "%a\\_b%");
+        assert_eq!(like_contains_pattern("c:\\d"), "%c:\\\\d%");
+    }
+
+    #[test]
+    fn any_column_filter_ors_the_columns() {
+        let mut query = QueryBuilder::<Postgres>::new("SELECT 1 FROM listings t WHERE 1=1");
+        push_filter_clause(&mut query, "title|city__ilike", &json!("%casa%")).unwrap();
+        assert_eq!(
+            query.sql(),
+            "SELECT 1 FROM listings t WHERE 1=1 AND (t.title::text ILIKE $1 OR t.city::text ILIKE $2)"
+        );
+
+        let mut query = QueryBuilder::<Postgres>::new("SELECT 1 FROM listings t WHERE 1=1");
+        assert!(push_filter_clause(&mut query, "title|city", &json!("casa")).is_err());
+        assert!(push_filter_clause(&mut query, "title|ci ty__ilike", &json!("casa")).is_err());
+    }
+
+    #[test]
+    fn member_scope_checks_membership() {
+        let mut query = QueryBuilder::<Postgres>::new("SELECT 1 FROM leases t WHERE 1=1");
+        push_member_scope(
+            &mut query,
+            &MemberScope {
+                user_id: "550e8400-e29b-41d4-a716-446655440000",
+            },
+        );
+        let sql = query.sql();
+        assert!(
+            sql.contains("EXISTS (SELECT 1 FROM organization_members m WHERE m.organization_id = t.organization_id AND m.user_id = $1::uuid)"),
+            "Expected membership subquery in SQL but got: {sql}"
+        );
+    }
+
+    #[test]
+    fn update_from_record_uses_given_aliases() {
+        let payload = Map::from_iter([("status".to_string(), json!("paid"))]);
+        let mut query = QueryBuilder::<Postgres>::new("");
+        push_update_from_record(&mut query, "lease_charges", "l", "lr", &payload)
+            .expect("valid update");
+        let sql = query.sql();
+        assert!(
+            sql.starts_with("UPDATE lease_charges l SET status = lr.status FROM jsonb_populate_record(NULL::lease_charges, $1) lr"),
+            "Expected aliased update in SQL but got: {sql}"
+        );
+    }
 }
@@ -20,7 +20,7 @@ use crate::{
         agent_chats,
         agent_runs::{self, AgentRunMode, CreateAgentRunParams},
         agent_runtime_v2::{inject_runtime_metadata, wrap_stream_event},
-        audit::write_audit_log,
+        audit_queue::enqueue_audit_log,
     },
     state::AppState,
     tenancy::assert_org_member,
@@ -222,7 +222,7 @@ async fn create_agent_chat(
     .await?;
 
     let entity_id = value_str(&chat, "id");
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.org_id),
         Some(&user_id),
@@ -388,7 +388,7 @@ async fn post_agent_chat_message(
     };
 
     if allow_mutations {
-        write_audit_log(
+        enqueue_audit_log(
             state.db_pool.as_ref(),
             Some(&query.org_id),
             Some(&user_id),
@@ -552,7 +552,7 @@ async fn archive_agent_chat(
 
     let chat = agent_chats::archive_chat(&state, &path.chat_id, &query.org_id, &user_id).await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&query.org_id),
         Some(&user_id),
@@ -587,7 +587,7 @@ async fn restore_agent_chat(
 
     let chat = agent_chats::restore_chat(&state, &path.chat_id, &query.org_id, &user_id).await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&query.org_id),
         Some(&user_id),
@@ -628,7 +628,7 @@ async fn delete_agent_chat(
 
     let deleted = agent_chats::delete_chat(&state, &path.chat_id, &query.org_id, &user_id).await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&query.org_id),
         Some(&user_id),
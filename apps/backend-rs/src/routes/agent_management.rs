@@ -11,7 +11,7 @@ use crate::{
     auth::require_user_id,
     cache::org_key,
     error::{AppError, AppResult},
-    services::agent_specs::default_max_steps_for_slug,
+    services::{agent_chats::agent_list_cache_key, agent_specs::default_max_steps_for_slug},
     state::AppState,
     tenancy::{assert_org_member, assert_org_role},
 };
@@ -353,6 +353,10 @@ async fn update_agent(
         .agent_config_cache
         .invalidate(&org_key(&payload.org_id, &path.agent_slug))
         .await;
+    state
+        .agent_config_cache
+        .invalidate(&agent_list_cache_key(&payload.org_id))
+        .await;
 
     Ok(Json(json!({
         "ok": true,
@@ -13,7 +13,7 @@ use crate::{
         agent_runtime_v2::{runtime_metadata, RuntimeExecutionIds},
         agent_specs::{allowed_tools_for_slug, get_agent_spec},
         ai_agent::{execute_tool, tool_definitions, ToolContext, TOOL_REGISTRY_VERSION},
-        audit::write_audit_log,
+        audit_queue::enqueue_audit_log,
         tool_validator::{normalize_tool_result, normalized_tool_error},
     },
     state::AppState,
@@ -208,7 +208,7 @@ async fn post_execute_tool(
         }
     };
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.org_id),
         Some(&user_id),
@@ -16,7 +16,7 @@ use crate::{
             agent_capabilities, run_ai_agent_chat, AgentConversationMessage, RunAiAgentChatParams,
             RuntimeExecutionContext,
         },
-        audit::write_audit_log,
+        audit_queue::enqueue_audit_log,
     },
     state::AppState,
     tenancy::assert_org_member,
@@ -157,7 +157,7 @@ async fn ai_agent_chat(
     )
     .await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.org_id),
         Some(&user_id),
@@ -9,14 +9,17 @@ use serde_json::{json, Map, Value};
 use crate::{
     auth::require_user_id,
     error::{AppError, AppResult},
-    repository::table_service::{create_row, get_row, list_rows, update_row},
+    repository::table_service::{
+        create_row, get_row, get_row_for_member, get_row_joined, list_rows, list_rows_joined,
+        update_row, MemberScope, RowJoin,
+    },
     schemas::{
         clamp_limit_in_range, ApplicationPath, ApplicationStatusInput, ApplicationsOverviewQuery,
         ApplicationsQuery, ConvertApplicationToLeaseInput,
     },
     services::{
-        analytics::write_analytics_event,
-        audit::write_audit_log,
+        audit_queue::{enqueue_analytics_event, enqueue_audit_log},
+        enrichment::cached_listing_context,
         lease_schedule::ensure_monthly_lease_schedule,
         notification_center::{emit_event, EmitNotificationEventInput},
         pricing::lease_financials_from_lines,
@@ -102,18 +105,9 @@ async fn list_applications(
         filters.insert("listing_id".to_string(), Value::String(listing_id));
     }
 
-    let rows = list_rows(
-        pool,
-        "application_submissions",
-        Some(&filters),
-        clamp_limit_in_range(query.limit, 1, 1000),
-        0,
-        "created_at",
-        false,
-    )
-    .await?;
-
-    let enriched = enrich_applications(pool, rows).await?;
+    let enriched =
+        list_enriched_applications(pool, &filters, clamp_limit_in_range(query.limit, 1, 1000))
+            .await?;
     Ok(Json(json!({ "data": enriched })))
 }
 
@@ -127,9 +121,7 @@ async fn get_application(
     let user_id = require_user_id(&state, &headers).await?;
     let pool = db_pool(&state)?;
 
-    let record = get_row(pool, "application_submissions", &path.application_id, "id").await?;
-    let org_id = value_str(&record, "organization_id");
-    assert_org_member(&state, &user_id, &org_id).await?;
+    let record = get_enriched_application(pool, &path.application_id, &user_id).await?;
 
     let events = list_rows(
         pool,
@@ -145,8 +137,7 @@ async fn get_application(
     )
     .await?;
 
-    let mut enriched = enrich_applications(pool, vec![record]).await?;
-    let mut item = enriched.pop().unwrap_or_else(|| Value::Object(Map::new()));
+    let mut item = record;
     if let Some(obj) = item.as_object_mut() {
         obj.insert("events".to_string(), Value::Array(events));
     }
@@ -185,18 +176,7 @@ async fn list_applications_overview(
         filters.insert("source".to_string(), Value::String(source));
     }
 
-    let rows = list_rows(
-        pool,
-        "application_submissions",
-        Some(&filters),
-        1000,
-        0,
-        "created_at",
-        false,
-    )
-    .await?;
-
-    let enriched = enrich_applications(pool, rows).await?;
+    let enriched = list_enriched_applications(pool, &filters, 1000).await?;
     let contexts = load_application_link_context(pool, &enriched).await?;
     let application_ids = enriched
         .iter()
@@ -208,21 +188,23 @@ async fn list_applications_overview(
         load_application_last_touch_index(pool, &enriched, &related_leases).await?;
     let failed_submissions = load_application_submit_failures(pool, &query.org_id, None).await?;
 
+    let now = Utc::now().fixed_offset();
     let filtered_rows = enriched
         .into_iter()
         .filter(|row| application_matches_overview_filters(row, &query, &contexts))
         .collect::<Vec<_>>();
-    let saved_views = build_saved_view_counts(&filtered_rows, &related_leases);
+    let saved_views = build_saved_view_counts(&filtered_rows, &related_leases, now);
 
     let mut display_rows = filtered_rows
         .into_iter()
-        .filter(|row| application_matches_view(row, query.view.as_deref(), &related_leases))
+        .filter(|row| application_matches_view(row, query.view.as_deref(), &related_leases, now))
         .collect::<Vec<_>>();
     sort_application_overview_rows(
         &mut display_rows,
         query.sort.as_deref(),
         &last_touch_index,
         &related_leases,
+        now,
     );
 
     let total = display_rows.len() as i64;
@@ -248,7 +230,7 @@ async fn list_applications_overview(
         .collect::<Vec<_>>();
 
     Ok(Json(json!({
-        "summary": build_applications_summary(&display_rows, &related_leases),
+        "summary": build_applications_summary(&display_rows, &related_leases, now),
         "savedViews": saved_views,
         "rows": paged_rows,
         "pagination": {
@@ -260,7 +242,7 @@ async fn list_applications_overview(
         "facets": build_application_facets(&display_rows, &contexts),
         "intakeHealth": {
             "failedSubmissions": failed_submissions.len(),
-            "stalledApplications": display_rows.iter().filter(|row| is_stalled_application(row)).count(),
+            "stalledApplications": display_rows.iter().filter(|row| is_stalled_application(row, now)).count(),
         }
     })))
 }
@@ -275,12 +257,9 @@ async fn get_application_overview(
     let user_id = require_user_id(&state, &headers).await?;
     let pool = db_pool(&state)?;
 
-    let record = get_row(pool, "application_submissions", &path.application_id, "id").await?;
-    let org_id = value_str(&record, "organization_id");
-    assert_org_member(&state, &user_id, &org_id).await?;
+    let application = get_enriched_application(pool, &path.application_id, &user_id).await?;
+    let org_id = value_str(&application, "organization_id");
 
-    let mut enriched = enrich_applications(pool, vec![record]).await?;
-    let application = enriched.pop().unwrap_or_else(|| Value::Object(Map::new()));
     let contexts = load_application_link_context(pool, std::slice::from_ref(&application)).await?;
     let context = contexts
         .get(&path.application_id)
@@ -343,7 +322,14 @@ async fn update_application_status(
     let user_id = require_user_id(&state, &headers).await?;
     let pool = db_pool(&state)?;
 
-    let record = get_row(pool, "application_submissions", &path.application_id, "id").await?;
+    let record = get_row_for_member(
+        pool,
+        "application_submissions",
+        &path.application_id,
+        "id",
+        &MemberScope { user_id: &user_id },
+    )
+    .await?;
     let org_id = value_str(&record, "organization_id");
     assert_org_role(&state, &user_id, &org_id, APPLICATION_EDIT_ROLES).await?;
 
@@ -363,7 +349,8 @@ async fn update_application_status(
         )));
     }
 
-    let now_iso = Utc::now().to_rfc3339();
+    let now = Utc::now();
+    let now_iso = now.to_rfc3339();
     let mut patch = Map::new();
     patch.insert("status".to_string(), Value::String(next.clone()));
 
@@ -428,7 +415,7 @@ async fn update_application_status(
     .await?;
     let event_id = value_str(&event, "id");
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -441,7 +428,7 @@ async fn update_application_status(
     .await;
 
     if next == "qualified" {
-        write_analytics_event(
+        enqueue_analytics_event(
             state.db_pool.as_ref(),
             Some(&org_id),
             "qualify",
@@ -496,7 +483,7 @@ async fn update_application_status(
                 "application_status_changed:{}:{}",
                 path.application_id,
                 if event_id.is_empty() {
-                    Utc::now().timestamp().to_string()
+                    now.timestamp().to_string()
                 } else {
                     event_id.clone()
                 }
@@ -507,7 +494,7 @@ async fn update_application_status(
     )
     .await;
 
-    let mut enriched = enrich_applications(pool, vec![updated]).await?;
+    let mut enriched = enrich_applications(&state, pool, vec![updated]).await?;
     let mut item = enriched.pop().unwrap_or_else(|| Value::Object(Map::new()));
     if let Some(obj) = item.as_object_mut() {
         obj.insert(
@@ -530,7 +517,14 @@ async fn convert_application_to_lease(
     let user_id = require_user_id(&state, &headers).await?;
     let pool = db_pool(&state)?;
 
-    let application = get_row(pool, "application_submissions", &path.application_id, "id").await?;
+    let application = get_row_for_member(
+        pool,
+        "application_submissions",
+        &path.application_id,
+        "id",
+        &MemberScope { user_id: &user_id },
+    )
+    .await?;
     let org_id = value_str(&application, "organization_id");
     assert_org_role(&state, &user_id, &org_id, APPLICATION_EDIT_ROLES).await?;
 
@@ -541,7 +535,21 @@ async fn convert_application_to_lease(
         ));
     }
 
+    let use_explicit = [
+        payload.monthly_rent,
+        payload.service_fee_flat,
+        payload.security_deposit,
+        payload.guarantee_option_fee,
+        payload.tax_iva,
+    ]
+    .iter()
+    .any(|value| *value > 0.0);
+
+    // The listing and its fee lines only depend on the application's
+    // listing_id, so fetch both in one round-trip. Fee lines only feed the
+    // default financials, so skip them when the payload sets explicit amounts.
     let mut listing: Option<Value> = None;
+    let mut defaults = crate::services::pricing::LeaseFinancials::default();
     if let Some(listing_id) = application
         .as_object()
         .and_then(|obj| obj.get("listing_id"))
@@ -549,30 +557,20 @@ async fn convert_application_to_lease(
         .map(str::trim)
         .filter(|value| !value.is_empty())
     {
-        listing = Some(get_row(pool, "listings", listing_id, "id").await?);
-    }
-
-    let mut defaults = crate::services::pricing::LeaseFinancials::default();
-    if let Some(listing_row) = listing.as_ref() {
-        let listing_id = value_str(listing_row, "id");
-        if !listing_id.is_empty() {
-            let lines = listing_fee_lines(pool, &listing_id).await?;
+        if use_explicit {
+            listing = Some(get_row(pool, "listings", listing_id, "id").await?);
+        } else {
+            let (listing_row, lines) = tokio::try_join!(
+                get_row(pool, "listings", listing_id, "id"),
+                listing_fee_lines(pool, listing_id)
+            )?;
             if !lines.is_empty() {
                 defaults = lease_financials_from_lines(&lines);
             }
+            listing = Some(listing_row);
         }
     }
 
-    let use_explicit = [
-        payload.monthly_rent,
-        payload.service_fee_flat,
-        payload.security_deposit,
-        payload.guarantee_option_fee,
-        payload.tax_iva,
-    ]
-    .iter()
-    .any(|value| *value > 0.0);
-
     let monthly_rent = if use_explicit {
         payload.monthly_rent
     } else {
@@ -698,9 +696,10 @@ async fn convert_application_to_lease(
         schedule_collections_created = schedule.collections.len();
     }
 
-    // Create security deposit collection record if deposit > 0
-    if security_deposit > 0.0 {
-        let deposit_record = json_map(&[
+    // Security deposit collection (if any) and the move-in preparation task
+    // are independent best-effort inserts; issue them together.
+    let deposit_record = (security_deposit > 0.0).then(|| {
+        json_map(&[
             ("organization_id", Value::String(org_id.clone())),
             ("lease_id", Value::String(lease_id.clone())),
             (
@@ -716,36 +715,38 @@ async fn convert_application_to_lease(
             ("currency", Value::String(payload.currency.clone())),
             ("due_date", Value::String(payload.starts_on.clone())),
             ("status", Value::String("pending".to_string())),
-        ]);
-        let _ = create_row(pool, "collection_records", &deposit_record).await;
-    }
-
-    // Create move-in preparation task
-    {
-        let tenant_name = application_value(&application, "full_name")
-            .and_then(|v| v.as_str().map(str::to_string))
-            .unwrap_or_else(|| "Tenant".to_string());
-        let task_record = json_map(&[
-            ("organization_id", Value::String(org_id.clone())),
-            (
-                "property_id",
-                lease.get("property_id").cloned().unwrap_or(Value::Null),
-            ),
-            (
-                "unit_id",
-                lease.get("unit_id").cloned().unwrap_or(Value::Null),
-            ),
-            ("type", Value::String("check_in".to_string())),
-            (
-                "title",
-                Value::String(format!("Move-in preparation: {tenant_name}")),
-            ),
-            ("status", Value::String("todo".to_string())),
-            ("priority", Value::String("high".to_string())),
-            ("due_date", Value::String(payload.starts_on.clone())),
-        ]);
-        let _ = create_row(pool, "tasks", &task_record).await;
-    }
+        ])
+    });
+    let tenant_name = application_value(&application, "full_name")
+        .and_then(|v| v.as_str().map(str::to_string))
+        .unwrap_or_else(|| "Tenant".to_string());
+    let task_record = json_map(&[
+        ("organization_id", Value::String(org_id.clone())),
+        (
+            "property_id",
+            lease.get("property_id").cloned().unwrap_or(Value::Null),
+        ),
+        (
+            "unit_id",
+            lease.get("unit_id").cloned().unwrap_or(Value::Null),
+        ),
+        ("type", Value::String("check_in".to_string())),
+        (
+            "title",
+            Value::String(format!("Move-in preparation: {tenant_name}")),
+        ),
+        ("status", Value::String("todo".to_string())),
+        ("priority", Value::String("high".to_string())),
+        ("due_date", Value::String(payload.starts_on.clone())),
+    ]);
+    let _ = tokio::join!(
+        async {
+            if let Some(record) = deposit_record.as_ref() {
+                let _ = create_row(pool, "collection_records", record).await;
+            }
+        },
+        create_row(pool, "tasks", &task_record)
+    );
 
     // Fire lease_created and lease_activated workflow triggers
     {
@@ -820,7 +821,7 @@ async fn convert_application_to_lease(
     )
     .await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -832,7 +833,7 @@ async fn convert_application_to_lease(
     )
     .await;
 
-    write_analytics_event(
+    enqueue_analytics_event(
         state.db_pool.as_ref(),
         Some(&org_id),
         "lease_sign",
@@ -850,7 +851,7 @@ async fn convert_application_to_lease(
     )
     .await;
 
-    let mut enriched = enrich_applications(pool, vec![updated_application]).await?;
+    let mut enriched = enrich_applications(&state, pool, vec![updated_application]).await?;
     Ok(Json(json!({
         "application": enriched.pop().unwrap_or_else(|| Value::Object(Map::new())),
         "lease": lease,
@@ -876,7 +877,11 @@ async fn listing_fee_lines(pool: &sqlx::PgPool, listing_id: &str) -> AppResult<V
     .await
 }
 
-async fn enrich_applications(pool: &sqlx::PgPool, rows: Vec<Value>) -> AppResult<Vec<Value>> {
+async fn enrich_applications(
+    state: &AppState,
+    pool: &sqlx::PgPool,
+    rows: Vec<Value>,
+) -> AppResult<Vec<Value>> {
     if rows.is_empty() {
         return Ok(rows);
     }
@@ -905,34 +910,9 @@ async fn enrich_applications(pool: &sqlx::PgPool, rows: Vec<Value>) -> AppResult
         .into_iter()
         .collect::<Vec<_>>();
 
-    let listing_ids_for_query = listing_ids.clone();
     let assigned_user_ids_for_query = assigned_user_ids.clone();
     let (listings, users) = tokio::try_join!(
-        async move {
-            if listing_ids_for_query.is_empty() {
-                Ok(Vec::new())
-            } else {
-                list_rows(
-                    pool,
-                    "listings",
-                    Some(&json_map(&[(
-                        "id",
-                        Value::Array(
-                            listing_ids_for_query
-                                .iter()
-                                .cloned()
-                                .map(Value::String)
-                                .collect(),
-                        ),
-                    )])),
-                    std::cmp::max(200, listing_ids_for_query.len() as i64),
-                    0,
-                    "created_at",
-                    false,
-                )
-                .await
-            }
-        },
+        cached_listing_context(state, pool, &listing_ids),
         async move {
             if assigned_user_ids_for_query.is_empty() {
                 Ok(Vec::new())
@@ -1013,28 +993,18 @@ async fn enrich_applications(pool: &sqlx::PgPool, rows: Vec<Value>) -> AppResult
     let mut enriched = Vec::with_capacity(rows.len());
     for mut row in rows {
         if let Some(obj) = row.as_object_mut() {
-            let listing_id = obj
+            let listing_info = obj
                 .get("listing_id")
                 .and_then(Value::as_str)
                 .map(str::trim)
-                .filter(|value| !value.is_empty());
-            let listing_info = listing_id.and_then(|value| listing_context.get(value));
+                .filter(|value| !value.is_empty())
+                .and_then(|value| listing_context.get(value));
             let listing_title = listing_info
                 .and_then(|(title, _)| title.clone())
                 .map(Value::String)
                 .unwrap_or(Value::Null);
-            obj.insert("listing_title".to_string(), listing_title);
-
             let monthly_total = listing_info.map(|(_, monthly)| *monthly).unwrap_or(0.0);
-            let (score, band, income_ratio) = qualification_from_row(obj, monthly_total);
-            obj.insert("qualification_score".to_string(), json!(score));
-            obj.insert("qualification_band".to_string(), Value::String(band));
-            obj.insert(
-                "income_to_rent_ratio".to_string(),
-                income_ratio
-                    .map(|value| json!(value))
-                    .unwrap_or(Value::Null),
-            );
+            obj.insert("listing_title".to_string(), listing_title);
 
             if let Some(assigned_user_id) = obj
                 .get("assigned_user_id")
@@ -1042,107 +1012,203 @@ async fn enrich_applications(pool: &sqlx::PgPool, rows: Vec<Value>) -> AppResult
                 .map(str::trim)
                 .filter(|value| !value.is_empty())
             {
-                obj.insert(
-                    "assigned_user_name".to_string(),
-                    assigned_user_name
-                        .get(assigned_user_id)
-                        .cloned()
-                        .map(Value::String)
-                        .unwrap_or(Value::Null),
-                );
+                let name = assigned_user_name
+                    .get(assigned_user_id)
+                    .cloned()
+                    .map(Value::String)
+                    .unwrap_or(Value::Null);
+                obj.insert("assigned_user_name".to_string(), name);
             }
 
-            let created_at = parse_iso_datetime(obj.get("created_at"));
-            let Some(created_at) = created_at else {
-                enriched.push(row);
-                continue;
-            };
+            apply_application_scores(obj, monthly_total, now);
+        }
+        enriched.push(row);
+    }
+
+    Ok(enriched)
+}
+
+/// Listing title, listing rent and assignee name joined onto application
+/// rows by `list_enriched_applications` / `get_enriched_application`.
+const APPLICATION_JOINS: &[RowJoin] = &[
+    RowJoin {
+        table: "listings",
+        alias: "li",
+        local_column: "listing_id",
+        fields: &[
+            ("listing_title", "NULLIF(btrim(li.title), '')"),
+            (
+                "listing_monthly_recurring_total",
+                "li.monthly_recurring_total",
+            ),
+        ],
+    },
+    RowJoin {
+        table: "app_users",
+        alias: "au",
+        local_column: "assigned_user_id",
+        fields: &[(
+            "assigned_user_name",
+            "COALESCE(NULLIF(btrim(au.full_name), ''), NULLIF(btrim(au.email), ''), au.id::text)",
+        )],
+    },
+];
+
+/// Read applications with listing/assignee context joined in SQL, then
+/// derive the qualification and SLA fields.
+async fn list_enriched_applications(
+    pool: &sqlx::PgPool,
+    filters: &Map<String, Value>,
+    limit: i64,
+) -> AppResult<Vec<Value>> {
+    let mut rows = list_rows_joined(
+        pool,
+        "application_submissions",
+        Some(filters),
+        APPLICATION_JOINS,
+        limit,
+        0,
+        "created_at",
+        false,
+    )
+    .await?;
+    let now = Utc::now().fixed_offset();
+    for row in &mut rows {
+        finish_joined_application(row, now);
+    }
+    Ok(rows)
+}
+
+/// Members of the application's organization only; others get a 404.
+async fn get_enriched_application(
+    pool: &sqlx::PgPool,
+    application_id: &str,
+    user_id: &str,
+) -> AppResult<Value> {
+    let mut row = get_row_joined(
+        pool,
+        "application_submissions",
+        application_id,
+        "id",
+        APPLICATION_JOINS,
+        Some(&MemberScope { user_id }),
+    )
+    .await?;
+    finish_joined_application(&mut row, Utc::now().fixed_offset());
+    Ok(row)
+}
+
+fn finish_joined_application(row: &mut Value, now: DateTime<FixedOffset>) {
+    let Some(obj) = row.as_object_mut() else {
+        return;
+    };
+    let monthly_total = number_from_value(obj.get("listing_monthly_recurring_total")).max(0.0);
+    obj.remove("listing_monthly_recurring_total");
+    obj.entry("listing_title").or_insert(Value::Null);
+    if has_non_empty_string(obj.get("assigned_user_id")) {
+        obj.entry("assigned_user_name").or_insert(Value::Null);
+    }
+    apply_application_scores(obj, monthly_total, now);
+}
+
+/// Derive qualification and response-SLA fields for one application row.
+fn apply_application_scores(
+    obj: &mut Map<String, Value>,
+    monthly_total: f64,
+    now: DateTime<FixedOffset>,
+) {
+    let (score, band, income_ratio) = qualification_from_row(obj, monthly_total);
+    obj.insert("qualification_score".to_string(), json!(score));
+    obj.insert("qualification_band".to_string(), Value::String(band));
+    obj.insert(
+        "income_to_rent_ratio".to_string(),
+        income_ratio
+            .map(|value| json!(value))
+            .unwrap_or(Value::Null),
+    );
 
-            let sla_due_at = created_at + Duration::minutes(RESPONSE_SLA_MINUTES);
+    let Some(created_at) = parse_iso_datetime(obj.get("created_at")) else {
+        return;
+    };
+
+    let sla_due_at = created_at + Duration::minutes(RESPONSE_SLA_MINUTES);
+    obj.insert(
+        "response_sla_due_at".to_string(),
+        Value::String(sla_due_at.to_rfc3339()),
+    );
+
+    if let Some(first_response_at) = parse_iso_datetime(obj.get("first_response_at")) {
+        let elapsed_seconds = (first_response_at - created_at).num_milliseconds() as f64 / 1000.0;
+        let elapsed_minutes = round2((elapsed_seconds.max(0.0)) / 60.0);
+        obj.insert("first_response_minutes".to_string(), json!(elapsed_minutes));
+        if first_response_at <= sla_due_at {
+            obj.insert(
+                "response_sla_status".to_string(),
+                Value::String("met".to_string()),
+            );
+            obj.insert(
+                "response_sla_alert_level".to_string(),
+                Value::String("none".to_string()),
+            );
+        } else {
+            obj.insert(
+                "response_sla_status".to_string(),
+                Value::String("breached".to_string()),
+            );
             obj.insert(
-                "response_sla_due_at".to_string(),
+                "response_sla_breached_at".to_string(),
                 Value::String(sla_due_at.to_rfc3339()),
             );
-
-            if let Some(first_response_at) = parse_iso_datetime(obj.get("first_response_at")) {
-                let elapsed_seconds =
-                    (first_response_at - created_at).num_milliseconds() as f64 / 1000.0;
-                let elapsed_minutes = round2((elapsed_seconds.max(0.0)) / 60.0);
-                obj.insert("first_response_minutes".to_string(), json!(elapsed_minutes));
-                if first_response_at <= sla_due_at {
-                    obj.insert(
-                        "response_sla_status".to_string(),
-                        Value::String("met".to_string()),
-                    );
-                    obj.insert(
-                        "response_sla_alert_level".to_string(),
-                        Value::String("none".to_string()),
-                    );
-                } else {
-                    obj.insert(
-                        "response_sla_status".to_string(),
-                        Value::String("breached".to_string()),
-                    );
-                    obj.insert(
-                        "response_sla_breached_at".to_string(),
-                        Value::String(sla_due_at.to_rfc3339()),
-                    );
-                    obj.insert(
-                        "response_sla_alert_level".to_string(),
-                        Value::String("critical".to_string()),
-                    );
-                }
-                enriched.push(row);
-                continue;
-            }
-
-            let remaining = (sla_due_at - now).num_milliseconds() as f64 / 60000.0;
-            if remaining <= 0.0 {
-                obj.insert(
-                    "response_sla_status".to_string(),
-                    Value::String("breached".to_string()),
-                );
-                obj.insert(
-                    "response_sla_breached_at".to_string(),
-                    Value::String(sla_due_at.to_rfc3339()),
-                );
-                obj.insert("response_sla_remaining_minutes".to_string(), json!(0));
-                obj.insert(
-                    "response_sla_alert_level".to_string(),
-                    Value::String("critical".to_string()),
-                );
-            } else if remaining <= RESPONSE_SLA_WARNING_MINUTES {
-                obj.insert(
-                    "response_sla_status".to_string(),
-                    Value::String("pending".to_string()),
-                );
-                obj.insert(
-                    "response_sla_remaining_minutes".to_string(),
-                    json!(round2(remaining)),
-                );
-                obj.insert(
-                    "response_sla_alert_level".to_string(),
-                    Value::String("warning".to_string()),
-                );
-            } else {
-                obj.insert(
-                    "response_sla_status".to_string(),
-                    Value::String("pending".to_string()),
-                );
-                obj.insert(
-                    "response_sla_remaining_minutes".to_string(),
-                    json!(round2(remaining)),
-                );
-                obj.insert(
-                    "response_sla_alert_level".to_string(),
-                    Value::String("normal".to_string()),
-                );
-            }
+            obj.insert(
+                "response_sla_alert_level".to_string(),
+                Value::String("critical".to_string()),
+            );
         }
-        enriched.push(row);
+        return;
     }
 
-    Ok(enriched)
+    let remaining = (sla_due_at - now).num_milliseconds() as f64 / 60000.0;
+    if remaining <= 0.0 {
+        obj.insert(
+            "response_sla_status".to_string(),
+            Value::String("breached".to_string()),
+        );
+        obj.insert(
+            "response_sla_breached_at".to_string(),
+            Value::String(sla_due_at.to_rfc3339()),
+        );
+        obj.insert("response_sla_remaining_minutes".to_string(), json!(0));
+        obj.insert(
+            "response_sla_alert_level".to_string(),
+            Value::String("critical".to_string()),
+        );
+    } else if remaining <= RESPONSE_SLA_WARNING_MINUTES {
+        obj.insert(
+            "response_sla_status".to_string(),
+            Value::String("pending".to_string()),
+        );
+        obj.insert(
+            "response_sla_remaining_minutes".to_string(),
+            json!(round2(remaining)),
+        );
+        obj.insert(
+            "response_sla_alert_level".to_string(),
+            Value::String("warning".to_string()),
+        );
+    } else {
+        obj.insert(
+            "response_sla_status".to_string(),
+            Value::String("pending".to_string()),
+        );
+        obj.insert(
+            "response_sla_remaining_minutes".to_string(),
+            json!(round2(remaining)),
+        );
+        obj.insert(
+            "response_sla_alert_level".to_string(),
+            Value::String("normal".to_string()),
+        );
+    }
 }
 
 async fn load_application_link_context(
@@ -1673,6 +1739,7 @@ fn application_matches_view(
     row: &Value,
     view: Option<&str>,
     related_leases: &std::collections::HashMap<String, RelatedLeaseInfo>,
+    now: DateTime<FixedOffset>,
 ) -> bool {
     match view.map(str::trim).filter(|value| !value.is_empty()) {
         None | Some("all") => true,
@@ -1685,7 +1752,7 @@ fn application_matches_view(
             can_convert_to_lease(row, related_leases.get(&value_str(row, "id")))
         }
         Some("stalled_or_failed") => {
-            is_stalled_application(row)
+            is_stalled_application(row, now)
                 || matches!(value_str(row, "status").as_str(), "rejected" | "lost")
         }
         Some(_) => true,
@@ -1695,6 +1762,7 @@ fn application_matches_view(
 fn build_saved_view_counts(
     rows: &[Value],
     related_leases: &std::collections::HashMap<String, RelatedLeaseInfo>,
+    now: DateTime<FixedOffset>,
 ) -> Vec<Value> {
     [
         "all",
@@ -1709,7 +1777,7 @@ fn build_saved_view_counts(
             rows.len()
         } else {
             rows.iter()
-                .filter(|row| application_matches_view(row, Some(view), related_leases))
+                .filter(|row| application_matches_view(row, Some(view), related_leases, now))
                 .count()
         };
         json!({
@@ -1723,12 +1791,13 @@ fn build_saved_view_counts(
 fn build_applications_summary(
     rows: &[Value],
     related_leases: &std::collections::HashMap<String, RelatedLeaseInfo>,
+    now: DateTime<FixedOffset>,
 ) -> Value {
     json!({
         "totalApplications": rows.len(),
         "needsResponse": rows
             .iter()
-            .filter(|row| application_matches_view(row, Some("needs_response"), related_leases))
+            .filter(|row| application_matches_view(row, Some("needs_response"), related_leases, now))
             .count(),
         "unassigned": rows
             .iter()
@@ -1736,11 +1805,11 @@ fn build_applications_summary(
             .count(),
         "qualifiedReady": rows
             .iter()
-            .filter(|row| application_matches_view(row, Some("qualified_ready"), related_leases))
+            .filter(|row| application_matches_view(row, Some("qualified_ready"), related_leases, now))
             .count(),
         "stalledOrFailed": rows
             .iter()
-            .filter(|row| application_matches_view(row, Some("stalled_or_failed"), related_leases))
+            .filter(|row| application_matches_view(row, Some("stalled_or_failed"), related_leases, now))
             .count(),
     })
 }
@@ -2051,6 +2120,7 @@ fn sort_application_overview_rows(
     sort: Option<&str>,
     last_touch_index: &std::collections::HashMap<String, String>,
     related_leases: &std::collections::HashMap<String, RelatedLeaseInfo>,
+    now: DateTime<FixedOffset>,
 ) {
     let sort_key = sort.unwrap_or("last_touch_desc");
     rows.sort_by(|left, right| {
@@ -2084,12 +2154,18 @@ fn sort_application_overview_rows(
                             .unwrap_or_else(|| value_str(left, "updated_at")),
                     )
                     .then_with(|| {
-                        application_matches_view(right, Some("qualified_ready"), related_leases)
-                            .cmp(&application_matches_view(
-                                left,
-                                Some("qualified_ready"),
-                                related_leases,
-                            ))
+                        application_matches_view(
+                            right,
+                            Some("qualified_ready"),
+                            related_leases,
+                            now,
+                        )
+                        .cmp(&application_matches_view(
+                            left,
+                            Some("qualified_ready"),
+                            related_leases,
+                            now,
+                        ))
                     })
             }
         };
@@ -2137,7 +2213,7 @@ fn can_convert_to_lease(row: &Value, related_lease: Option<&RelatedLeaseInfo>) -
     )
 }
 
-fn is_stalled_application(row: &Value) -> bool {
+fn is_stalled_application(row: &Value, now: DateTime<FixedOffset>) -> bool {
     if has_non_empty_string(row.as_object().and_then(|obj| obj.get("first_response_at"))) {
         return false;
     }
@@ -2145,7 +2221,7 @@ fn is_stalled_application(row: &Value) -> bool {
         return false;
     }
     parse_iso_datetime(row.as_object().and_then(|obj| obj.get("created_at")))
-        .map(|created_at| Utc::now().fixed_offset() - created_at >= Duration::hours(48))
+        .map(|created_at| now - created_at >= Duration::hours(48))
         .unwrap_or(false)
 }
 
@@ -2347,17 +2423,14 @@ fn json_map(entries: &[(&str, Value)]) -> Map<String, Value> {
     map
 }
 
+/// RFC 3339 parsing accepts both `Z` and `+00:00`, so the borrowed string is
+/// parsed in place without copying it first.
 fn parse_iso_datetime(value: Option<&Value>) -> Option<DateTime<FixedOffset>> {
-    let mut text = value
+    let text = value
         .and_then(Value::as_str)
         .map(str::trim)
-        .filter(|item| !item.is_empty())
-        .map(ToOwned::to_owned)?;
-    if text.ends_with('Z') {
-        text.truncate(text.len().saturating_sub(1));
-        text.push_str("+00:00");
-    }
-    DateTime::parse_from_rfc3339(&text).ok()
+        .filter(|item| !item.is_empty())?;
+    DateTime::parse_from_rfc3339(text).ok()
 }
 
 fn number_from_value(value: Option<&Value>) -> f64 {
@@ -15,7 +15,7 @@ use crate::{
         clamp_limit_in_range, remove_nulls, serialize_to_map, BlockPath, CalendarAvailabilityQuery,
         CalendarBlocksQuery, CreateCalendarBlockInput, UpdateCalendarBlockInput,
     },
-    services::{audit::write_audit_log, enrichment::enrich_calendar_blocks},
+    services::{audit_queue::enqueue_audit_log, enrichment::enrich_calendar_blocks},
     state::AppState,
     tenancy::{assert_org_member, assert_org_role},
 };
@@ -245,7 +245,7 @@ async fn create_calendar_block(
     let created = create_row(pool, "calendar_blocks", &record).await?;
     let entity_id = value_str(&created, "id");
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -324,7 +324,7 @@ async fn update_calendar_block(
 
     let updated = update_row(pool, "calendar_blocks", &path.block_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -356,7 +356,7 @@ async fn delete_calendar_block(
 
     let deleted = delete_row(pool, "calendar_blocks", &path.block_id, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
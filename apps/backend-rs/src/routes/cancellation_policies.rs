@@ -14,7 +14,7 @@ use crate::{
         clamp_limit_in_range, remove_nulls, serialize_to_map, CancellationPoliciesQuery,
         CancellationPolicyPath, CreateCancellationPolicyInput, UpdateCancellationPolicyInput,
     },
-    services::audit::write_audit_log,
+    services::audit_queue::enqueue_audit_log,
     state::AppState,
     tenancy::{assert_org_member, assert_org_role},
 };
@@ -79,7 +79,7 @@ async fn create_cancellation_policy(
     let created = create_row(pool, "cancellation_policies", &record).await?;
     let entity_id = value_str(&created, "id");
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -129,7 +129,7 @@ async fn update_cancellation_policy(
 
     let updated = update_row(pool, "cancellation_policies", &path.policy_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -10,18 +10,39 @@ use serde_json::{json, Map, Value};
 use crate::{
     auth::require_user_id,
     error::{AppError, AppResult},
-    repository::table_service::{create_row, get_row, list_rows, update_row},
+    repository::table_service::{
+        create_row, get_row, get_row_for_member, get_row_joined, list_rows, list_rows_joined,
+        update_row_with_linked, LinkedUpdate, MemberScope, RowJoin,
+    },
     schemas::{
         clamp_limit_in_range, remove_nulls, serialize_to_map, CollectionPath, CollectionsQuery,
         CreateCollectionInput, MarkCollectionPaidInput,
     },
-    services::{analytics::write_analytics_event, audit::write_audit_log, workflows::fire_trigger},
+    services::{
+        audit_queue::{enqueue_analytics_event, enqueue_audit_log},
+        lease_status_refresh::schedule_lease_status_refresh,
+        workflows::fire_trigger,
+    },
     state::AppState,
     tenancy::{assert_org_member, assert_org_role},
 };
 
 const COLLECTION_EDIT_ROLES: &[&str] = &["owner_admin", "operator", "accountant"];
 
+/// Lease fields surfaced on every collection record.
+const LEASE_FIELDS: &[&str] = &["tenant_full_name", "lease_status", "property_id", "unit_id"];
+const LEASE_JOIN: &[RowJoin] = &[RowJoin {
+    table: "leases",
+    alias: "l",
+    local_column: "lease_id",
+    fields: &[
+        ("tenant_full_name", "l.tenant_full_name"),
+        ("lease_status", "l.lease_status"),
+        ("property_id", "l.property_id"),
+        ("unit_id", "l.unit_id"),
+    ],
+}];
+
 pub fn router() -> axum::Router<AppState> {
     axum::Router::new()
         .route(
@@ -60,11 +81,18 @@ async fn list_collections(
     if let Some(lease_id) = non_empty_opt(query.lease_id.as_deref()) {
         filters.insert("lease_id".to_string(), Value::String(lease_id));
     }
+    if let Some(due_from) = non_empty_opt(query.due_from.as_deref()) {
+        filters.insert("due_date__gte".to_string(), Value::String(due_from));
+    }
+    if let Some(due_to) = non_empty_opt(query.due_to.as_deref()) {
+        filters.insert("due_date__lte".to_string(), Value::String(due_to));
+    }
 
-    let mut rows = list_rows(
+    let rows = list_rows_joined(
         pool,
         "collection_records",
         Some(&filters),
+        LEASE_JOIN,
         clamp_limit_in_range(query.limit, 1, 1000),
         0,
         "created_at",
@@ -72,25 +100,7 @@ async fn list_collections(
     )
     .await?;
 
-    if let Some(due_from) = non_empty_opt(query.due_from.as_deref()) {
-        rows.retain(|row| {
-            row.as_object()
-                .and_then(|obj| obj.get("due_date"))
-                .and_then(Value::as_str)
-                .is_some_and(|due_date| due_date >= due_from.as_str())
-        });
-    }
-    if let Some(due_to) = non_empty_opt(query.due_to.as_deref()) {
-        rows.retain(|row| {
-            row.as_object()
-                .and_then(|obj| obj.get("due_date"))
-                .and_then(Value::as_str)
-                .is_some_and(|due_date| due_date <= due_to.as_str())
-        });
-    }
-
-    let enriched = enrich_collection_rows(pool, rows).await?;
-    Ok(Json(json!({ "data": enriched })))
+    Ok(Json(json!({ "data": rows })))
 }
 
 async fn create_collection(
@@ -126,7 +136,7 @@ async fn create_collection(
     let created = create_row(pool, "collection_records", &record).await?;
     let entity_id = value_str(&created, "id");
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -138,7 +148,7 @@ async fn create_collection(
     )
     .await;
 
-    refresh_lease_status(pool, &payload.lease_id).await?;
+    schedule_lease_status_refresh(pool, &payload.lease_id).await?;
 
     let mut enriched = enrich_collection_rows(pool, vec![created]).await?;
     Ok((
@@ -157,14 +167,17 @@ async fn get_collection(
     let user_id = require_user_id(&state, &headers).await?;
     let pool = db_pool(&state)?;
 
-    let record = get_row(pool, "collection_records", &path.collection_id, "id").await?;
-    let org_id = value_str(&record, "organization_id");
-    assert_org_member(&state, &user_id, &org_id).await?;
+    let record = get_row_joined(
+        pool,
+        "collection_records",
+        &path.collection_id,
+        "id",
+        LEASE_JOIN,
+        Some(&MemberScope { user_id: &user_id }),
+    )
+    .await?;
 
-    let mut enriched = enrich_collection_rows(pool, vec![record]).await?;
-    Ok(Json(
-        enriched.pop().unwrap_or_else(|| Value::Object(Map::new())),
-    ))
+    Ok(Json(record))
 }
 
 async fn mark_collection_paid(
@@ -178,7 +191,14 @@ async fn mark_collection_paid(
     let user_id = require_user_id(&state, &headers).await?;
     let pool = db_pool(&state)?;
 
-    let record = get_row(pool, "collection_records", &path.collection_id, "id").await?;
+    let record = get_row_for_member(
+        pool,
+        "collection_records",
+        &path.collection_id,
+        "id",
+        &MemberScope { user_id: &user_id },
+    )
+    .await?;
     let org_id = value_str(&record, "organization_id");
     assert_org_role(&state, &user_id, &org_id, COLLECTION_EDIT_ROLES).await?;
 
@@ -203,33 +223,27 @@ async fn mark_collection_paid(
         patch.insert("notes".to_string(), Value::String(notes));
     }
 
-    let updated = update_row(
+    // Mark the linked lease charge paid in the same statement.
+    let mut updated = update_row_with_linked(
         pool,
         "collection_records",
         &path.collection_id,
         &patch,
         "id",
+        &LinkedUpdate {
+            table: "lease_charges",
+            link_column: "lease_charge_id",
+            payload: &json_map(&[("status", Value::String("paid".to_string()))]),
+        },
     )
     .await?;
 
-    if let Some(lease_charge_id) = updated
-        .as_object()
-        .and_then(|obj| obj.get("lease_charge_id"))
-        .and_then(Value::as_str)
-        .map(str::trim)
-        .filter(|value| !value.is_empty())
-    {
-        let mut lease_patch = Map::new();
-        lease_patch.insert("status".to_string(), Value::String("paid".to_string()));
-        let _ = update_row(pool, "lease_charges", lease_charge_id, &lease_patch, "id").await;
-    }
-
     let lease_id = value_str(&updated, "lease_id");
     if !lease_id.is_empty() {
-        refresh_lease_status(pool, &lease_id).await?;
+        schedule_lease_status_refresh(pool, &lease_id).await?;
     }
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -271,7 +285,7 @@ async fn mark_collection_paid(
             .unwrap_or(Value::Null),
     );
 
-    write_analytics_event(
+    enqueue_analytics_event(
         state.db_pool.as_ref(),
         Some(&org_id),
         "collection_paid",
@@ -326,6 +340,7 @@ async fn mark_collection_paid(
             .unwrap_or(Value::Null),
     );
 
+    let mut lease_row: Option<Value> = None;
     if let Some(lease_id) = updated
         .as_object()
         .and_then(|obj| obj.get("lease_id"))
@@ -348,6 +363,7 @@ async fn mark_collection_paid(
             {
                 workflow_context.insert("tenant_full_name".to_string(), name);
             }
+            lease_row = Some(lease);
         }
     }
 
@@ -360,60 +376,12 @@ async fn mark_collection_paid(
     )
     .await;
 
-    let mut enriched = enrich_collection_rows(pool, vec![updated]).await?;
-    Ok(Json(
-        enriched.pop().unwrap_or_else(|| Value::Object(Map::new())),
-    ))
-}
-
-async fn refresh_lease_status(pool: &sqlx::PgPool, lease_id: &str) -> AppResult<()> {
-    let lease = get_row(pool, "leases", lease_id, "id").await?;
-    let status = value_str(&lease, "lease_status");
-    if status != "active" && status != "delinquent" {
-        return Ok(());
+    // The lease was already loaded for the workflow context, so decorate from
+    // it instead of fetching it again.
+    if let Some(lease) = lease_row.as_ref() {
+        apply_lease_fields(&mut updated, lease);
     }
-
-    let today_iso = Utc::now().date_naive().to_string();
-    let unpaid = list_rows(
-        pool,
-        "collection_records",
-        Some(&json_map(&[
-            ("lease_id", Value::String(lease_id.to_string())),
-            (
-                "status",
-                Value::Array(
-                    ["scheduled", "pending", "late"]
-                        .iter()
-                        .map(|value| Value::String((*value).to_string()))
-                        .collect(),
-                ),
-            ),
-        ])),
-        500,
-        0,
-        "created_at",
-        false,
-    )
-    .await?;
-
-    let has_overdue = unpaid.iter().any(|row| {
-        row.as_object()
-            .and_then(|obj| obj.get("due_date"))
-            .and_then(Value::as_str)
-            .is_some_and(|due_date| !due_date.is_empty() && due_date < today_iso.as_str())
-    });
-
-    let next_status = if has_overdue { "delinquent" } else { "active" };
-    if next_status != status {
-        let mut patch = Map::new();
-        patch.insert(
-            "lease_status".to_string(),
-            Value::String(next_status.to_string()),
-        );
-        update_row(pool, "leases", lease_id, &patch, "id").await?;
-    }
-
-    Ok(())
+    Ok(Json(updated))
 }
 
 async fn enrich_collection_rows(pool: &sqlx::PgPool, rows: Vec<Value>) -> AppResult<Vec<Value>> {
@@ -464,35 +432,15 @@ async fn enrich_collection_rows(pool: &sqlx::PgPool, rows: Vec<Value>) -> AppRes
 
     let mut enriched = Vec::with_capacity(rows.len());
     for mut row in rows {
-        if let Some(row_obj) = row.as_object_mut() {
-            if let Some(lease_id) = row_obj
-                .get("lease_id")
-                .and_then(Value::as_str)
-                .map(str::trim)
-                .filter(|value| !value.is_empty())
-            {
-                if let Some(lease) = lease_index.get(lease_id).and_then(Value::as_object) {
-                    row_obj.insert(
-                        "tenant_full_name".to_string(),
-                        lease
-                            .get("tenant_full_name")
-                            .cloned()
-                            .unwrap_or(Value::Null),
-                    );
-                    row_obj.insert(
-                        "lease_status".to_string(),
-                        lease.get("lease_status").cloned().unwrap_or(Value::Null),
-                    );
-                    row_obj.insert(
-                        "property_id".to_string(),
-                        lease.get("property_id").cloned().unwrap_or(Value::Null),
-                    );
-                    row_obj.insert(
-                        "unit_id".to_string(),
-                        lease.get("unit_id").cloned().unwrap_or(Value::Null),
-                    );
-                }
-            }
+        let lease = row
+            .as_object()
+            .and_then(|obj| obj.get("lease_id"))
+            .and_then(Value::as_str)
+            .map(str::trim)
+            .filter(|value| !value.is_empty())
+            .and_then(|lease_id| lease_index.get(lease_id));
+        if let Some(lease) = lease {
+            apply_lease_fields(&mut row, lease);
         }
         enriched.push(row);
     }
@@ -500,6 +448,18 @@ async fn enrich_collection_rows(pool: &sqlx::PgPool, rows: Vec<Value>) -> AppRes
     Ok(enriched)
 }
 
+fn apply_lease_fields(row: &mut Value, lease: &Value) {
+    let (Some(row_obj), Some(lease)) = (row.as_object_mut(), lease.as_object()) else {
+        return;
+    };
+    for key in LEASE_FIELDS {
+        row_obj.insert(
+            (*key).to_string(),
+            lease.get(*key).cloned().unwrap_or(Value::Null),
+        );
+    }
+}
+
 fn ensure_lease_collections_enabled(state: &AppState) -> AppResult<()> {
     if state.config.lease_collections_enabled {
         return Ok(());
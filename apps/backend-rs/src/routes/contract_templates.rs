@@ -14,7 +14,7 @@ use crate::{
         clamp_limit, remove_nulls, serialize_to_map, ContractTemplatePath, ContractTemplatesQuery,
         CreateContractTemplateInput, RenderContractInput, UpdateContractTemplateInput,
     },
-    services::audit::write_audit_log,
+    services::audit_queue::enqueue_audit_log,
     state::AppState,
     tenancy::{assert_org_member, assert_org_role},
 };
@@ -101,7 +101,7 @@ async fn create_template(
 
     let created = create_row(pool, "contract_templates", &record).await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         Some(pool),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -168,7 +168,7 @@ async fn update_template(
 
     let updated = update_row(pool, "contract_templates", &path.template_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         Some(pool),
         Some(&org_id),
         Some(&user_id),
@@ -202,7 +202,7 @@ async fn delete_template(
 
     delete_row(pool, "contract_templates", &path.template_id, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         Some(pool),
         Some(&org_id),
         Some(&user_id),
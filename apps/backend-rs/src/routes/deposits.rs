@@ -11,7 +11,7 @@ use crate::{
     auth::require_user_id,
     error::{AppError, AppResult},
     repository::table_service::{create_row, get_row, update_row},
-    services::audit::write_audit_log,
+    services::audit_queue::enqueue_audit_log,
     state::AppState,
     tenancy::assert_org_role,
 };
@@ -143,7 +143,7 @@ async fn collect_deposit(
     )
     .await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -206,7 +206,7 @@ async fn hold_deposit(
     )
     .await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -269,7 +269,7 @@ async fn release_deposit(
     )
     .await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -332,7 +332,7 @@ async fn forfeit_deposit(
     )
     .await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -13,7 +13,7 @@ use crate::{
     error::{AppError, AppResult},
     repository::table_service::{create_row, delete_row, get_row, list_rows},
     schemas::clamp_limit_in_range,
-    services::{audit::write_audit_log, embeddings},
+    services::{audit_queue::enqueue_audit_log, embeddings},
     state::AppState,
     tenancy::{assert_org_member, assert_org_role},
 };
@@ -185,7 +185,7 @@ async fn create_document(
     let created = create_row(pool, "documents", &record).await?;
     let entity_id = val_str(&created, "id");
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -214,7 +214,7 @@ async fn delete_document(
 
     delete_row(pool, "documents", &path.document_id, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -315,7 +315,7 @@ async fn process_document(
     .await
     .map_err(AppError::ServiceUnavailable)?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -514,7 +514,7 @@ async fn create_knowledge_document(
         .await;
     }
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -544,7 +544,7 @@ async fn delete_knowledge_document(
     // Chunks cascade-delete via FK
     delete_row(pool, "knowledge_documents", &path.document_id, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -828,7 +828,7 @@ async fn seed_knowledge_documents(
         seeded += 1;
     }
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -939,7 +939,7 @@ async fn upload_knowledge_document(
     .await
     .map_err(AppError::ServiceUnavailable)?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
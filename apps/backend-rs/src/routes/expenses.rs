@@ -1,7 +1,7 @@
 use axum::{
     extract::{Path, Query, State},
     http::HeaderMap,
-    response::IntoResponse,
+    response::{IntoResponse, Response},
     Json,
 };
 use serde_json::{json, Map, Value};
@@ -10,16 +10,39 @@ use sqlx::{Postgres, QueryBuilder, Row};
 use crate::{
     auth::require_user_id,
     error::{AppError, AppResult},
-    repository::table_service::{create_row, delete_row, get_row, update_row},
+    repository::table_service::{
+        create_row, delete_row, get_row, get_row_joined, org_tables_version, update_row, RowJoin,
+    },
     schemas::{
         clamp_limit_in_range, remove_nulls, serialize_to_map, CreateExpenseInput,
-        ExpenseApprovalInput, ExpensePath, ExpensesQuery, UpdateExpenseInput,
+        ExpenseApprovalInput, ExpensePath, ExpensesQuery, UpdateExpenseInput, WriteResponseQuery,
+    },
+    services::{
+        audit_queue::enqueue_audit_log,
+        enrichment::enrich_expenses,
+        fx::get_cached_usd_to_pyg_rate,
+        list_etag::{etag_matches, json_with_etag, list_etag, not_modified},
     },
-    services::{audit::write_audit_log, enrichment::enrich_expenses, fx::get_usd_to_pyg_rate},
     state::AppState,
     tenancy::{assert_org_member, assert_org_role},
 };
 
+/// The reservation's unit, for validating that an expense's reservation and
+/// its unit both belong to the expense's organization.
+const RESERVATION_UNIT_JOIN: &[RowJoin] = &[RowJoin {
+    table: "units",
+    alias: "u",
+    local_column: "unit_id",
+    fields: &[
+        ("unit_organization_id", "u.organization_id"),
+        ("unit_property_id", "u.property_id"),
+    ],
+}];
+
+/// Tables whose changes can alter a `GET /expenses` page.
+/// Each one needs a `bump_org_table_version` trigger.
+const EXPENSE_LIST_TABLES: &[&str] = &["expenses", "properties", "units"];
+
 pub fn router() -> axum::Router<AppState> {
     axum::Router::new()
         .route(
@@ -46,18 +69,35 @@ async fn list_expenses(
     State(state): State<AppState>,
     Query(query): Query<ExpensesQuery>,
     headers: HeaderMap,
-) -> AppResult<Json<Value>> {
+) -> AppResult<Response> {
     let user_id = require_user_id(&state, &headers).await?;
     assert_org_member(&state, &user_id, &query.org_id).await?;
     let pool = db_pool(&state)?;
 
-    let rows = list_expense_rows(pool, &query).await?;
+    let version = org_tables_version(pool, &query.org_id, EXPENSE_LIST_TABLES).await?;
+    let query_key = serde_json::to_string(&query).unwrap_or_default();
+    let etag = list_etag(&[&query.org_id, &version, &query_key]);
+    if etag_matches(&headers, &etag) {
+        return Ok(not_modified(&etag));
+    }
+
+    let limit = clamp_limit_in_range(query.limit, 1, 2000);
+    let rows = list_expense_rows(pool, &query, limit).await?;
+    let next_cursor = if rows.len() as i64 == limit {
+        rows.last().map(expense_cursor)
+    } else {
+        None
+    };
     let enriched = enrich_expenses(&state, pool, rows, &query.org_id).await?;
-    Ok(Json(json!({ "data": enriched })))
+    Ok(json_with_etag(
+        json!({ "data": enriched, "next_cursor": next_cursor }),
+        &etag,
+    ))
 }
 
 async fn create_expense(
     State(state): State<AppState>,
+    Query(write): Query<WriteResponseQuery>,
     headers: HeaderMap,
     Json(payload): Json<CreateExpenseInput>,
 ) -> AppResult<impl IntoResponse> {
@@ -102,8 +142,7 @@ async fn create_expense(
 
     if currency == "USD" {
         if !record.contains_key("fx_rate_to_pyg") {
-            let fetched =
-                get_usd_to_pyg_rate(&state.http_client, payload.expense_date.trim()).await;
+            let fetched = get_cached_usd_to_pyg_rate(&state, &payload.expense_date).await;
             if let Some(rate) = fetched {
                 record.insert("fx_rate_to_pyg".to_string(), json!(rate));
             } else {
@@ -144,7 +183,7 @@ async fn create_expense(
     let created = create_row(pool, "expenses", &record).await?;
     let entity_id = value_str(&created, "id");
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -156,6 +195,9 @@ async fn create_expense(
     )
     .await;
 
+    if !write.enrich {
+        return Ok((axum::http::StatusCode::CREATED, Json(created)));
+    }
     let mut enriched =
         enrich_expenses(&state, pool, vec![created], &payload.organization_id).await?;
     Ok((
@@ -185,6 +227,7 @@ async fn get_expense(
 async fn update_expense(
     State(state): State<AppState>,
     Path(path): Path<ExpensePath>,
+    Query(write): Query<WriteResponseQuery>,
     headers: HeaderMap,
     Json(payload): Json<UpdateExpenseInput>,
 ) -> AppResult<Json<Value>> {
@@ -239,7 +282,7 @@ async fn update_expense(
 
     if effective_currency == "USD" {
         if !patch.contains_key("fx_rate_to_pyg") && record.get("fx_rate_to_pyg").is_none() {
-            let fetched = get_usd_to_pyg_rate(&state.http_client, effective_date.trim()).await;
+            let fetched = get_cached_usd_to_pyg_rate(&state, &effective_date).await;
             if let Some(rate) = fetched {
                 patch.insert("fx_rate_to_pyg".to_string(), json!(rate));
             } else {
@@ -254,7 +297,7 @@ async fn update_expense(
 
     let updated = update_row(pool, "expenses", &path.expense_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -266,6 +309,9 @@ async fn update_expense(
     )
     .await;
 
+    if !write.enrich {
+        return Ok(Json(updated));
+    }
     let mut enriched = enrich_expenses(&state, pool, vec![updated], &org_id).await?;
     Ok(Json(
         enriched.pop().unwrap_or_else(|| Value::Object(Map::new())),
@@ -286,7 +332,7 @@ async fn delete_expense(
 
     let deleted = delete_row(pool, "expenses", &path.expense_id, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -327,7 +373,7 @@ async fn approve_expense(
 
     let updated = update_row(pool, "expenses", &path.expense_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -371,7 +417,7 @@ async fn reject_expense(
 
     let updated = update_row(pool, "expenses", &path.expense_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -389,7 +435,11 @@ async fn reject_expense(
     ))
 }
 
-async fn list_expense_rows(pool: &sqlx::PgPool, query: &ExpensesQuery) -> AppResult<Vec<Value>> {
+async fn list_expense_rows(
+    pool: &sqlx::PgPool,
+    query: &ExpensesQuery,
+    limit: i64,
+) -> AppResult<Vec<Value>> {
     let mut builder = QueryBuilder::<Postgres>::new(
         "SELECT row_to_json(t) AS row FROM expenses t WHERE organization_id = ",
     );
@@ -436,8 +486,19 @@ async fn list_expense_rows(pool: &sqlx::PgPool, query: &ExpensesQuery) -> AppRes
         builder.push_bind(approval_status);
     }
 
-    builder.push(" ORDER BY expense_date DESC LIMIT ");
-    builder.push_bind(clamp_limit_in_range(query.limit, 1, 2000));
+    // Keyset pagination: seek past the last row of the previous page instead
+    // of scanning and discarding it with OFFSET.
+    if let Some(cursor) = non_empty_opt(query.cursor.as_deref()) {
+        let (cursor_date, cursor_id) = parse_expense_cursor(&cursor)?;
+        builder.push(" AND (expense_date, id) < (");
+        builder.push_bind(cursor_date);
+        builder.push("::date, ");
+        builder.push_bind(cursor_id);
+        builder.push("::uuid)");
+    }
+
+    builder.push(" ORDER BY expense_date DESC, id DESC LIMIT ");
+    builder.push_bind(limit);
 
     let rows = builder.build().fetch_all(pool).await.map_err(|error| {
         tracing::error!(error = %error, "Database query failed");
@@ -456,7 +517,15 @@ async fn attach_reservation_unit_property(
     reservation_id: &str,
     target: &mut Map<String, Value>,
 ) -> AppResult<()> {
-    let reservation = get_row(pool, "reservations", reservation_id, "id").await?;
+    let reservation = get_row_joined(
+        pool,
+        "reservations",
+        reservation_id,
+        "id",
+        RESERVATION_UNIT_JOIN,
+        None,
+    )
+    .await?;
     if value_str(&reservation, "organization_id") != org_id {
         return Err(AppError::BadRequest(
             "reservation_id does not belong to this organization.".to_string(),
@@ -469,16 +538,19 @@ async fn attach_reservation_unit_property(
             "reservation_id is missing unit_id.".to_string(),
         ));
     }
-    target.insert("unit_id".to_string(), Value::String(unit_id.clone()));
+    target.insert("unit_id".to_string(), Value::String(unit_id));
 
-    let unit = get_row(pool, "units", &unit_id, "id").await?;
-    if value_str(&unit, "organization_id") != org_id {
+    let Some(unit_org_id) = string_from_value(reservation.get("unit_organization_id")) else {
+        return Err(AppError::NotFound("units record not found.".to_string()));
+    };
+    if unit_org_id != org_id {
         return Err(AppError::BadRequest(
             "reservation unit does not belong to this organization.".to_string(),
         ));
     }
 
-    if let Some(property_id) = string_from_value(unit.get("property_id")).filter(|v| !v.is_empty())
+    if let Some(property_id) =
+        string_from_value(reservation.get("unit_property_id")).filter(|v| !v.is_empty())
     {
         target.insert("property_id".to_string(), Value::String(property_id));
     }
@@ -513,9 +585,52 @@ fn string_from_value(value: Option<&Value>) -> Option<String> {
         .map(ToOwned::to_owned)
 }
 
+fn expense_cursor(row: &Value) -> String {
+    format!(
+        "{}|{}",
+        value_str(row, "expense_date"),
+        value_str(row, "id")
+    )
+}
+
+fn parse_expense_cursor(cursor: &str) -> AppResult<(String, String)> {
+    let invalid = || AppError::BadRequest("Invalid expenses cursor.".to_string());
+    let (date, id) = cursor.split_once('|').ok_or_else(invalid)?;
+    let date = chrono::NaiveDate::parse_from_str(date.trim(), "%Y-%m-%d").map_err(|_| invalid())?;
+    let id = uuid::Uuid::parse_str(id.trim()).map_err(|_| invalid())?;
+    Ok((date.to_string(), id.to_string()))
+}
+
 fn non_empty_opt(value: Option<&str>) -> Option<String> {
     value
         .map(str::trim)
         .filter(|item| !item.is_empty())
         .map(ToOwned::to_owned)
 }
+
+#[cfg(test)]
+mod tests {
+    use serde_json::json;
+
+    use super::{expense_cursor, parse_expense_cursor};
+
+    #[test]
+    fn expense_cursor_round_trips() {
+        let row = json!({
+            "id": "7d9a4c58-2a0e-4f3e-9d4a-0c1b2e3f4a5b",
+            "expense_date": "2026-02-14",
+        });
+        let cursor = expense_cursor(&row);
+        assert_eq!(cursor, "2026-02-14|7d9a4c58-2a0e-4f3e-9d4a-0c1b2e3f4a5b");
+        let (date, id) = parse_expense_cursor(&cursor).expect("valid cursor");
+        assert_eq!(date, "2026-02-14");
+        assert_eq!(id, "7d9a4c58-2a0e-4f3e-9d4a-0c1b2e3f4a5b");
+    }
+
+    #[test]
+    fn parse_expense_cursor_rejects_malformed_values() {
+        assert!(parse_expense_cursor("2026-02-14").is_err());
+        assert!(parse_expense_cursor("not-a-date|7d9a4c58-2a0e-4f3e-9d4a-0c1b2e3f4a5b").is_err());
+        assert!(parse_expense_cursor("2026-02-14|'; DROP TABLE expenses; --").is_err());
+    }
+}
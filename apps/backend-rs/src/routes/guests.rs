@@ -14,7 +14,7 @@ use crate::{
         clamp_limit, remove_nulls, serialize_to_map, validate_input, CreateGuestInput, GuestPath,
         GuestsQuery, UpdateBackgroundCheckInput, UpdateGuestInput,
     },
-    services::audit::write_audit_log,
+    services::audit_queue::enqueue_audit_log,
     state::AppState,
     tenancy::{assert_org_member, assert_org_role},
 };
@@ -90,7 +90,7 @@ async fn create_guest(
     let record = remove_nulls(serialize_to_map(&payload));
     let created = create_row(pool, "guests", &record).await?;
     let entity_id = value_str(&created, "id");
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -130,7 +130,7 @@ async fn update_guest(
     assert_org_role(&state, &user_id, &org_id, &["owner_admin", "operator"]).await?;
     let patch = remove_nulls(serialize_to_map(&payload));
     let updated = update_row(pool, "guests", &path.guest_id, &patch, "id").await?;
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -155,7 +155,7 @@ async fn delete_guest(
     let org_id = value_str(&record, "organization_id");
     assert_org_role(&state, &user_id, &org_id, &["owner_admin", "operator"]).await?;
     let deleted = delete_row(pool, "guests", &path.guest_id, "id").await?;
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -197,7 +197,7 @@ async fn update_background_check(
     let patch = remove_nulls(serialize_to_map(&payload));
     let updated = update_row(pool, "guests", &path.guest_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -256,7 +256,7 @@ async fn submit_verification(
 
     let updated = update_row(pool, "guests", &path.guest_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -308,7 +308,7 @@ async fn review_verification(
 
     let updated = update_row(pool, "guests", &path.guest_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
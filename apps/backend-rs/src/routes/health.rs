@@ -28,9 +28,14 @@ pub async fn cache_stats(State(state): State<AppState>) -> Json<Value> {
         "enrichment": { "entries": state.enrichment_cache.entry_count() },
         "agent_config": { "entries": state.agent_config_cache.entry_count() },
         "fx": { "entries": state.fx_cache.entry_count() },
+        "auth_user": { "entries": state.auth_user_cache.entry_count() },
     }))
 }
 
+pub async fn audit_queue_stats() -> Json<Value> {
+    Json(crate::services::audit_queue::stats())
+}
+
 async fn readiness_response(state: &AppState) -> (StatusCode, Json<Value>) {
     let report = state.api_readiness_report().await;
     let status = if report.ready {
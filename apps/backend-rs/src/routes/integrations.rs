@@ -18,7 +18,7 @@ use crate::{
         IntegrationPath, IntegrationsQuery, UpdateIntegrationInput,
     },
     services::{
-        audit::write_audit_log, enrichment::enrich_integrations,
+        audit_queue::enqueue_audit_log, enrichment::enrich_integrations,
         ical::sync_listing_ical_reservations,
     },
     state::AppState,
@@ -120,7 +120,7 @@ async fn create_integration(
     let record = remove_nulls(serialize_to_map(&payload));
     let created = create_row(pool, "integrations", &record).await?;
     let entity_id = value_str(&created, "id");
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -162,7 +162,7 @@ async fn update_integration(
     assert_org_role(&state, &user_id, &org_id, &["owner_admin"]).await?;
     let patch = remove_nulls(serialize_to_map(&payload));
     let updated = update_row(pool, "integrations", &path.integration_id, &patch, "id").await?;
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -189,7 +189,7 @@ async fn delete_integration(
     let org_id = value_str(&record, "organization_id");
     assert_org_role(&state, &user_id, &org_id, &["owner_admin"]).await?;
     let deleted = delete_row(pool, "integrations", &path.integration_id, "id").await?;
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -229,7 +229,7 @@ async fn sync_integration_ical(
     .await?;
 
     let event_id = value_str(&integration_event, "id");
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -287,7 +287,7 @@ async fn sync_integration_ical(
             )
             .await;
 
-            write_audit_log(
+            enqueue_audit_log(
                 state.db_pool.as_ref(),
                 Some(&org_id),
                 Some(&user_id),
@@ -707,7 +707,7 @@ async fn airbnb_callback(
         AppError::Dependency("Failed to save Airbnb connection.".to_string())
     })?;
 
-    write_audit_log(
+    enqueue_audit_log(
         Some(pool),
         Some(&payload.org_id),
         Some(&user_id),
@@ -1,7 +1,7 @@
 use axum::{
     extract::{Path, Query, State},
     http::HeaderMap,
-    response::IntoResponse,
+    response::{IntoResponse, Response},
     Json,
 };
 use chrono::{Datelike, Duration, NaiveDate, Utc};
@@ -11,15 +11,22 @@ use std::collections::{HashMap, HashSet};
 use crate::{
     auth::require_user_id,
     error::{AppError, AppResult},
-    repository::table_service::{create_row, get_row, list_rows, update_row},
+    repository::table_service::{
+        create_row, create_rows_bulk, get_row, list_rows, org_tables_version, row_exists,
+        update_row,
+    },
     schemas::{
         clamp_limit_in_range, remove_nulls, serialize_to_map, CreateLeaseInput, LeasePath,
-        LeaseRentRollQuery, LeasesOverviewQuery, LeasesQuery, UpdateLeaseInput,
+        LeaseRentRollQuery, LeasesOverviewQuery, LeasesQuery, UpdateLeaseInput, WriteResponseQuery,
     },
     services::{
-        audit::write_audit_log,
+        audit_queue::enqueue_audit_log,
         lease_schedule::ensure_monthly_lease_schedule,
-        leases::{build_lease_detail_overview, build_leases_overview, enrich_lease_rows},
+        leases::{
+            apply_collection_stats, build_lease_detail_overview, build_leases_overview,
+            enrich_lease_rows, enrich_lease_rows_with, LeaseIncludes,
+        },
+        list_etag::{etag_matches, json_with_etag, list_etag, not_modified},
         sequences::enroll_in_sequences,
         workflows::fire_trigger,
     },
@@ -55,17 +62,39 @@ pub fn router() -> axum::Router<AppState> {
         )
 }
 
+/// Tables whose changes can alter a `GET /leases` page.
+/// Each one needs a `bump_org_table_version` trigger.
+const LEASE_LIST_TABLES: &[&str] = &[
+    "leases",
+    "collection_records",
+    "documents",
+    "properties",
+    "units",
+    "unit_spaces",
+    "unit_beds",
+];
+
 async fn list_leases(
     State(state): State<AppState>,
     Query(query): Query<LeasesQuery>,
     headers: HeaderMap,
-) -> AppResult<Json<Value>> {
+) -> AppResult<Response> {
     ensure_lease_collections_enabled(&state)?;
 
     let user_id = require_user_id(&state, &headers).await?;
     assert_org_member(&state, &user_id, &query.org_id).await?;
     let pool = db_pool(&state)?;
 
+    // Overdue counts move with the calendar, so today's date is part of the
+    // version alongside every table the enrichment reads.
+    let version = org_tables_version(pool, &query.org_id, LEASE_LIST_TABLES).await?;
+    let today = Utc::now().date_naive().to_string();
+    let query_key = serde_json::to_string(&query).unwrap_or_default();
+    let etag = list_etag(&[&query.org_id, &version, &today, &query_key]);
+    if etag_matches(&headers, &etag) {
+        return Ok(not_modified(&etag));
+    }
+
     let mut filters = Map::new();
     filters.insert(
         "organization_id".to_string(),
@@ -98,8 +127,14 @@ async fn list_leases(
     )
     .await?;
 
-    let enriched = enrich_lease_rows(pool, rows).await?;
-    Ok(Json(json!({ "data": enriched })))
+    let enriched = enrich_lease_rows_with(
+        &state,
+        pool,
+        rows,
+        LeaseIncludes::parse(query.include.as_deref()),
+    )
+    .await?;
+    Ok(json_with_etag(json!({ "data": enriched }), &etag))
 }
 
 async fn list_leases_overview(
@@ -463,6 +498,7 @@ async fn get_rent_roll(
 
 async fn create_lease(
     State(state): State<AppState>,
+    Query(write): Query<WriteResponseQuery>,
     headers: HeaderMap,
     Json(payload): Json<CreateLeaseInput>,
 ) -> AppResult<impl IntoResponse> {
@@ -496,15 +532,20 @@ async fn create_lease(
     let lease = create_row(pool, "leases", &lease_payload).await?;
     let lease_id = value_str(&lease, "id");
 
-    for charge in &payload.charges {
-        let mut charge_payload = remove_nulls(serialize_to_map(charge));
-        charge_payload.insert(
-            "organization_id".to_string(),
-            Value::String(payload.organization_id.clone()),
-        );
-        charge_payload.insert("lease_id".to_string(), Value::String(lease_id.clone()));
-        let _ = create_row(pool, "lease_charges", &charge_payload).await?;
-    }
+    let charge_payloads = payload
+        .charges
+        .iter()
+        .map(|charge| {
+            let mut charge_payload = remove_nulls(serialize_to_map(charge));
+            charge_payload.insert(
+                "organization_id".to_string(),
+                Value::String(payload.organization_id.clone()),
+            );
+            charge_payload.insert("lease_id".to_string(), Value::String(lease_id.clone()));
+            charge_payload
+        })
+        .collect::<Vec<_>>();
+    create_rows_bulk(pool, "lease_charges", &charge_payloads).await?;
 
     let mut first_collection: Option<Value> = None;
     let mut schedule_due_dates: Vec<String> = Vec::new();
@@ -557,7 +598,7 @@ async fn create_lease(
         json!(schedule_collections_created),
     );
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -618,8 +659,12 @@ async fn create_lease(
         }
     }
 
-    let mut enriched = enrich_lease_rows(pool, vec![lease]).await?;
-    let lease_payload = enriched.pop().unwrap_or_else(|| Value::Object(Map::new()));
+    let lease_payload = if write.enrich {
+        let mut enriched = enrich_lease_rows(&state, pool, vec![lease]).await?;
+        enriched.pop().unwrap_or_else(|| Value::Object(Map::new()))
+    } else {
+        lease
+    };
 
     Ok((
         axum::http::StatusCode::CREATED,
@@ -646,35 +691,40 @@ async fn get_lease(
     let org_id = value_str(&record, "organization_id");
     assert_org_member(&state, &user_id, &org_id).await?;
 
-    let charges = list_rows(
-        pool,
-        "lease_charges",
-        Some(&json_map(&[(
-            "lease_id",
-            Value::String(path.lease_id.clone()),
-        )])),
-        500,
-        0,
-        "charge_date",
-        true,
-    )
-    .await?;
-    let collections = list_rows(
-        pool,
-        "collection_records",
-        Some(&json_map(&[(
-            "lease_id",
-            Value::String(path.lease_id.clone()),
-        )])),
-        500,
-        0,
-        "due_date",
-        true,
-    )
-    .await?;
-
-    let mut enriched = enrich_lease_rows(pool, vec![record]).await?;
+    let lease_filter = json_map(&[("lease_id", Value::String(path.lease_id.clone()))]);
+    let (charges, collections, mut enriched) = tokio::try_join!(
+        list_rows(
+            pool,
+            "lease_charges",
+            Some(&lease_filter),
+            500,
+            0,
+            "charge_date",
+            true
+        ),
+        list_rows(
+            pool,
+            "collection_records",
+            Some(&lease_filter),
+            500,
+            0,
+            "due_date",
+            true
+        ),
+        enrich_lease_rows_with(
+            &state,
+            pool,
+            vec![record],
+            LeaseIncludes {
+                collections: false,
+                ..LeaseIncludes::ALL
+            },
+        )
+    )?;
     let mut item = enriched.pop().unwrap_or_else(|| Value::Object(Map::new()));
+    // The collections are already loaded, so derive the stats from them
+    // instead of running the aggregate query.
+    apply_collection_stats(&mut item, &collections);
     if let Some(obj) = item.as_object_mut() {
         obj.insert("charges".to_string(), Value::Array(charges));
         obj.insert("collections".to_string(), Value::Array(collections));
@@ -704,6 +754,7 @@ async fn get_lease_overview(
 async fn update_lease(
     State(state): State<AppState>,
     Path(path): Path<LeasePath>,
+    Query(write): Query<WriteResponseQuery>,
     headers: HeaderMap,
     Json(payload): Json<UpdateLeaseInput>,
 ) -> AppResult<Json<Value>> {
@@ -755,10 +806,15 @@ async fn update_lease(
         }
     }
 
-    let mut updated = update_row(pool, "leases", &path.lease_id, &patch, "id").await?;
-
-    if value_str(&updated, "lease_status") == "active" {
-        let unpaid_past_due = list_rows(
+    // Settle the final status before writing so an active lease with
+    // overdue collections is marked delinquent in the same UPDATE.
+    let next_status = patch
+        .get("lease_status")
+        .and_then(Value::as_str)
+        .map(ToOwned::to_owned)
+        .unwrap_or_else(|| value_str(&record, "lease_status"));
+    if next_status == "active" {
+        let has_overdue = row_exists(
             pool,
             "collection_records",
             Some(&json_map(&[
@@ -772,33 +828,25 @@ async fn update_lease(
                             .collect(),
                     ),
                 ),
+                (
+                    "due_date__lt",
+                    Value::String(Utc::now().date_naive().to_string()),
+                ),
             ])),
-            200,
-            0,
-            "created_at",
-            false,
         )
         .await?;
 
-        let now_date = Utc::now().date_naive().to_string();
-        let has_overdue = unpaid_past_due.iter().any(|row| {
-            row.as_object()
-                .and_then(|obj| obj.get("due_date"))
-                .and_then(Value::as_str)
-                .is_some_and(|due_date| !due_date.is_empty() && due_date < now_date.as_str())
-        });
-
         if has_overdue {
-            let mut lease_patch = Map::new();
-            lease_patch.insert(
+            patch.insert(
                 "lease_status".to_string(),
                 Value::String("delinquent".to_string()),
             );
-            updated = update_row(pool, "leases", &path.lease_id, &lease_patch, "id").await?;
         }
     }
 
-    write_audit_log(
+    let updated = update_row(pool, "leases", &path.lease_id, &patch, "id").await?;
+
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -857,7 +905,10 @@ async fn update_lease(
         }
     }
 
-    let mut enriched = enrich_lease_rows(pool, vec![updated]).await?;
+    if !write.enrich {
+        return Ok(Json(updated));
+    }
+    let mut enriched = enrich_lease_rows(&state, pool, vec![updated]).await?;
     Ok(Json(
         enriched.pop().unwrap_or_else(|| Value::Object(Map::new())),
     ))
@@ -1279,19 +1330,22 @@ fn map_string(payload: &Map<String, Value>, key: &str) -> Option<String> {
 }
 
 fn compute_totals(record: &Map<String, Value>) -> LeaseTotals {
-    let monthly_rent = map_number(record, "monthly_rent");
-    let service_fee_flat = map_number(record, "service_fee_flat");
-    let security_deposit = map_number(record, "security_deposit");
-    let guarantee_option_fee = map_number(record, "guarantee_option_fee");
-    let tax_iva = map_number(record, "tax_iva");
-
-    let total_move_in =
-        monthly_rent + service_fee_flat + security_deposit + guarantee_option_fee + tax_iva;
+    // Sum in whole cents so the totals match the numeric(12, 2) columns
+    // exactly instead of accumulating float error.
+    let cents = |key: &str| (map_number(record, key) * 100.0).round() as i64;
+    let monthly_rent = cents("monthly_rent");
+    let tax_iva = cents("tax_iva");
+
+    let total_move_in = monthly_rent
+        + cents("service_fee_flat")
+        + cents("security_deposit")
+        + cents("guarantee_option_fee")
+        + tax_iva;
     let monthly_recurring_total = monthly_rent + tax_iva;
 
     LeaseTotals {
-        total_move_in: round2(total_move_in),
-        monthly_recurring_total: round2(monthly_recurring_total),
+        total_move_in: total_move_in as f64 / 100.0,
+        monthly_recurring_total: monthly_recurring_total as f64 / 100.0,
     }
 }
 
@@ -1399,10 +1453,6 @@ fn json_map(entries: &[(&str, Value)]) -> Map<String, Value> {
     map
 }
 
-fn round2(value: f64) -> f64 {
-    (value * 100.0).round() / 100.0
-}
-
 // ── Renewal endpoints ──────────────────────────────────────────────
 
 #[derive(Debug, serde::Deserialize)]
@@ -1439,7 +1489,7 @@ async fn send_renewal_offer(
     .await
     .map_err(AppError::BadRequest)?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -1629,7 +1679,7 @@ async fn accept_renewal(
     );
     let _ = update_row(pool, "leases", &path.lease_id, &complete_patch, "id").await;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -1653,11 +1703,29 @@ async fn accept_renewal(
 
 #[cfg(test)]
 mod tests {
+    use serde_json::{json, Map, Value};
+
     use super::{
-        clamp_turnover_buffer_hours, intervals_conflict_with_buffer, lease_targets_conflict,
-        parse_date_opt, turnover_hours_to_days,
+        clamp_turnover_buffer_hours, compute_totals, intervals_conflict_with_buffer,
+        lease_targets_conflict, parse_date_opt, turnover_hours_to_days,
     };
 
+    #[test]
+    fn computes_lease_totals_to_the_cent() {
+        let record: Map<String, Value> = json!({
+            "monthly_rent": 0.1,
+            "service_fee_flat": 0.2,
+            "security_deposit": "1000000.07",
+            "tax_iva": 0.01,
+        })
+        .as_object()
+        .cloned()
+        .unwrap_or_default();
+        let totals = compute_totals(&record);
+        assert_eq!(totals.total_move_in, 1000000.38);
+        assert_eq!(totals.monthly_recurring_total, 0.11);
+    }
+
     #[test]
     fn converts_turnover_hours_to_days() {
         assert_eq!(turnover_hours_to_days(0), 0);
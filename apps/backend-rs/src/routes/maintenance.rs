@@ -11,7 +11,7 @@ use crate::{
     error::{AppError, AppResult},
     repository::table_service::{create_row, get_row, list_rows, update_row},
     schemas::clamp_limit_in_range,
-    services::audit::write_audit_log,
+    services::audit_queue::enqueue_audit_log,
     services::notification_center::{emit_event, EmitNotificationEventInput},
     state::AppState,
     tenancy::{assert_org_member, assert_org_role},
@@ -362,7 +362,7 @@ async fn update_maintenance_request(
         }
     }
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -7,11 +7,14 @@ use axum::{
 use chrono::{NaiveDate, Utc};
 use serde::Deserialize;
 use serde_json::{json, Map, Value};
+use sqlx::Row;
 
 use crate::{
     auth::require_user_id,
     error::{AppError, AppResult},
-    repository::table_service::{count_rows, create_row, get_row, list_rows, update_row},
+    repository::table_service::{
+        count_rows, create_row, get_row, like_contains_pattern, list_rows, update_row,
+    },
     schemas::{
         validate_input, CreateListingInput, ListingPath, ListingsOverviewQuery, ListingsQuery,
         MarketplaceInquiryInput, PublicListingApplicationInput, PublicListingSlugPath,
@@ -19,12 +22,13 @@ use crate::{
     },
     services::{
         alerting::write_alert_event,
-        analytics::write_analytics_event,
-        audit::write_audit_log,
+        audit_queue::{enqueue_analytics_event, enqueue_audit_log},
+        enrichment::listing_context_cache_key,
         listings::{
             attach_listing_fee_lines, build_listing_detail_overview, build_listing_preview,
             build_listings_overview, get_listing_row_with_context, get_public_listing_row_by_slug,
-            list_public_listing_rows, public_listing_shape,
+            list_public_listing_rows, load_listing_refs, public_listing_cursor,
+            public_listing_shape, public_listings_limit, with_fee_line_totals,
         },
         pricing::{compute_pricing_totals, missing_required_fee_types, normalize_fee_lines},
         readiness::{compute_readiness_report, readiness_summary},
@@ -150,6 +154,12 @@ async fn list_listings(
     if let Some(unit_id) = non_empty_opt(query.unit_id.as_deref()) {
         filters.insert("unit_id".to_string(), Value::String(unit_id));
     }
+    if let Some(q) = non_empty_opt(query.q.as_deref()) {
+        filters.insert(
+            "title|city|property_type__ilike".to_string(),
+            Value::String(like_contains_pattern(&q)),
+        );
+    }
 
     let page = query.page.max(1);
     let per_page = query.per_page.clamp(1, 100);
@@ -162,7 +172,7 @@ async fn list_listings(
     let filters_for_total = filters.clone();
     let filters_for_rows = filters;
     let sort_by_for_rows = sort_by.clone();
-    let (total, mut rows) = tokio::try_join!(
+    let (total, rows) = tokio::try_join!(
         async move { count_rows(pool, "listings", Some(&filters_for_total)).await },
         async move {
             list_rows(
@@ -178,22 +188,6 @@ async fn list_listings(
         }
     )?;
 
-    // Post-hoc text search filter
-    if let Some(q) = non_empty_opt(query.q.as_deref()) {
-        let needle = q.to_ascii_lowercase();
-        rows.retain(|row| {
-            value_str(row, "title")
-                .to_ascii_lowercase()
-                .contains(&needle)
-                || value_str(row, "city")
-                    .to_ascii_lowercase()
-                    .contains(&needle)
-                || value_str(row, "property_type")
-                    .to_ascii_lowercase()
-                    .contains(&needle)
-        });
-    }
-
     let mut attached = attach_listing_fee_lines(pool, rows).await?;
 
     // Inject readiness into each row
@@ -229,7 +223,7 @@ async fn get_listing_overview(
     assert_org_member(&state, &user_id, &org_id).await?;
 
     Ok(Json(
-        build_listing_detail_overview(&state, pool, &path.listing_id).await?,
+        build_listing_detail_overview(&state, pool, &path.listing_id, record).await?,
     ))
 }
 
@@ -250,34 +244,30 @@ async fn create_listing(
 
     let mut listing_payload = remove_nulls(serialize_payload(&payload));
     listing_payload.remove("fee_lines");
-    listing_payload = sanitize_listing_payload(listing_payload, false)?;
+    listing_payload = sanitize_listing_payload(listing_payload)?;
     listing_payload.insert(
         "created_by_user_id".to_string(),
         Value::String(user_id.clone()),
     );
 
-    if let Some(integration_id) = listing_payload
-        .get("integration_id")
-        .and_then(Value::as_str)
-        .map(str::trim)
-        .filter(|value| !value.is_empty())
-    {
-        let integration = get_row(pool, "integrations", integration_id, "id").await?;
-        if value_str(&integration, "organization_id") != payload.organization_id {
+    let refs = load_listing_refs(
+        pool,
+        non_blank_str(&listing_payload, "integration_id"),
+        non_blank_str(&listing_payload, "unit_id"),
+        non_blank_str(&listing_payload, "property_id"),
+    )
+    .await?;
+
+    if let Some(integration) = refs.integration.as_ref() {
+        if value_str(integration, "organization_id") != payload.organization_id {
             return Err(AppError::BadRequest(
                 "integration_id does not belong to this organization.".to_string(),
             ));
         }
     }
 
-    if let Some(unit_id) = listing_payload
-        .get("unit_id")
-        .and_then(Value::as_str)
-        .map(str::trim)
-        .filter(|value| !value.is_empty())
-    {
-        let unit = get_row(pool, "units", unit_id, "id").await?;
-        if value_str(&unit, "organization_id") != payload.organization_id {
+    if let Some(unit) = refs.unit.as_ref() {
+        if value_str(unit, "organization_id") != payload.organization_id {
             return Err(AppError::BadRequest(
                 "unit_id does not belong to this organization.".to_string(),
             ));
@@ -324,14 +314,8 @@ async fn create_listing(
         }
     }
 
-    if let Some(property_id) = listing_payload
-        .get("property_id")
-        .and_then(Value::as_str)
-        .map(str::trim)
-        .filter(|value| !value.is_empty())
-    {
-        let property = get_row(pool, "properties", property_id, "id").await?;
-        if value_str(&property, "organization_id") != payload.organization_id {
+    if let Some(property) = refs.property.as_ref() {
+        if value_str(property, "organization_id") != payload.organization_id {
             return Err(AppError::BadRequest(
                 "property_id does not belong to this organization.".to_string(),
             ));
@@ -363,7 +347,7 @@ async fn create_listing(
 
     let mut audit_after = created.as_object().cloned().unwrap_or_default();
     audit_after.insert("fee_lines".to_string(), Value::Array(created_lines));
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -407,13 +391,11 @@ async fn get_listing_preview(
     let user_id = require_user_id(&state, &headers).await?;
     let pool = db_pool(&state)?;
 
-    let record = get_row(pool, "listings", &path.listing_id, "id").await?;
+    let record = get_listing_row_with_context(pool, &path.listing_id).await?;
     let org_id = value_str(&record, "organization_id");
     assert_org_member(&state, &user_id, &org_id).await?;
 
-    Ok(Json(
-        build_listing_preview(&state, pool, &path.listing_id).await?,
-    ))
+    Ok(Json(build_listing_preview(&state, record)))
 }
 
 async fn update_listing(
@@ -431,30 +413,26 @@ async fn update_listing(
 
     let mut patch = remove_nulls(serialize_payload(&payload));
     patch.remove("fee_lines");
-    patch = sanitize_listing_payload(patch, false)?;
+    patch = sanitize_listing_payload(patch)?;
 
-    if let Some(integration_id) = patch
-        .get("integration_id")
-        .and_then(Value::as_str)
-        .map(str::trim)
-        .filter(|value| !value.is_empty())
-    {
-        let integration = get_row(pool, "integrations", integration_id, "id").await?;
-        if value_str(&integration, "organization_id") != org_id {
+    let refs = load_listing_refs(
+        pool,
+        non_blank_str(&patch, "integration_id"),
+        non_blank_str(&patch, "unit_id"),
+        non_blank_str(&patch, "property_id"),
+    )
+    .await?;
+
+    if let Some(integration) = refs.integration.as_ref() {
+        if value_str(integration, "organization_id") != org_id {
             return Err(AppError::BadRequest(
                 "integration_id does not belong to this organization.".to_string(),
             ));
         }
     }
 
-    if let Some(unit_id) = patch
-        .get("unit_id")
-        .and_then(Value::as_str)
-        .map(str::trim)
-        .filter(|value| !value.is_empty())
-    {
-        let unit = get_row(pool, "units", unit_id, "id").await?;
-        if value_str(&unit, "organization_id") != org_id {
+    if let Some(unit) = refs.unit.as_ref() {
+        if value_str(unit, "organization_id") != org_id {
             return Err(AppError::BadRequest(
                 "unit_id does not belong to this organization.".to_string(),
             ));
@@ -493,14 +471,8 @@ async fn update_listing(
         }
     }
 
-    if let Some(property_id) = patch
-        .get("property_id")
-        .and_then(Value::as_str)
-        .map(str::trim)
-        .filter(|value| !value.is_empty())
-    {
-        let property = get_row(pool, "properties", property_id, "id").await?;
-        if value_str(&property, "organization_id") != org_id {
+    if let Some(property) = refs.property.as_ref() {
+        if value_str(property, "organization_id") != org_id {
             return Err(AppError::BadRequest(
                 "property_id does not belong to this organization.".to_string(),
             ));
@@ -514,24 +486,48 @@ async fn update_listing(
         }
     }
 
+    let fee_lines = payload.fee_lines.as_ref().map(|fee_lines| {
+        fee_lines
+            .iter()
+            .filter_map(|line| serde_json::to_value(line).ok())
+            .collect::<Vec<_>>()
+    });
+
+    // Check a publish against the listing as this update would leave it,
+    // before writing anything, so a rejected publish changes nothing.
+    if payload.is_published == Some(true) {
+        let mut prospective = record.clone();
+        if let Some(obj) = prospective.as_object_mut() {
+            for (key, value) in &patch {
+                obj.insert(key.clone(), value.clone());
+            }
+            if let Some(lines) = fee_lines.as_ref() {
+                obj.insert(
+                    "fee_lines".to_string(),
+                    Value::Array(normalize_fee_lines(lines)),
+                );
+            }
+        }
+        if fee_lines.is_none() {
+            let mut rows = attach_listing_fee_lines(pool, vec![prospective]).await?;
+            prospective = rows.pop().unwrap_or_else(|| Value::Object(Map::new()));
+        }
+        assert_publishable(&state, &prospective)?;
+    }
+
     let mut updated = record.clone();
     if !patch.is_empty() {
         updated = update_row(pool, "listings", &path.listing_id, &patch, "id").await?;
     }
 
-    if let Some(fee_lines) = payload.fee_lines.as_ref() {
-        let lines = fee_lines
-            .iter()
-            .filter_map(|line| serde_json::to_value(line).ok())
-            .collect::<Vec<_>>();
-        let _ = replace_fee_lines(pool, &org_id, &path.listing_id, &lines).await?;
+    if let Some(lines) = fee_lines.as_ref() {
+        let _ = replace_fee_lines(pool, &org_id, &path.listing_id, lines).await?;
     }
 
-    if payload.is_published == Some(true) {
-        assert_publishable(&state, pool, &updated).await?;
-    }
+    let mut rows = attach_listing_fee_lines(pool, vec![updated.clone()]).await?;
+    let item = rows.pop().unwrap_or_else(|| Value::Object(Map::new()));
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -543,15 +539,16 @@ async fn update_listing(
     )
     .await;
     state.public_listings_cache.clear().await;
+    state
+        .enrichment_cache
+        .invalidate(&listing_context_cache_key(&path.listing_id))
+        .await;
 
     if bool_value(updated.get("is_published")) {
-        sync_linked_listing(pool, &updated, true).await;
+        sync_linked_listing(pool, &updated, true);
     }
 
-    let mut rows = attach_listing_fee_lines(pool, vec![updated]).await?;
-    Ok(Json(
-        rows.pop().unwrap_or_else(|| Value::Object(Map::new())),
-    ))
+    Ok(Json(item))
 }
 
 async fn publish_listing(
@@ -566,17 +563,38 @@ async fn publish_listing(
     let org_id = value_str(&record, "organization_id");
     assert_org_role(&state, &user_id, &org_id, MARKETPLACE_EDIT_ROLES).await?;
 
-    assert_publishable(&state, pool, &record).await?;
-
-    let patch = json_map(&[
-        ("is_published", Value::Bool(true)),
-        ("published_at", Value::String(Utc::now().to_rfc3339())),
-    ]);
-    let updated = update_row(pool, "listings", &path.listing_id, &patch, "id").await?;
+    // Fee lines and names are loaded once: the publish check reads them and
+    // the response reuses them, since publishing does not change either.
+    let mut rows = attach_listing_fee_lines(pool, vec![record.clone()]).await?;
+    let mut item = rows.pop().unwrap_or_else(|| Value::Object(Map::new()));
+    assert_publishable(&state, &item)?;
+
+    // published_at comes from the database clock, so it orders consistently
+    // with created_at/updated_at and the keyset cursor on public listings.
+    let updated = sqlx::query(
+        "UPDATE listings l
+         SET is_published = true, published_at = now()
+         WHERE l.id = $1::uuid
+         RETURNING row_to_json(l) AS row",
+    )
+    .bind(&path.listing_id)
+    .fetch_optional(pool)
+    .await
+    .map_err(|error| {
+        tracing::error!(error = %error, "Database query failed");
+        AppError::from_database_error(&error, "External service request failed.")
+    })?
+    .and_then(|row| row.try_get::<Option<Value>, _>("row").ok().flatten())
+    .ok_or_else(|| AppError::NotFound("listings record not found.".to_string()))?;
+    if let (Some(item_obj), Some(updated_obj)) = (item.as_object_mut(), updated.as_object()) {
+        for (key, value) in updated_obj {
+            item_obj.insert(key.clone(), value.clone());
+        }
+    }
 
-    sync_linked_listing(pool, &updated, true).await;
+    sync_linked_listing(pool, &updated, true);
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -589,10 +607,7 @@ async fn publish_listing(
     .await;
     state.public_listings_cache.clear().await;
 
-    let mut rows = attach_listing_fee_lines(pool, vec![updated]).await?;
-    Ok(Json(
-        rows.pop().unwrap_or_else(|| Value::Object(Map::new())),
-    ))
+    Ok(Json(item))
 }
 
 async fn list_public_listings(
@@ -607,11 +622,16 @@ async fn list_public_listings(
         .get_or_try_init(&cache_key, || async {
             let pool = db_pool(&state)?;
             let rows = list_public_listing_rows(pool, &query).await?;
+            let next_cursor = if rows.len() as i64 == public_listings_limit(&query) {
+                rows.last().map(public_listing_cursor)
+            } else {
+                None
+            };
             let shaped = rows
-                .iter()
+                .into_iter()
                 .map(|row| public_listing_shape(&state, row))
                 .collect::<Vec<_>>();
-            Ok(json!({ "data": shaped }))
+            Ok(json!({ "data": shaped, "next_cursor": next_cursor }))
         })
         .await?;
 
@@ -623,15 +643,9 @@ async fn get_public_listing(
     Path(path): Path<PublicListingSlugPath>,
 ) -> AppResult<Json<Value>> {
     ensure_marketplace_public_enabled(&state)?;
-    let pool = db_pool(&state)?;
-    let row = get_public_listing_row_by_slug(pool, &path.slug, false).await?;
-    let mut attached = attach_listing_fee_lines(pool, vec![row]).await?;
-    let shaped = public_listing_shape(
-        &state,
-        &attached.pop().unwrap_or_else(|| Value::Object(Map::new())),
-    );
+    let shaped = cached_public_listing(&state, &path.slug).await?;
 
-    write_analytics_event(
+    enqueue_analytics_event(
         state.db_pool.as_ref(),
         Some(&value_str(&shaped, "organization_id")),
         "view",
@@ -794,30 +808,9 @@ async fn start_public_listing_application(
     Path(path): Path<PublicListingSlugPath>,
 ) -> AppResult<Json<Value>> {
     ensure_marketplace_public_enabled(&state)?;
-    let pool = db_pool(&state)?;
-
-    let rows = list_rows(
-        pool,
-        "listings",
-        Some(&json_map(&[
-            ("public_slug", Value::String(path.slug.clone())),
-            ("is_published", Value::Bool(true)),
-        ])),
-        1,
-        0,
-        "created_at",
-        false,
-    )
-    .await?;
-    if rows.is_empty() {
-        return Err(AppError::NotFound("Public listing not found.".to_string()));
-    }
-    let listing = rows
-        .first()
-        .cloned()
-        .unwrap_or_else(|| Value::Object(Map::new()));
+    let listing = cached_public_listing(&state, &path.slug).await?;
 
-    write_analytics_event(
+    enqueue_analytics_event(
         state.db_pool.as_ref(),
         Some(&value_str(&listing, "organization_id")),
         "apply_start",
@@ -836,30 +829,9 @@ async fn track_public_listing_whatsapp_contact(
     Path(path): Path<PublicListingSlugPath>,
 ) -> AppResult<Json<Value>> {
     ensure_marketplace_public_enabled(&state)?;
-    let pool = db_pool(&state)?;
-
-    let rows = list_rows(
-        pool,
-        "listings",
-        Some(&json_map(&[
-            ("public_slug", Value::String(path.slug.clone())),
-            ("is_published", Value::Bool(true)),
-        ])),
-        1,
-        0,
-        "created_at",
-        false,
-    )
-    .await?;
-    if rows.is_empty() {
-        return Err(AppError::NotFound("Public listing not found.".to_string()));
-    }
-    let listing = rows
-        .first()
-        .cloned()
-        .unwrap_or_else(|| Value::Object(Map::new()));
+    let listing = cached_public_listing(&state, &path.slug).await?;
 
-    write_analytics_event(
+    enqueue_analytics_event(
         state.db_pool.as_ref(),
         Some(&value_str(&listing, "organization_id")),
         "contact_whatsapp",
@@ -887,17 +859,12 @@ async fn submit_public_listing_application(
     let listing = if let Some(listing_id) = non_empty_opt(payload.listing_id.as_deref()) {
         Some(get_row(pool, "listings", &listing_id, "id").await?)
     } else if let Some(slug) = non_empty_opt(payload.listing_slug.as_deref()) {
-        let rows = list_rows(
-            pool,
-            "listings",
-            Some(&json_map(&[("public_slug", Value::String(slug))])),
-            1,
-            0,
-            "created_at",
-            false,
-        )
-        .await?;
-        rows.first().cloned()
+        // public_slug is unique, so this is a single-row index lookup.
+        match get_row(pool, "listings", &slug, "public_slug").await {
+            Ok(row) => Some(row),
+            Err(AppError::NotFound(_)) => None,
+            Err(error) => return Err(error),
+        }
     } else {
         None
     };
@@ -957,15 +924,20 @@ async fn submit_public_listing_application(
                 "status_code".to_string(),
                 json!(error.status_code().as_u16()),
             );
-            write_alert_event(
-                state.db_pool.as_ref(),
-                Some(&org_id),
-                "application_submit_failed",
-                Some(Value::Object(failure_payload)),
-                "error",
-                Some(&error.detail_message()),
-            )
-            .await;
+            let alert_pool = state.db_pool.clone();
+            let alert_org_id = org_id.clone();
+            let detail = error.detail_message();
+            tokio::spawn(async move {
+                write_alert_event(
+                    alert_pool.as_ref(),
+                    Some(&alert_org_id),
+                    "application_submit_failed",
+                    Some(Value::Object(failure_payload)),
+                    "error",
+                    Some(&detail),
+                )
+                .await;
+            });
             return Err(error);
         }
     };
@@ -986,24 +958,29 @@ async fn submit_public_listing_application(
             }),
         ),
     ]);
-    if let Err(error) = create_row(pool, "application_events", &event_payload).await {
-        write_alert_event(
-            state.db_pool.as_ref(),
-            Some(&org_id),
-            "application_event_write_failed",
-            Some(json!({
-                "stage": "application_event_write",
-                "listing_id": listing.get("id").cloned().unwrap_or(Value::Null),
-                "listing_slug": listing.get("public_slug").cloned().unwrap_or(Value::Null),
-                "application_id": created.get("id").cloned().unwrap_or(Value::Null),
-            })),
-            "warning",
-            Some(&error.detail_message()),
-        )
-        .await;
-    }
+    let event_alert_payload = json!({
+        "stage": "application_event_write",
+        "listing_id": listing.get("id").cloned().unwrap_or(Value::Null),
+        "listing_slug": listing.get("public_slug").cloned().unwrap_or(Value::Null),
+        "application_id": created.get("id").cloned().unwrap_or(Value::Null),
+    });
+    let event_pool = pool.clone();
+    let event_org_id = org_id.clone();
+    tokio::spawn(async move {
+        if let Err(error) = create_row(&event_pool, "application_events", &event_payload).await {
+            write_alert_event(
+                Some(&event_pool),
+                Some(&event_org_id),
+                "application_event_write_failed",
+                Some(event_alert_payload),
+                "warning",
+                Some(&error.detail_message()),
+            )
+            .await;
+        }
+    });
 
-    write_analytics_event(
+    enqueue_analytics_event(
         state.db_pool.as_ref(),
         Some(&org_id),
         "apply_submit",
@@ -1037,26 +1014,13 @@ async fn submit_inquiry(
     ensure_marketplace_public_enabled(&state)?;
     let pool = db_pool(&state)?;
 
-    let rows = list_rows(
-        pool,
-        "listings",
-        Some(&json_map(&[
-            ("public_slug", Value::String(path.slug.clone())),
-            ("is_published", Value::Bool(true)),
-        ])),
-        1,
-        0,
-        "created_at",
-        false,
-    )
-    .await?;
-    if rows.is_empty() {
-        return Err(AppError::NotFound("Public listing not found.".to_string()));
-    }
-    let listing = rows
-        .first()
-        .cloned()
-        .unwrap_or_else(|| Value::Object(Map::new()));
+    let listing = match get_row(pool, "listings", &path.slug, "public_slug").await {
+        Ok(row) if bool_value(row.get("is_published")) => row,
+        Ok(_) | Err(AppError::NotFound(_)) => {
+            return Err(AppError::NotFound("Public listing not found.".to_string()));
+        }
+        Err(error) => return Err(error),
+    };
 
     let org_id = value_str(&listing, "organization_id");
     if org_id.is_empty() {
@@ -1111,7 +1075,7 @@ async fn submit_inquiry(
 
     let created = create_row(pool, "message_logs", &log).await?;
 
-    write_analytics_event(
+    enqueue_analytics_event(
         state.db_pool.as_ref(),
         Some(&org_id),
         "marketplace_inquiry",
@@ -1292,65 +1256,117 @@ async fn listing_readiness(
     Ok(Json(json!(report)))
 }
 
+/// Write `lines` as the listing's fee lines and refresh its pricing totals in
+/// one statement. Lines are upserted by `(listing_id, sort_order)` and only
+/// rows whose values changed are rewritten, so re-saving an unchanged set
+/// touches nothing; rows past the new line count are deleted.
 async fn replace_fee_lines(
     pool: &sqlx::PgPool,
     org_id: &str,
     listing_id: &str,
     lines: &[Value],
 ) -> AppResult<Vec<Value>> {
-    sqlx::query("DELETE FROM listing_fee_lines WHERE listing_id = $1")
-        .bind(listing_id)
-        .execute(pool)
-        .await
-        .map_err(|error| {
-            tracing::error!(error = %error, "Database query failed");
-            AppError::from_database_error(&error, "External service request failed.")
-        })?;
-
     let normalized = normalize_fee_lines(lines);
-    let mut created_lines = Vec::new();
-    for (index, line) in normalized.iter().enumerate() {
-        let Some(obj) = line.as_object() else {
-            continue;
-        };
-        let payload = json_map(&[
-            ("organization_id", Value::String(org_id.to_string())),
-            ("listing_id", Value::String(listing_id.to_string())),
-            (
-                "fee_type",
-                obj.get("fee_type").cloned().unwrap_or(Value::Null),
-            ),
-            ("label", obj.get("label").cloned().unwrap_or(Value::Null)),
-            ("amount", obj.get("amount").cloned().unwrap_or(Value::Null)),
-            (
-                "is_refundable",
-                obj.get("is_refundable")
-                    .cloned()
-                    .unwrap_or(Value::Bool(false)),
-            ),
-            (
-                "is_recurring",
-                obj.get("is_recurring")
-                    .cloned()
-                    .unwrap_or(Value::Bool(false)),
-            ),
-            ("sort_order", json!((index + 1) as i32)),
-        ]);
-        let created = create_row(pool, "listing_fee_lines", &payload).await?;
-        created_lines.push(created);
-    }
-
-    let totals = compute_pricing_totals(&created_lines);
-    let pricing_patch = json_map(&[
-        ("total_move_in", json!(totals.total_move_in)),
-        (
-            "monthly_recurring_total",
-            json!(totals.monthly_recurring_total),
-        ),
-    ]);
-    let _ = update_row(pool, "listings", listing_id, &pricing_patch, "id").await?;
+    let totals = compute_pricing_totals(&normalized);
+
+    // One array per column, expanded server-side with unnest so the whole
+    // set travels as a handful of typed parameters.
+    let mut fee_types = Vec::with_capacity(normalized.len());
+    let mut labels = Vec::with_capacity(normalized.len());
+    let mut amounts = Vec::with_capacity(normalized.len());
+    let mut refundable = Vec::with_capacity(normalized.len());
+    let mut recurring = Vec::with_capacity(normalized.len());
+    for obj in normalized.iter().filter_map(Value::as_object) {
+        fee_types.push(
+            obj.get("fee_type")
+                .and_then(Value::as_str)
+                .unwrap_or_default()
+                .to_string(),
+        );
+        labels.push(
+            obj.get("label")
+                .and_then(Value::as_str)
+                .unwrap_or_default()
+                .to_string(),
+        );
+        amounts.push(obj.get("amount").and_then(Value::as_f64).unwrap_or(0.0));
+        refundable.push(bool_value(obj.get("is_refundable")));
+        recurring.push(bool_value(obj.get("is_recurring")));
+    }
+    let line_count = fee_types.len() as i32;
+
+    let rows = sqlx::query(
+        "WITH incoming AS (
+            SELECT x.fee_type, x.label, x.amount::numeric AS amount,
+                   x.is_refundable, x.is_recurring, x.sort_order::int AS sort_order
+            FROM unnest($3::text[], $4::text[], $5::float8[], $6::boolean[], $7::boolean[])
+                 WITH ORDINALITY AS x(fee_type, label, amount, is_refundable, is_recurring, sort_order)
+         ),
+         removed AS (
+            DELETE FROM listing_fee_lines
+            WHERE listing_id = $2::uuid AND sort_order > $8
+         ),
+         upserted AS (
+            INSERT INTO listing_fee_lines AS f (
+                organization_id, listing_id, fee_type, label, amount,
+                is_refundable, is_recurring, sort_order
+            )
+            SELECT $1::uuid, $2::uuid, i.fee_type::fee_line_type, i.label, i.amount,
+                   i.is_refundable, i.is_recurring, i.sort_order
+            FROM incoming i
+            ON CONFLICT (listing_id, sort_order) DO UPDATE SET
+                organization_id = EXCLUDED.organization_id,
+                fee_type = EXCLUDED.fee_type,
+                label = EXCLUDED.label,
+                amount = EXCLUDED.amount,
+                is_refundable = EXCLUDED.is_refundable,
+                is_recurring = EXCLUDED.is_recurring
+            WHERE (f.organization_id, f.fee_type, f.label, f.amount, f.is_refundable, f.is_recurring)
+                IS DISTINCT FROM
+                  (EXCLUDED.organization_id, EXCLUDED.fee_type, EXCLUDED.label, EXCLUDED.amount,
+                   EXCLUDED.is_refundable, EXCLUDED.is_recurring)
+            RETURNING f.*
+         ),
+         priced AS (
+            UPDATE listings
+            SET total_move_in = $9::numeric, monthly_recurring_total = $10::numeric
+            WHERE id = $2::uuid
+              AND (total_move_in, monthly_recurring_total)
+                  IS DISTINCT FROM ($9::numeric, $10::numeric)
+         )
+         SELECT row_to_json(l) AS row
+         FROM (
+            SELECT * FROM upserted
+            UNION ALL
+            SELECT existing.*
+            FROM listing_fee_lines existing
+            WHERE existing.listing_id = $2::uuid
+              AND existing.sort_order <= $8
+              AND existing.sort_order NOT IN (SELECT sort_order FROM upserted)
+         ) l
+         ORDER BY l.sort_order",
+    )
+    .bind(org_id)
+    .bind(listing_id)
+    .bind(fee_types)
+    .bind(labels)
+    .bind(amounts)
+    .bind(refundable)
+    .bind(recurring)
+    .bind(line_count)
+    .bind(totals.total_move_in)
+    .bind(totals.monthly_recurring_total)
+    .fetch_all(pool)
+    .await
+    .map_err(|error| {
+        tracing::error!(error = %error, "Database query failed");
+        AppError::from_database_error(&error, "External service request failed.")
+    })?;
 
-    Ok(created_lines)
+    Ok(rows
+        .into_iter()
+        .filter_map(|row| row.try_get::<Option<Value>, _>("row").ok().flatten())
+        .collect())
 }
 
 async fn template_lines(
@@ -1391,7 +1407,9 @@ async fn template_lines(
         .collect())
 }
 
-async fn sync_linked_listing(pool: &sqlx::PgPool, row: &Value, is_publish_state: bool) {
+/// Mirror the listing's publish state onto its integration in the background;
+/// the response does not depend on it.
+fn sync_linked_listing(pool: &sqlx::PgPool, row: &Value, is_publish_state: bool) {
     let integration_id = value_str(row, "integration_id");
     if integration_id.is_empty() {
         return;
@@ -1404,34 +1422,42 @@ async fn sync_linked_listing(pool: &sqlx::PgPool, row: &Value, is_publish_state:
             row.get("public_slug").cloned().unwrap_or(Value::Null),
         ),
     ]);
-    let _ = update_row(pool, "integrations", &integration_id, &patch, "id").await;
+    let pool = pool.clone();
+    tokio::spawn(async move {
+        let _ = update_row(&pool, "integrations", &integration_id, &patch, "id").await;
+    });
 }
 
-async fn assert_publishable(state: &AppState, pool: &sqlx::PgPool, row: &Value) -> AppResult<()> {
+/// Publish checks for a listing row that already carries its `fee_lines`
+/// (see `attach_listing_fee_lines`).
+fn assert_publishable(state: &AppState, row: &Value) -> AppResult<()> {
     let row_id = value_str(row, "id");
     if row_id.is_empty() {
         return Err(AppError::BadRequest("Invalid listing id.".to_string()));
     }
 
-    let row_obj = row.as_object().cloned().unwrap_or_default();
-    let _ = sanitize_listing_payload(row_obj, true)?;
+    // The stored row was sanitized on write; only the cover needs checking.
+    let has_cover = row
+        .get("cover_image_url")
+        .and_then(Value::as_str)
+        .is_some_and(|value| !value.trim().is_empty());
+    if !has_cover {
+        return Err(AppError::BadRequest(
+            "cover_image_url is required before publishing listings.".to_string(),
+        ));
+    }
 
     if !state.config.transparent_pricing_required {
         ensure_publish_prereqs(row)?;
         return Ok(());
     }
 
-    let lines = list_rows(
-        pool,
-        "listing_fee_lines",
-        Some(&json_map(&[("listing_id", Value::String(row_id))])),
-        300,
-        0,
-        "sort_order",
-        true,
-    )
-    .await?;
-    let missing = missing_required_fee_types(&lines);
+    let lines = row
+        .get("fee_lines")
+        .and_then(Value::as_array)
+        .map(Vec::as_slice)
+        .unwrap_or_default();
+    let missing = missing_required_fee_types(lines);
     if !missing.is_empty() {
         return Err(AppError::BadRequest(
             json!({
@@ -1471,14 +1497,26 @@ fn ensure_publish_prereqs(row: &Value) -> AppResult<()> {
     Ok(())
 }
 
+/// Shaped public listing for `slug`, shared by the detail, apply-start and
+/// WhatsApp-contact endpoints so one visitor's burst costs a single fetch.
+/// Lives in `public_listings_cache`, which every listing write clears; misses
+/// are not cached.
+async fn cached_public_listing(state: &AppState, slug: &str) -> AppResult<Value> {
+    state
+        .public_listings_cache
+        .get_or_try_init(&format!("slug:{slug}"), || async {
+            let pool = db_pool(state)?;
+            let row = get_public_listing_row_by_slug(pool, slug, false).await?;
+            Ok(public_listing_shape(state, with_fee_line_totals(row)))
+        })
+        .await
+}
+
 fn public_listings_cache_key(query: &PublicListingsQuery) -> String {
     serde_json::to_string(query).unwrap_or_else(|_| "default".to_string())
 }
 
-fn sanitize_listing_payload(
-    mut patch: Map<String, Value>,
-    require_cover: bool,
-) -> AppResult<Map<String, Value>> {
+fn sanitize_listing_payload(mut patch: Map<String, Value>) -> AppResult<Map<String, Value>> {
     if patch.contains_key("gallery_image_urls") {
         let gallery = normalize_gallery_urls(patch.get("gallery_image_urls"), true)?;
         patch.insert(
@@ -1545,19 +1583,6 @@ fn sanitize_listing_payload(
     {
         patch.insert("maintenance_fee".to_string(), json!(0));
     }
-
-    if require_cover {
-        let has_cover = patch
-            .get("cover_image_url")
-            .and_then(Value::as_str)
-            .map(str::trim)
-            .is_some_and(|value| !value.is_empty());
-        if !has_cover {
-            return Err(AppError::BadRequest(
-                "cover_image_url is required before publishing listings.".to_string(),
-            ));
-        }
-    }
     Ok(patch)
 }
 
@@ -1748,27 +1773,14 @@ fn trim_to_optional_string(map: &mut Map<String, Value>, key: &str) {
 }
 
 fn whatsapp_contact_url(state: &AppState) -> Value {
-    let normalized = state
+    state
         .config
-        .marketplace_whatsapp_phone_e164
-        .as_deref()
-        .and_then(normalize_whatsapp_phone);
-    normalized
-        .map(|phone| Value::String(format!("https://wa.me/{phone}")))
+        .marketplace_whatsapp_contact_url
+        .clone()
+        .map(Value::String)
         .unwrap_or(Value::Null)
 }
 
-fn normalize_whatsapp_phone(value: &str) -> Option<String> {
-    let digits = value
-        .chars()
-        .filter(|character| character.is_ascii_digit())
-        .collect::<String>();
-    if digits.is_empty() {
-        return None;
-    }
-    Some(digits)
-}
-
 fn ensure_marketplace_public_enabled(state: &AppState) -> AppResult<()> {
     if state.config.marketplace_public_enabled {
         return Ok(());
@@ -1840,6 +1852,13 @@ fn missing_or_blank_map(map: &Map<String, Value>, key: &str) -> bool {
         .unwrap_or(true)
 }
 
+fn non_blank_str<'a>(map: &'a Map<String, Value>, key: &str) -> Option<&'a str> {
+    map.get(key)
+        .and_then(Value::as_str)
+        .map(str::trim)
+        .filter(|value| !value.is_empty())
+}
+
 fn serialize_payload<T: serde::Serialize>(payload: &T) -> Map<String, Value> {
     serde_json::to_value(payload)
         .ok()
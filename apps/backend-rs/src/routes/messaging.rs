@@ -15,7 +15,7 @@ use crate::{
         clamp_limit_in_range, remove_nulls, serialize_to_map, CreateMessageTemplateInput,
         MessageLogsQuery, MessageTemplatesQuery, SendMessageInput, TemplatePath,
     },
-    services::audit::write_audit_log,
+    services::audit_queue::enqueue_audit_log,
     services::collection_cycle::run_daily_collection_cycle,
     services::ical::sync_all_ical_integrations,
     services::lease_renewal::run_lease_renewal_scan,
@@ -152,7 +152,7 @@ async fn create_template(
     let created = create_row(pool, "message_templates", &record).await?;
     let entity_id = value_str(&created, "id");
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -241,7 +241,7 @@ async fn send_message(
     let created = create_row(pool, "message_logs", &log).await?;
     let entity_id = value_str(&created, "id");
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -66,6 +66,7 @@ pub fn v1_router() -> Router<AppState> {
         .route("/ready", get(health::ready))
         .route("/health", get(health::health))
         .route("/health/cache-stats", get(health::cache_stats))
+        .route("/health/audit-queue", get(health::audit_queue_stats))
         .route("/me", get(identity::me))
         .route("/public/fx/usd-pyg", get(public_fx_rate))
         .merge(agent_chats::router())
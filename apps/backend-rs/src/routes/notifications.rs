@@ -16,7 +16,7 @@ use crate::{
         NotificationRulePath, NotificationRulesMetadataQuery, NotificationRulesQuery,
         UpdateNotificationRuleInput,
     },
-    services::audit::write_audit_log,
+    services::audit_queue::enqueue_audit_log,
     state::AppState,
     tenancy::{assert_org_member, assert_org_role},
 };
@@ -222,7 +222,7 @@ async fn create_notification_rule(
     let created = create_row(pool, "notification_rules", &record).await?;
     let entity_id = value_str(&created, "id");
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -272,7 +272,7 @@ async fn update_notification_rule(
 
     let updated = update_row(pool, "notification_rules", &path.rule_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
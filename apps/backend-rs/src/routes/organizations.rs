@@ -21,7 +21,7 @@ use crate::{
         UpdateOrganizationMemberInput,
     },
     services::{
-        audit::write_audit_log,
+        audit_queue::enqueue_audit_log,
         plan_limits::{check_plan_limit, PlanResource},
     },
     state::AppState,
@@ -128,7 +128,7 @@ async fn create_organization(
         .await
         .map_err(|e| AppError::Dependency(format!("txn commit: {e}")))?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user.id),
@@ -169,7 +169,7 @@ async fn update_organization(
 
     let patch = remove_nulls(serialize_to_map(&payload));
     let updated = update_row(pool, "organizations", &path.org_id, &patch, "id").await?;
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&path.org_id),
         Some(&user.id),
@@ -201,18 +201,9 @@ async fn delete_organization(
         ));
     }
 
+    // No audit row here: audit_logs references the organization that was
+    // just deleted, so the insert could only fail.
     let deleted = delete_row(pool, "organizations", &path.org_id, "id").await?;
-    write_audit_log(
-        state.db_pool.as_ref(),
-        Some(&path.org_id),
-        Some(&user.id),
-        "delete",
-        "organizations",
-        Some(&path.org_id),
-        Some(deleted.clone()),
-        None,
-    )
-    .await;
 
     Ok(Json(deleted))
 }
@@ -303,7 +294,7 @@ async fn create_invite(
 
     let created = create_row(pool, "organization_invites", &record).await?;
     let entity_id = value_str(&created, "id");
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&path.org_id),
         Some(&user.id),
@@ -349,7 +340,7 @@ async fn revoke_invite(
         Value::String(user.id.clone()),
     );
     let updated = update_row(pool, "organization_invites", &path.invite_id, &patch, "id").await?;
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&path.org_id),
         Some(&user.id),
@@ -449,7 +440,7 @@ async fn accept_invite(
         Value::String(user.id.clone()),
     );
     let updated_invite = update_row(pool, "organization_invites", &invite_id, &patch, "id").await?;
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user.id),
@@ -519,7 +510,7 @@ async fn add_member(
     .await?;
     let created = get_org_membership(&state, &payload.user_id, &path.org_id).await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&path.org_id),
         Some(&user.id),
@@ -603,7 +594,7 @@ async fn update_member(
         .and_then(|row| row.try_get::<Option<Value>, _>("row").ok().flatten())
         .unwrap_or_else(|| existing.clone());
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&path.org_id),
         Some(&user.id),
@@ -673,7 +664,7 @@ async fn delete_member(
             AppError::Dependency("External service request failed.".to_string())
         })?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&path.org_id),
         Some(&user.id),
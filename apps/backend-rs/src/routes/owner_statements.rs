@@ -10,16 +10,29 @@ use serde_json::{json, Map, Value};
 use crate::{
     auth::require_user_id,
     error::{AppError, AppResult},
-    repository::table_service::{create_row, get_row, list_rows, update_row},
+    repository::table_service::{
+        create_row, get_row, list_rows, org_tables_version, update_row, update_row_tx,
+    },
     schemas::{
         clamp_limit_in_range, CreateOwnerStatementInput, OwnerStatementPath, OwnerStatementsQuery,
     },
-    services::{audit::write_audit_log, enrichment::enrich_owner_statements},
+    services::{audit_queue::enqueue_audit_log, enrichment::enrich_owner_statements},
     state::AppState,
     tenancy::{assert_org_member, assert_org_role},
 };
 
 const REPORTABLE_STATUSES: &[&str] = &["confirmed", "checked_in", "checked_out"];
+/// Tables `build_statement_breakdown` reads. Their org version is part of the
+/// cached breakdown's key, so any write to them misses the cache. Each one
+/// needs a `bump_org_table_version` trigger.
+const STATEMENT_SOURCE_TABLES: &[&str] = &[
+    "reservations",
+    "expenses",
+    "leases",
+    "lease_charges",
+    "collection_records",
+    "units",
+];
 
 pub fn router() -> axum::Router<AppState> {
     axum::Router::new()
@@ -135,7 +148,7 @@ async fn create_owner_statement(
     statement.insert("status".to_string(), Value::String("draft".to_string()));
 
     let created = create_row(pool, "owner_statements", &statement).await?;
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -148,16 +161,15 @@ async fn create_owner_statement(
     .await;
 
     let mut response = created.as_object().cloned().unwrap_or_default();
-    response.insert("line_items".to_string(), Value::Array(breakdown.line_items));
     response.insert(
         "reconciliation".to_string(),
-        json!({
-            "gross_total": breakdown.reconciliation_gross_total,
-            "computed_net_payout": breakdown.reconciliation_computed_net_payout,
-            "stored_net_payout": breakdown.net_payout,
-            "stored_vs_computed_diff": 0.0,
-        }),
+        reconciliation_json(
+            breakdown.reconciliation_gross_total,
+            breakdown.reconciliation_computed_net_payout,
+            breakdown.net_payout,
+        ),
     );
+    response.insert("line_items".to_string(), Value::Array(breakdown.line_items));
 
     Ok((
         axum::http::StatusCode::CREATED,
@@ -177,33 +189,38 @@ async fn get_owner_statement(
     let org_id = value_str(&record, "organization_id");
     assert_org_member(&state, &user_id, &org_id).await?;
 
-    let mut enriched_rows =
-        enrich_owner_statements(&state, pool, vec![record.clone()], &org_id).await?;
+    // Finalized statements are served from the snapshot taken at
+    // finalization; drafts (and statements finalized before snapshots
+    // existed) are rebuilt from the source rows.
+    let (mut enriched_rows, snapshot) = tokio::try_join!(
+        enrich_owner_statements(&state, pool, vec![record.clone()], &org_id),
+        async {
+            if value_str(&record, "status") == "draft" {
+                Ok(None)
+            } else {
+                load_statement_snapshot(pool, &path.statement_id).await
+            }
+        }
+    )?;
     let mut item = enriched_rows
         .pop()
         .unwrap_or_else(|| Value::Object(Map::new()));
 
-    let breakdown = build_statement_breakdown(
-        pool,
-        &org_id,
-        &value_str(&record, "period_start"),
-        &value_str(&record, "period_end"),
-        non_empty_opt(record.get("property_id").and_then(Value::as_str)).as_deref(),
-        non_empty_opt(record.get("unit_id").and_then(Value::as_str)).as_deref(),
-    )
-    .await?;
+    let snapshot = match snapshot {
+        Some(snapshot) => snapshot,
+        None => cached_statement_breakdown(&state, pool, &org_id, &record).await?,
+    };
 
     let stored_net = round2(number_from_value(record.get("net_payout")));
     if let Some(obj) = item.as_object_mut() {
-        obj.insert("line_items".to_string(), Value::Array(breakdown.line_items));
+        obj.insert("line_items".to_string(), Value::Array(snapshot.line_items));
         obj.insert(
             "reconciliation".to_string(),
-            json!({
-                "gross_total": breakdown.reconciliation_gross_total,
-                "computed_net_payout": breakdown.reconciliation_computed_net_payout,
-                "stored_net_payout": stored_net,
-                "stored_vs_computed_diff": round2(stored_net - breakdown.reconciliation_computed_net_payout),
-            }),
+            reconciliation_json(
+                snapshot.gross_total,
+                snapshot.computed_net_payout,
+                stored_net,
+            ),
         );
     }
     Ok(Json(item))
@@ -240,7 +257,7 @@ async fn request_approval_owner_statement(
 
     let updated = update_row(pool, "owner_statements", &path.statement_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -287,7 +304,7 @@ async fn approve_owner_statement(
 
     let updated = update_row(pool, "owner_statements", &path.statement_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -314,16 +331,46 @@ async fn finalize_owner_statement(
     let org_id = value_str(&record, "organization_id");
     assert_org_role(&state, &user_id, &org_id, &["owner_admin", "accountant"]).await?;
 
-    let updated = update_row(
+    let breakdown = build_statement_breakdown(
         pool,
+        &org_id,
+        &value_str(&record, "period_start"),
+        &value_str(&record, "period_end"),
+        non_empty_opt(record.get("property_id").and_then(Value::as_str)).as_deref(),
+        non_empty_opt(record.get("unit_id").and_then(Value::as_str)).as_deref(),
+    )
+    .await?;
+
+    // The status flip and the snapshot commit together: a finalized statement
+    // without a snapshot would fall back to the live breakdown and drift.
+    let mut tx = pool
+        .begin()
+        .await
+        .map_err(|error| AppError::Dependency(format!("txn begin: {error}")))?;
+    let updated = update_row_tx(
+        &mut tx,
         "owner_statements",
         &path.statement_id,
         &json_map(&[("status", Value::String("finalized".to_string()))]),
         "id",
     )
     .await?;
+    save_statement_snapshot(
+        &mut tx,
+        &org_id,
+        &path.statement_id,
+        StatementSnapshot {
+            line_items: breakdown.line_items,
+            gross_total: breakdown.reconciliation_gross_total,
+            computed_net_payout: breakdown.reconciliation_computed_net_payout,
+        },
+    )
+    .await?;
+    tx.commit()
+        .await
+        .map_err(|error| AppError::Dependency(format!("txn commit: {error}")))?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -352,6 +399,133 @@ struct StatementBreakdown {
     reconciliation_computed_net_payout: f64,
 }
 
+/// Line items and reconciliation totals captured when a statement is
+/// finalized.
+struct StatementSnapshot {
+    line_items: Vec<Value>,
+    gross_total: f64,
+    computed_net_payout: f64,
+}
+
+/// Breakdown for a draft statement, reused while none of
+/// `STATEMENT_SOURCE_TABLES` changes for the org. Repeat reads cost a
+/// lookup of the org's write-bumped table markers instead of the full rebuild.
+async fn cached_statement_breakdown(
+    state: &AppState,
+    pool: &sqlx::PgPool,
+    org_id: &str,
+    record: &Value,
+) -> AppResult<StatementSnapshot> {
+    let period_start = value_str(record, "period_start");
+    let period_end = value_str(record, "period_end");
+    let property_id = non_empty_opt(record.get("property_id").and_then(Value::as_str));
+    let unit_id = non_empty_opt(record.get("unit_id").and_then(Value::as_str));
+
+    let version = org_tables_version(pool, org_id, STATEMENT_SOURCE_TABLES).await?;
+    let cache_key = format!(
+        "owner_statement:{org_id}:{period_start}:{period_end}:{}:{}:{version}",
+        property_id.as_deref().unwrap_or_default(),
+        unit_id.as_deref().unwrap_or_default(),
+    );
+    let cached = state
+        .report_response_cache
+        .get_or_try_init(&cache_key, || async {
+            let breakdown = build_statement_breakdown(
+                pool,
+                org_id,
+                &period_start,
+                &period_end,
+                property_id.as_deref(),
+                unit_id.as_deref(),
+            )
+            .await?;
+            Ok(json!({
+                "line_items": breakdown.line_items,
+                "gross_total": breakdown.reconciliation_gross_total,
+                "computed_net_payout": breakdown.reconciliation_computed_net_payout,
+            }))
+        })
+        .await?;
+
+    Ok(StatementSnapshot {
+        line_items: cached
+            .get("line_items")
+            .and_then(Value::as_array)
+            .cloned()
+            .unwrap_or_default(),
+        gross_total: number_from_value(cached.get("gross_total")),
+        computed_net_payout: number_from_value(cached.get("computed_net_payout")),
+    })
+}
+
+fn reconciliation_json(gross_total: f64, computed_net_payout: f64, stored_net: f64) -> Value {
+    json!({
+        "gross_total": gross_total,
+        "computed_net_payout": computed_net_payout,
+        "stored_net_payout": stored_net,
+        "stored_vs_computed_diff": round2(stored_net - computed_net_payout),
+    })
+}
+
+async fn load_statement_snapshot(
+    pool: &sqlx::PgPool,
+    statement_id: &str,
+) -> AppResult<Option<StatementSnapshot>> {
+    let row: Option<(Value, f64, f64)> = sqlx::query_as(
+        "SELECT line_items, gross_total::float8, computed_net_payout::float8
+         FROM owner_statement_snapshots
+         WHERE statement_id = $1::uuid",
+    )
+    .bind(statement_id)
+    .fetch_optional(pool)
+    .await
+    .map_err(|error| {
+        tracing::error!(error = %error, "Database query failed");
+        AppError::from_database_error(&error, "External service request failed.")
+    })?;
+
+    Ok(row.map(
+        |(line_items, gross_total, computed_net_payout)| StatementSnapshot {
+            line_items: match line_items {
+                Value::Array(items) => items,
+                _ => Vec::new(),
+            },
+            gross_total,
+            computed_net_payout,
+        },
+    ))
+}
+
+async fn save_statement_snapshot(
+    conn: &mut sqlx::PgConnection,
+    organization_id: &str,
+    statement_id: &str,
+    snapshot: StatementSnapshot,
+) -> AppResult<()> {
+    sqlx::query(
+        "INSERT INTO owner_statement_snapshots
+            (statement_id, organization_id, line_items, gross_total, computed_net_payout)
+         VALUES ($1::uuid, $2::uuid, $3, $4, $5)
+         ON CONFLICT (statement_id) DO UPDATE SET
+            line_items = EXCLUDED.line_items,
+            gross_total = EXCLUDED.gross_total,
+            computed_net_payout = EXCLUDED.computed_net_payout,
+            created_at = now()",
+    )
+    .bind(statement_id)
+    .bind(organization_id)
+    .bind(Value::Array(snapshot.line_items))
+    .bind(snapshot.gross_total)
+    .bind(snapshot.computed_net_payout)
+    .execute(&mut *conn)
+    .await
+    .map_err(|error| {
+        tracing::error!(error = %error, "Database query failed");
+        AppError::from_database_error(&error, "External service request failed.")
+    })?;
+    Ok(())
+}
+
 async fn build_statement_breakdown(
     pool: &sqlx::PgPool,
     organization_id: &str,
@@ -478,7 +652,28 @@ async fn build_statement_breakdown(
         );
     }
 
-    let (reservations, mut expenses, leases) = tokio::try_join!(
+    // With a property scope, expenses booked against the property's units
+    // (but not the property itself) are fetched in the same round as the
+    // rest and merged below.
+    let expense_unit_filters = match (unit_scope.as_ref(), allowed_unit_ids.as_ref()) {
+        (None, Some(allowed)) if property_scope.is_some() && !allowed.is_empty() => {
+            Some(json_map(&[
+                (
+                    "organization_id",
+                    Value::String(organization_id.to_string()),
+                ),
+                (
+                    "unit_id",
+                    Value::Array(allowed.iter().cloned().map(Value::String).collect()),
+                ),
+                ("expense_date__gte", Value::String(start_iso.clone())),
+                ("expense_date__lte", Value::String(end_iso.clone())),
+            ]))
+        }
+        _ => None,
+    };
+
+    let (reservations, mut expenses, leases, expense_unit_rows) = tokio::try_join!(
         async {
             list_rows(
                 pool,
@@ -514,62 +709,57 @@ async fn build_statement_breakdown(
                 false,
             )
             .await
+        },
+        async {
+            match expense_unit_filters.as_ref() {
+                Some(filters) => {
+                    list_rows(
+                        pool,
+                        "expenses",
+                        Some(filters),
+                        5000,
+                        0,
+                        "expense_date",
+                        false,
+                    )
+                    .await
+                }
+                None => Ok(Vec::new()),
+            }
         }
     )?;
 
-    if unit_scope.is_none() {
-        if let (Some(property_scope_id), Some(allowed)) =
-            (property_scope.as_ref(), allowed_unit_ids.as_ref())
-        {
-            if !allowed.is_empty() {
-                let expense_unit_rows = list_rows(
-                    pool,
-                    "expenses",
-                    Some(&json_map(&[
-                        (
-                            "organization_id",
-                            Value::String(organization_id.to_string()),
-                        ),
-                        (
-                            "unit_id",
-                            Value::Array(allowed.iter().cloned().map(Value::String).collect()),
-                        ),
-                        ("expense_date__gte", Value::String(start_iso.clone())),
-                        ("expense_date__lte", Value::String(end_iso.clone())),
-                    ])),
-                    5000,
-                    0,
-                    "expense_date",
-                    false,
-                )
-                .await?;
-
-                let mut merged = std::collections::HashMap::new();
-                for row in expenses.drain(..).chain(expense_unit_rows.into_iter()) {
-                    let id = value_str(&row, "id");
-                    if id.is_empty() {
-                        continue;
-                    }
-                    let keep = row
-                        .as_object()
-                        .and_then(|obj| obj.get("property_id"))
-                        .and_then(Value::as_str)
-                        .is_some_and(|value| value == property_scope_id)
-                        || row
-                            .as_object()
-                            .and_then(|obj| obj.get("unit_id"))
-                            .and_then(Value::as_str)
-                            .is_some_and(|value| allowed.contains(value));
-                    if keep {
-                        merged.insert(id, row);
-                    }
-                }
-                expenses = merged.into_values().collect::<Vec<_>>();
+    if let (Some(_), Some(property_scope_id), Some(allowed)) = (
+        expense_unit_filters.as_ref(),
+        property_scope.as_ref(),
+        allowed_unit_ids.as_ref(),
+    ) {
+        let mut merged = std::collections::HashMap::new();
+        for row in expenses.drain(..).chain(expense_unit_rows.into_iter()) {
+            let id = value_str(&row, "id");
+            if id.is_empty() {
+                continue;
+            }
+            let keep = row
+                .as_object()
+                .and_then(|obj| obj.get("property_id"))
+                .and_then(Value::as_str)
+                .is_some_and(|value| value == property_scope_id)
+                || row
+                    .as_object()
+                    .and_then(|obj| obj.get("unit_id"))
+                    .and_then(Value::as_str)
+                    .is_some_and(|value| allowed.contains(value));
+            if keep {
+                merged.insert(id, row);
             }
         }
+        expenses = merged.into_values().collect::<Vec<_>>();
     }
 
-    let lease_index = leases
+    // Leases are only needed for their ids and the per-paid-lease platform
+    // fee, so keep just that instead of a copy of every lease row.
+    let lease_platform_fees = leases
         .iter()
         .filter_map(Value::as_object)
         .filter_map(|item| {
@@ -579,17 +769,53 @@ async fn build_statement_breakdown(
                 .map(str::trim)
                 .filter(|value| !value.is_empty())?
                 .to_string();
-            Some((lease_id, Value::Object(item.clone())))
+            Some((lease_id, number_from_obj(item, "platform_fee")))
         })
-        .collect::<std::collections::HashMap<String, Value>>();
-    let lease_ids = lease_index.keys().cloned().collect::<Vec<_>>();
+        .collect::<std::collections::HashMap<String, f64>>();
+    let lease_ids = lease_platform_fees.keys().cloned().collect::<Vec<_>>();
+
+    // Collections count on their paid date, falling back to the due date when
+    // paid_at is missing. Both cases are narrowed to the period in SQL; the
+    // paid_at window is padded a day either side so the timestamp's time zone
+    // cannot drop an edge row, and the loop below applies the exact bounds.
+    let collection_filters = |period: Vec<(&str, Value)>| {
+        let mut filters = json_map(&[
+            (
+                "organization_id",
+                Value::String(organization_id.to_string()),
+            ),
+            (
+                "lease_id",
+                Value::Array(lease_ids.iter().cloned().map(Value::String).collect()),
+            ),
+            ("status", Value::String("paid".to_string())),
+        ]);
+        for (key, value) in period {
+            filters.insert(key.to_string(), value);
+        }
+        filters
+    };
+    let paid_in_period = collection_filters(vec![
+        (
+            "paid_at__gte",
+            Value::String(format!("{}T00:00:00Z", start - chrono::Duration::days(1))),
+        ),
+        (
+            "paid_at__lt",
+            Value::String(format!("{}T00:00:00Z", end + chrono::Duration::days(2))),
+        ),
+    ]);
+    let due_in_period = collection_filters(vec![
+        ("paid_at__is_null", Value::Bool(true)),
+        ("due_date__gte", Value::String(start_iso.clone())),
+        ("due_date__lte", Value::String(end_iso.clone())),
+    ]);
 
     let (lease_charges, collections) = if lease_ids.is_empty() {
         (Vec::new(), Vec::new())
     } else {
         let lease_ids_for_charges = lease_ids.clone();
-        let lease_ids_for_collections = lease_ids.clone();
-        tokio::try_join!(
+        let (lease_charges, mut collections, unpaid_dated) = tokio::try_join!(
             async move {
                 list_rows(
                     pool,
@@ -628,35 +854,33 @@ async fn build_statement_breakdown(
                 )
                 .await
             },
-            async move {
+            async {
                 list_rows(
                     pool,
                     "collection_records",
-                    Some(&json_map(&[
-                        (
-                            "organization_id",
-                            Value::String(organization_id.to_string()),
-                        ),
-                        (
-                            "lease_id",
-                            Value::Array(
-                                lease_ids_for_collections
-                                    .iter()
-                                    .cloned()
-                                    .map(Value::String)
-                                    .collect(),
-                            ),
-                        ),
-                        ("status", Value::String("paid".to_string())),
-                    ])),
-                    std::cmp::max(4000, (lease_ids_for_collections.len() as i64) * 24),
+                    Some(&paid_in_period),
+                    std::cmp::max(4000, (lease_ids.len() as i64) * 24),
                     0,
                     "paid_at",
                     false,
                 )
                 .await
+            },
+            async {
+                list_rows(
+                    pool,
+                    "collection_records",
+                    Some(&due_in_period),
+                    std::cmp::max(4000, (lease_ids.len() as i64) * 24),
+                    0,
+                    "due_date",
+                    false,
+                )
+                .await
             }
-        )?
+        )?;
+        collections.extend(unpaid_dated);
+        (lease_charges, collections)
     };
 
     let mut line_items: Vec<Value> = Vec::new();
@@ -703,8 +927,8 @@ async fn build_statement_breakdown(
                 "source_table": "reservations",
                 "source_id": reservation_id,
                 "kind": "reservation_total",
-                "from": value_str_from_obj(res_obj, "check_in_date"),
-                "to": value_str_from_obj(res_obj, "check_out_date"),
+                "from": str_from_obj(res_obj, "check_in_date"),
+                "to": str_from_obj(res_obj, "check_out_date"),
                 "amount_pyg": round2(gross_amount),
             }));
         }
@@ -758,7 +982,7 @@ async fn build_statement_breakdown(
             "source_table": "expenses",
             "source_id": expense_id,
             "kind": fallback_str(expense_obj.get("category"), "expense"),
-            "date": value_str_from_obj(expense_obj, "expense_date"),
+            "date": str_from_obj(expense_obj, "expense_date"),
             "amount_pyg": round2(amount_pyg),
         }));
     }
@@ -769,7 +993,7 @@ async fn build_statement_breakdown(
         let Some(collection_obj) = collection.as_object() else {
             continue;
         };
-        if value_str_from_obj(collection_obj, "status") != "paid" {
+        if str_from_obj(collection_obj, "status") != "paid" {
             continue;
         }
 
@@ -833,8 +1057,8 @@ async fn build_statement_breakdown(
             continue;
         }
 
-        let charge_type = value_str_from_obj(charge_obj, "charge_type");
-        if !matches!(charge_type.as_str(), "service_fee_flat" | "admin_fee") {
+        let charge_type = str_from_obj(charge_obj, "charge_type");
+        if !matches!(charge_type, "service_fee_flat" | "admin_fee") {
             continue;
         }
 
@@ -853,19 +1077,17 @@ async fn build_statement_breakdown(
             "source_table": "lease_charges",
             "source_id": charge_id,
             "kind": charge_type,
-            "date": value_str_from_obj(charge_obj, "charge_date"),
+            "date": str_from_obj(charge_obj, "charge_date"),
             "amount_pyg": round2(amount_pyg),
         }));
     }
 
     let mut collection_fees = 0.0;
     for lease_id in paid_lease_ids {
-        let lease = lease_index
+        let platform_fee = lease_platform_fees
             .get(&lease_id)
-            .and_then(Value::as_object)
-            .cloned()
+            .copied()
             .unwrap_or_default();
-        let platform_fee = number_from_obj(&lease, "platform_fee");
         collection_fees += platform_fee;
         line_items.push(json!({
             "bucket": "collection_fees",
@@ -939,28 +1161,40 @@ fn parse_date(value: &str) -> AppResult<NaiveDate> {
 }
 
 fn expense_amount_pyg(expense: &Map<String, Value>) -> (f64, Option<String>) {
-    let currency = value_str_from_obj(expense, "currency").to_ascii_uppercase();
+    let currency = str_from_obj(expense, "currency");
     let amount = number_from_obj(expense, "amount");
-    if currency == "PYG" {
+    if currency.eq_ignore_ascii_case("PYG") {
         return (amount, None);
     }
-    if currency == "USD" {
+    if currency.eq_ignore_ascii_case("USD") {
         let fx_rate = number_from_obj(expense, "fx_rate_to_pyg");
         if fx_rate <= 0.0 {
             return (0.0, Some("missing_fx_rate_to_pyg".to_string()));
         }
         return (amount * fx_rate, None);
     }
-    (0.0, Some(format!("unsupported_currency:{currency}")))
+    (
+        0.0,
+        Some(format!(
+            "unsupported_currency:{}",
+            currency.to_ascii_uppercase()
+        )),
+    )
 }
 
 fn generic_amount_pyg(record: &Map<String, Value>, amount_key: &str) -> (f64, Option<String>) {
-    let currency = value_str_from_obj(record, "currency").to_ascii_uppercase();
+    let currency = str_from_obj(record, "currency");
     let amount = number_from_obj(record, amount_key);
-    if currency == "PYG" {
+    if currency.eq_ignore_ascii_case("PYG") {
         return (amount, None);
     }
-    (0.0, Some(format!("unsupported_currency:{currency}")))
+    (
+        0.0,
+        Some(format!(
+            "unsupported_currency:{}",
+            currency.to_ascii_uppercase()
+        )),
+    )
 }
 
 fn fallback_str(value: Option<&Value>, default: &str) -> String {
@@ -1174,6 +1408,15 @@ fn value_str(row: &Value, key: &str) -> String {
         .unwrap_or_default()
 }
 
+/// Trimmed string field, borrowed from the row; `""` when missing. For
+/// comparisons and values copied straight into a line item.
+fn str_from_obj<'a>(obj: &'a Map<String, Value>, key: &str) -> &'a str {
+    obj.get(key)
+        .and_then(Value::as_str)
+        .map(str::trim)
+        .unwrap_or_default()
+}
+
 fn value_str_from_obj(obj: &Map<String, Value>, key: &str) -> String {
     obj.get(key)
         .and_then(Value::as_str)
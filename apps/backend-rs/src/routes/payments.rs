@@ -16,7 +16,7 @@ use crate::{
         clamp_limit_in_range, CreatePaymentInstructionInput, PaymentInstructionPath,
         PaymentInstructionsQuery, PaymentReferencePath,
     },
-    services::{audit::write_audit_log, reconciliation},
+    services::{audit_queue::enqueue_audit_log, reconciliation},
     state::AppState,
     tenancy::{assert_org_member, assert_org_role},
 };
@@ -155,7 +155,7 @@ async fn create_payment_link(
     let created = create_row(pool, "payment_instructions", &record).await?;
     let entity_id = value_str(&created, "id");
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -10,7 +10,7 @@ use crate::{
     error::{AppError, AppResult},
     repository::table_service::{get_row, list_rows, update_row},
     schemas::clamp_limit_in_range,
-    services::audit::write_audit_log,
+    services::audit_queue::enqueue_audit_log,
     state::AppState,
 };
 
@@ -143,7 +143,7 @@ async fn suspend_org(
 
     let updated = update_row(pool, "organizations", &path.org_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&path.org_id),
         Some(&user_id),
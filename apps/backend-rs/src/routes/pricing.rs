@@ -17,7 +17,7 @@ use crate::{
         PricingTemplatesQuery, TemplatePath, UpdatePricingTemplateInput,
     },
     services::{
-        audit::write_audit_log,
+        audit_queue::enqueue_audit_log,
         pricing::{compute_pricing_totals, normalize_fee_lines},
     },
     state::AppState,
@@ -125,7 +125,7 @@ async fn create_pricing_template(
         set_default_template(pool, &payload.organization_id, &template_id).await?;
     }
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -197,7 +197,7 @@ async fn update_pricing_template(
         set_default_template(pool, &org_id, &path.template_id).await?;
     }
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -477,7 +477,7 @@ async fn update_pricing_recommendation(
 
     match result {
         Some(_) => {
-            write_audit_log(
+            enqueue_audit_log(
                 state.db_pool.as_ref(),
                 Some(&payload.org_id),
                 Some(&user_id),
@@ -724,7 +724,7 @@ async fn create_strategy(
 
     let data = strategy_row_to_json(&row);
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.org_id),
         Some(&user_id),
@@ -867,7 +867,7 @@ async fn update_strategy(
     match row {
         Some(r) => {
             let data = strategy_row_to_json(&r);
-            write_audit_log(
+            enqueue_audit_log(
                 state.db_pool.as_ref(),
                 Some(&payload.org_id),
                 Some(&user_id),
@@ -20,7 +20,7 @@ use crate::{
         PropertiesQuery, PropertyPath, UnitPath, UnitsQuery, UpdatePropertyInput, UpdateUnitInput,
     },
     services::{
-        audit::write_audit_log,
+        audit_queue::enqueue_audit_log,
         enrichment::enrich_units,
         plan_limits::{check_plan_limit, PlanResource},
     },
@@ -132,7 +132,7 @@ async fn create_property(
     normalize_property_payload_for_write(&mut record);
     let created = create_row(pool, "properties", &record).await?;
     let entity_id = value_str(&created, "id");
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -227,7 +227,7 @@ async fn update_property(
     let mut patch = remove_nulls(serialize_to_map(&payload));
     normalize_property_payload_for_write(&mut patch);
     let updated = update_row(pool, "properties", &path.property_id, &patch, "id").await?;
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -253,7 +253,7 @@ async fn delete_property(
     let org_id = value_str(&record, "organization_id");
     assert_org_role(&state, &user_id, &org_id, &["owner_admin"]).await?;
     let deleted = delete_row(pool, "properties", &path.property_id, "id").await?;
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -457,7 +457,7 @@ async fn bulk_update_units(
 
     let updated_count = updated_unit_ids.len() as i64;
     let failed_count = failures.len() as i64;
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -579,7 +579,7 @@ async fn create_unit(
     sync_unit_hierarchy_dual_write(pool, &created, true, true).await?;
 
     let entity_id = value_str(&created, "id");
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -631,7 +631,7 @@ async fn update_unit(
         sync_unit_hierarchy_dual_write(pool, &updated, sync_floor, sync_beds).await?;
     }
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -660,7 +660,7 @@ async fn delete_unit(
     assert_org_role(&state, &user_id, &org_id, &["owner_admin"]).await?;
     let deleted = delete_row(pool, "units", &path.unit_id, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -1627,7 +1627,7 @@ async fn bulk_import_properties(
         }
     }
 
-    write_audit_log(
+    enqueue_audit_log(
         Some(pool),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -9,7 +9,7 @@ use crate::{
         UpdateReservationInput,
     },
     services::{
-        audit::write_audit_log,
+        audit_queue::enqueue_audit_log,
         enrichment::enrich_reservations,
         reservations::{build_reservation_detail_overview, build_reservations_overview},
         sequences::enroll_in_sequences,
@@ -242,7 +242,7 @@ async fn create_reservation(
     let created = create_row(pool, "reservations", &record).await?;
     let entity_id = value_str(&created, "id");
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -308,7 +308,7 @@ async fn update_reservation(
     let patch = remove_nulls(serialize_to_map(&payload));
     let updated = update_row(pool, "reservations", &path.reservation_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -359,7 +359,7 @@ async fn transition_status(
 
     let updated = update_row(pool, "reservations", &path.reservation_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -979,7 +979,7 @@ async fn refund_deposit(
 
     let updated = update_row(pool, "reservations", &path.reservation_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -1245,7 +1245,7 @@ async fn add_reservation_guest(
 
     let created = create_row(pool, "reservation_guests", &record).await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -1286,7 +1286,7 @@ async fn remove_reservation_guest(
 
     let deleted = delete_row(pool, "reservation_guests", &path.reservation_guest_id, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -11,7 +11,7 @@ use crate::{
     error::{AppError, AppResult},
     repository::table_service::{create_row, get_row, list_rows, update_row},
     schemas::clamp_limit_in_range,
-    services::audit::write_audit_log,
+    services::audit_queue::enqueue_audit_log,
     state::AppState,
     tenancy::{assert_org_member, assert_org_role},
 };
@@ -251,7 +251,7 @@ async fn subscribe(
 
         let updated = update_row(pool, "org_subscriptions", &sub_id, &patch, "id").await?;
 
-        write_audit_log(
+        enqueue_audit_log(
             state.db_pool.as_ref(),
             Some(&payload.organization_id),
             Some(&user_id),
@@ -303,7 +303,7 @@ async fn subscribe(
     let created = create_row(pool, "org_subscriptions", &record).await?;
     let entity_id = val_str(&created, "id");
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -365,7 +365,7 @@ async fn cancel_subscription(
 
     let updated = update_row(pool, "org_subscriptions", &sub_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.org_id),
         Some(&user_id),
@@ -17,7 +17,7 @@ use crate::{
         CreateTaskItemInput, TaskItemPath, TaskItemsQuery, TaskPath, TasksQuery, UpdateTaskInput,
         UpdateTaskItemInput,
     },
-    services::{audit::write_audit_log, enrichment::enrich_tasks, workflows::fire_trigger},
+    services::{audit_queue::enqueue_audit_log, enrichment::enrich_tasks, workflows::fire_trigger},
     state::AppState,
     tenancy::{assert_org_member, assert_org_role},
 };
@@ -119,7 +119,7 @@ async fn create_task(
     let created = create_row(pool, "tasks", &record).await?;
     let entity_id = value_str(&created, "id");
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -183,7 +183,7 @@ async fn update_task(
         .await;
     }
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -297,7 +297,7 @@ async fn complete_task(
         .await;
     }
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -381,7 +381,7 @@ async fn create_task_item(
     let created = create_row(pool, "task_items", &record).await?;
     let entity_id = value_str(&created, "id");
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -455,7 +455,7 @@ async fn update_task_item(
 
     let updated = update_row(pool, "task_items", &path.item_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -491,7 +491,7 @@ async fn delete_task_item(
 
     let deleted = delete_row(pool, "task_items", &path.item_id, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
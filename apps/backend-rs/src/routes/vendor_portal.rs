@@ -390,7 +390,7 @@ async fn update_job(
     update_row(pool, "tasks", &path.task_id, &patch, "id").await?;
 
     // Write audit log
-    crate::services::audit::write_audit_log(
+    crate::services::audit_queue::enqueue_audit_log(
         Some(pool),
         Some(&org_id),
         None,
@@ -433,7 +433,7 @@ async fn accept_job(
 
     update_row(pool, "tasks", &path.task_id, &patch, "id").await?;
 
-    crate::services::audit::write_audit_log(
+    crate::services::audit_queue::enqueue_audit_log(
         Some(pool),
         Some(&org_id),
         None,
@@ -483,7 +483,7 @@ async fn complete_job(
     update_row(pool, "tasks", &path.task_id, &patch, "id").await?;
 
     // Notify org via audit log
-    crate::services::audit::write_audit_log(
+    crate::services::audit_queue::enqueue_audit_log(
         Some(pool),
         Some(&org_id),
         None,
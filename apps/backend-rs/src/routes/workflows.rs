@@ -12,7 +12,7 @@ use crate::{
     error::{AppError, AppResult},
     repository::table_service::{create_row, delete_row, get_row, list_rows, update_row},
     schemas::clamp_limit_in_range,
-    services::{audit::write_audit_log, workflows::process_workflow_jobs},
+    services::{audit_queue::enqueue_audit_log, workflows::process_workflow_jobs},
     state::AppState,
     tenancy::{assert_org_member, assert_org_role},
 };
@@ -434,7 +434,7 @@ async fn create_workflow_rule(
     let created = create_row(pool, "workflow_rules", &record).await?;
     let entity_id = val_str(&created, "id");
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&payload.organization_id),
         Some(&user_id),
@@ -488,7 +488,7 @@ async fn update_workflow_rule(
 
     let updated = update_row(pool, "workflow_rules", &path.rule_id, &patch, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
@@ -517,7 +517,7 @@ async fn delete_workflow_rule(
 
     delete_row(pool, "workflow_rules", &path.rule_id, "id").await?;
 
-    write_audit_log(
+    enqueue_audit_log(
         state.db_pool.as_ref(),
         Some(&org_id),
         Some(&user_id),
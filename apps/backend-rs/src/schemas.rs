@@ -417,9 +417,12 @@ pub fn serialize_to_map<T>(value: &T) -> serde_json::Map<String, serde_json::Val
 where
     T: serde::Serialize,
 {
-    let json = serde_json::to_value(value)
-        .unwrap_or_else(|_| serde_json::Value::Object(serde_json::Map::new()));
-    json.as_object().cloned().unwrap_or_default()
+    // Take the map out of the serialized value rather than cloning it; this
+    // runs on every create/update payload.
+    match serde_json::to_value(value) {
+        Ok(serde_json::Value::Object(map)) => map,
+        _ => serde_json::Map::new(),
+    }
 }
 
 pub fn remove_nulls(
@@ -963,6 +966,8 @@ pub struct ExpensesQuery {
     pub unit_id: Option<String>,
     pub reservation_id: Option<String>,
     pub approval_status: Option<String>,
+    /// `next_cursor` from the previous page (`<expense_date>|<id>`).
+    pub cursor: Option<String>,
     #[serde(default = "default_limit_300")]
     pub limit: i64,
 }
@@ -978,6 +983,15 @@ pub struct CollectionsQuery {
     pub limit: i64,
 }
 
+/// Query flags shared by lease and expense write endpoints.
+#[derive(Debug, Clone, Deserialize, serde::Serialize)]
+pub struct WriteResponseQuery {
+    /// Decorate the returned record with lookup fields (names, stats).
+    /// Pass `enrich=false` when only the stored row is needed.
+    #[serde(default = "default_true")]
+    pub enrich: bool,
+}
+
 #[derive(Debug, Clone, Deserialize, serde::Serialize)]
 pub struct LeasesQuery {
     pub org_id: String,
@@ -986,6 +1000,9 @@ pub struct LeasesQuery {
     pub unit_id: Option<String>,
     pub space_id: Option<String>,
     pub bed_id: Option<String>,
+    /// Comma-separated enrichments to run (`property`, `unit`, `space`,
+    /// `bed`, `collections`, `documents`, `renewal`). All when absent.
+    pub include: Option<String>,
     #[serde(default = "default_limit_300")]
     pub limit: i64,
 }
@@ -1489,6 +1506,8 @@ pub struct PublicListingsQuery {
     pub min_bathrooms: Option<f64>,
     pub max_lease_months: Option<i32>,
     pub org_id: Option<String>,
+    /// `next_cursor` from the previous page (`<published_at>|<id>`).
+    pub cursor: Option<String>,
     #[serde(default = "default_limit_60")]
     pub limit: i64,
 }
@@ -2,6 +2,7 @@ use serde_json::{json, Map, Value};
 use sqlx::Row;
 
 use crate::{
+    cache::org_key,
     error::{AppError, AppResult},
     services::{agent_runtime_v2::RuntimeExecutionIds, agent_specs::get_agent_spec},
     state::AppState,
@@ -29,33 +30,50 @@ pub async fn list_agents(state: &AppState, org_id: &str) -> AppResult<Vec<Value>
         return Err(AppError::BadRequest("org_id is required.".to_string()));
     }
 
-    let pool = db_pool(state)?;
-    let rows = sqlx::query(
-        "SELECT row_to_json(t) AS row FROM (
-            SELECT
-              a.id,
-              a.slug,
-              a.name,
-              a.description,
-              a.icon_key,
-              COALESCE(o.is_active, a.is_active) AS is_active
-            FROM ai_agents a
-            LEFT JOIN agent_runtime_overrides o
-              ON o.organization_id = $1::uuid
-             AND o.agent_slug = a.slug
-            WHERE COALESCE(o.is_active, a.is_active) = TRUE
-            ORDER BY name ASC
-        ) t",
-    )
-    .bind(org_id)
-    .fetch_all(pool)
-    .await
-    .map_err(|error| db_error(state, &error))?;
+    let cached = state
+        .agent_config_cache
+        .get_or_try_init(&agent_list_cache_key(org_id), || async {
+            let pool = db_pool(state)?;
+            let rows = sqlx::query(
+                "SELECT row_to_json(t) AS row FROM (
+                    SELECT
+                      a.id,
+                      a.slug,
+                      a.name,
+                      a.description,
+                      a.icon_key,
+                      COALESCE(o.is_active, a.is_active) AS is_active
+                    FROM ai_agents a
+                    LEFT JOIN agent_runtime_overrides o
+                      ON o.organization_id = $1::uuid
+                     AND o.agent_slug = a.slug
+                    WHERE COALESCE(o.is_active, a.is_active) = TRUE
+                    ORDER BY name ASC
+                ) t",
+            )
+            .bind(org_id)
+            .fetch_all(pool)
+            .await
+            .map_err(|error| db_error(state, &error))?;
+
+            Ok(Value::Array(
+                rows.into_iter()
+                    .filter_map(|row| row.try_get::<Option<Value>, _>("row").ok().flatten())
+                    .collect(),
+            ))
+        })
+        .await?;
 
-    Ok(rows
-        .into_iter()
-        .filter_map(|row| row.try_get::<Option<Value>, _>("row").ok().flatten())
-        .collect())
+    Ok(match cached {
+        Value::Array(items) => items,
+        _ => Vec::new(),
+    })
+}
+
+/// Key under which `list_agents` caches an org's active agent list in
+/// `agent_config_cache`. Invalidate it whenever agent overrides change.
+pub fn agent_list_cache_key(org_id: &str) -> String {
+    org_key(org_id, "agent_list")
 }
 
 pub fn list_models(state: &AppState) -> Vec<Value> {
@@ -8351,6 +8351,11 @@ mod tests {
                 std::time::Duration::from_secs(60),
             ),
             fx_cache: CacheLayer::new("fx", 10, std::time::Duration::from_secs(3600)),
+            auth_user_cache: CacheLayer::new(
+                "auth_user",
+                1000,
+                std::time::Duration::from_secs(300),
+            ),
         }
     }
 
@@ -2,25 +2,20 @@ use chrono::Utc;
 use serde_json::{Map, Value};
 use sqlx::PgPool;
 
-pub async fn write_analytics_event(
-    pool: Option<&PgPool>,
+/// Build the `integration_events` row for an analytics event. Returns `None`
+/// when the organization or event type is missing.
+pub fn build_analytics_event_record(
     organization_id: Option<&str>,
     event_type: &str,
     payload: Option<Value>,
-) {
-    let Some(org_id) = organization_id
+) -> Option<Map<String, Value>> {
+    let org_id = organization_id
         .map(str::trim)
-        .filter(|value| !value.is_empty())
-    else {
-        return;
-    };
+        .filter(|value| !value.is_empty())?;
     let event_name = event_type.trim();
     if event_name.is_empty() {
-        return;
+        return None;
     }
-    let Some(pool) = pool else {
-        return;
-    };
 
     let mut record = Map::new();
     record.insert(
@@ -44,6 +39,31 @@ pub async fn write_analytics_event(
         "processed_at".to_string(),
         Value::String(Utc::now().to_rfc3339()),
     );
+    Some(record)
+}
 
-    let _ = crate::repository::table_service::create_row(pool, "integration_events", &record).await;
+/// Insert a batch of prepared `integration_events` rows in one statement,
+/// falling back to row-by-row inserts when the batch is rejected.
+pub async fn write_analytics_events_bulk(pool: &PgPool, records: &[Map<String, Value>]) {
+    if records.is_empty() {
+        return;
+    }
+    let Err(error) =
+        crate::repository::table_service::create_rows_bulk(pool, "integration_events", records)
+            .await
+    else {
+        return;
+    };
+    tracing::warn!(
+        count = records.len(),
+        error = %error,
+        "Analytics event batch failed; retrying rows individually"
+    );
+    for record in records {
+        if let Err(error) =
+            crate::repository::table_service::create_row(pool, "integration_events", record).await
+        {
+            tracing::warn!(error = %error, "Failed to write analytics event");
+        }
+    }
 }
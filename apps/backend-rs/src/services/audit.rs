@@ -1,9 +1,9 @@
 use serde_json::{Map, Value};
 use sqlx::PgPool;
 
-#[allow(clippy::too_many_arguments)]
-pub async fn write_audit_log(
-    pool: Option<&PgPool>,
+/// Build an `audit_logs` row. Returns `None` when the entry has no
+/// organization to attach to.
+pub fn build_audit_log_record(
     organization_id: Option<&str>,
     actor_user_id: Option<&str>,
     action: &str,
@@ -11,7 +11,7 @@ pub async fn write_audit_log(
     entity_id: Option<&str>,
     before_state: Option<Value>,
     after_state: Option<Value>,
-) {
+) -> Option<Map<String, Value>> {
     let Some(org_id) = organization_id
         .map(str::trim)
         .filter(|value| !value.is_empty())
@@ -21,15 +21,7 @@ pub async fn write_audit_log(
             entity_name = entity_name,
             "Audit log skipped: missing organization_id"
         );
-        return;
-    };
-    let Some(pool) = pool else {
-        tracing::debug!(
-            action = action,
-            entity_name = entity_name,
-            "Audit log skipped: no database pool"
-        );
-        return;
+        return None;
     };
 
     let mut payload = Map::new();
@@ -63,15 +55,31 @@ pub async fn write_audit_log(
     if let Some(after) = after_state {
         payload.insert("after_state".to_string(), after);
     }
+    Some(payload)
+}
 
-    if let Err(error) =
-        crate::repository::table_service::create_row(pool, "audit_logs", &payload).await
-    {
-        tracing::error!(
-            action = action,
-            entity_name = entity_name,
-            error = %error,
-            "Failed to write audit log"
-        );
+/// Insert a batch of prepared `audit_logs` rows in one statement. When the
+/// batch is rejected, the rows are retried one by one so a single bad row
+/// only loses itself.
+pub async fn write_audit_logs_bulk(pool: &PgPool, records: &[Map<String, Value>]) {
+    if records.is_empty() {
+        return;
+    }
+    let Err(error) =
+        crate::repository::table_service::create_rows_bulk(pool, "audit_logs", records).await
+    else {
+        return;
+    };
+    tracing::warn!(
+        count = records.len(),
+        error = %error,
+        "Audit log batch failed; retrying rows individually"
+    );
+    for record in records {
+        if let Err(error) =
+            crate::repository::table_service::create_row(pool, "audit_logs", record).await
+        {
+            tracing::error!(error = %error, "Failed to write audit log");
+        }
     }
 }
@@ -0,0 +1,252 @@
+//! Buffered writer for audit logs and analytics events.
+//!
+//! Handlers enqueue rows and return immediately; a background task drains the
+//! queue and flushes each table with one multi-row `INSERT` whenever
+//! `AUDIT_BUFFER_SIZE` rows are pending or every `AUDIT_BUFFER_TIME_SECONDS`.
+//! When the writer is not running the enqueue helpers fall back to writing
+//! inline, so callers never need to know which mode is active.
+//!
+//! The queue is bounded by `AUDIT_QUEUE_CAPACITY`. When it is full new entries
+//! are dropped rather than making the request wait on the audit sink; drops
+//! are counted and reported by `/health/audit-queue`.
+
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::OnceLock;
+use std::time::Duration;
+
+use chrono::Utc;
+use serde_json::{json, Map, Value};
+use sqlx::PgPool;
+use tokio::sync::{mpsc, oneshot};
+
+use crate::{
+    config::AppConfig,
+    services::{
+        analytics::{build_analytics_event_record, write_analytics_events_bulk},
+        audit::{build_audit_log_record, write_audit_logs_bulk},
+    },
+};
+
+enum QueueMessage {
+    AuditLog(Map<String, Value>),
+    AnalyticsEvent(Map<String, Value>),
+    Flush(oneshot::Sender<()>),
+}
+
+static AUDIT_QUEUE: OnceLock<mpsc::Sender<QueueMessage>> = OnceLock::new();
+
+const DROP_WARNING_INTERVAL_SECONDS: u64 = 5;
+
+static ENQUEUED_TOTAL: AtomicU64 = AtomicU64::new(0);
+static DROPPED_QUEUE_FULL_TOTAL: AtomicU64 = AtomicU64::new(0);
+static LAST_DROP_WARNING_AT: AtomicU64 = AtomicU64::new(0);
+
+/// Start the background writer. Safe to call once per process; later calls
+/// are ignored.
+pub fn spawn_writer(pool: PgPool, config: &AppConfig) {
+    let (sender, receiver) = mpsc::channel(config.audit_queue_capacity.max(1));
+    if AUDIT_QUEUE.set(sender).is_err() {
+        tracing::warn!("Audit queue writer already running");
+        return;
+    }
+    let buffer_size = config.audit_buffer_size.max(1);
+    let buffer_time = Duration::from_secs(config.audit_buffer_time_seconds.max(1));
+    tokio::spawn(run_writer(pool, receiver, buffer_size, buffer_time));
+}
+
+/// Flush everything queued so far. Called during graceful shutdown.
+pub async fn flush() {
+    let Some(sender) = AUDIT_QUEUE.get() else {
+        return;
+    };
+    let (ack, done) = oneshot::channel();
+    if sender.send(QueueMessage::Flush(ack)).await.is_err() {
+        return;
+    }
+    if tokio::time::timeout(Duration::from_secs(5), done)
+        .await
+        .is_err()
+    {
+        tracing::warn!("Timed out flushing audit queue on shutdown");
+    }
+}
+
+/// Queue counters since process start, for the health endpoint.
+pub fn stats() -> Value {
+    let (queued, capacity) = AUDIT_QUEUE
+        .get()
+        .map(|sender| {
+            (
+                sender.max_capacity() - sender.capacity(),
+                sender.max_capacity(),
+            )
+        })
+        .unwrap_or((0, 0));
+    json!({
+        "running": AUDIT_QUEUE.get().is_some(),
+        "queued": queued,
+        "capacity": capacity,
+        "enqueued_total": ENQUEUED_TOTAL.load(Ordering::Relaxed),
+        "dropped_total": {
+            "queue_full": DROPPED_QUEUE_FULL_TOTAL.load(Ordering::Relaxed),
+        },
+    })
+}
+
+/// Queue an audit log entry. Nothing is written without a pool or an
+/// organization id.
+#[allow(clippy::too_many_arguments)]
+pub async fn enqueue_audit_log(
+    pool: Option<&PgPool>,
+    organization_id: Option<&str>,
+    actor_user_id: Option<&str>,
+    action: &str,
+    entity_name: &str,
+    entity_id: Option<&str>,
+    before_state: Option<Value>,
+    after_state: Option<Value>,
+) {
+    let Some(pool) = pool else {
+        return;
+    };
+    let Some(mut record) = build_audit_log_record(
+        organization_id,
+        actor_user_id,
+        action,
+        entity_name,
+        entity_id,
+        before_state,
+        after_state,
+    ) else {
+        return;
+    };
+    // Stamp the event time now so batching does not reorder the log.
+    record.insert(
+        "created_at".to_string(),
+        Value::String(Utc::now().to_rfc3339()),
+    );
+
+    if let Some(QueueMessage::AuditLog(record)) = send(QueueMessage::AuditLog(record)).await {
+        write_audit_logs_bulk(pool, std::slice::from_ref(&record)).await;
+    }
+}
+
+/// Queue an analytics event. Nothing is written without a pool, an
+/// organization id or an event type.
+pub async fn enqueue_analytics_event(
+    pool: Option<&PgPool>,
+    organization_id: Option<&str>,
+    event_type: &str,
+    payload: Option<Value>,
+) {
+    let Some(pool) = pool else {
+        return;
+    };
+    let Some(mut record) = build_analytics_event_record(organization_id, event_type, payload)
+    else {
+        return;
+    };
+    record.insert(
+        "created_at".to_string(),
+        Value::String(Utc::now().to_rfc3339()),
+    );
+
+    if let Some(QueueMessage::AnalyticsEvent(record)) =
+        send(QueueMessage::AnalyticsEvent(record)).await
+    {
+        write_analytics_events_bulk(pool, std::slice::from_ref(&record)).await;
+    }
+}
+
+/// Hand a message to the writer without waiting. Returns it back when the
+/// writer is not running so the caller can write inline instead; drops it
+/// when the queue is full.
+async fn send(message: QueueMessage) -> Option<QueueMessage> {
+    let Some(sender) = AUDIT_QUEUE.get() else {
+        return Some(message);
+    };
+    match sender.try_send(message) {
+        Ok(()) => {
+            ENQUEUED_TOTAL.fetch_add(1, Ordering::Relaxed);
+            None
+        }
+        Err(mpsc::error::TrySendError::Full(_)) => {
+            record_drop();
+            None
+        }
+        Err(mpsc::error::TrySendError::Closed(message)) => Some(message),
+    }
+}
+
+fn record_drop() {
+    let dropped = DROPPED_QUEUE_FULL_TOTAL.fetch_add(1, Ordering::Relaxed) + 1;
+    let now = Utc::now().timestamp().max(0) as u64;
+    let last = LAST_DROP_WARNING_AT.load(Ordering::Relaxed);
+    if now.saturating_sub(last) >= DROP_WARNING_INTERVAL_SECONDS
+        && LAST_DROP_WARNING_AT
+            .compare_exchange(last, now, Ordering::Relaxed, Ordering::Relaxed)
+            .is_ok()
+    {
+        tracing::warn!(
+            dropped_total = dropped,
+            "Audit queue full; dropping audit and analytics events"
+        );
+    }
+}
+
+async fn run_writer(
+    pool: PgPool,
+    mut receiver: mpsc::Receiver<QueueMessage>,
+    buffer_size: usize,
+    buffer_time: Duration,
+) {
+    let mut audit_logs: Vec<Map<String, Value>> = Vec::with_capacity(buffer_size);
+    let mut analytics_events: Vec<Map<String, Value>> = Vec::with_capacity(buffer_size);
+    let mut ticker = tokio::time::interval(buffer_time);
+    ticker.set_missed_tick_behavior(tokio::time::MissedTickBehavior::Delay);
+
+    loop {
+        tokio::select! {
+            message = receiver.recv() => match message {
+                Some(QueueMessage::AuditLog(record)) => {
+                    audit_logs.push(record);
+                    if audit_logs.len() >= buffer_size {
+                        flush_batch(&pool, &mut audit_logs, &mut analytics_events).await;
+                    }
+                }
+                Some(QueueMessage::AnalyticsEvent(record)) => {
+                    analytics_events.push(record);
+                    if analytics_events.len() >= buffer_size {
+                        flush_batch(&pool, &mut audit_logs, &mut analytics_events).await;
+                    }
+                }
+                Some(QueueMessage::Flush(ack)) => {
+                    flush_batch(&pool, &mut audit_logs, &mut analytics_events).await;
+                    let _ = ack.send(());
+                }
+                None => {
+                    flush_batch(&pool, &mut audit_logs, &mut analytics_events).await;
+                    break;
+                }
+            },
+            _ = ticker.tick() => {
+                flush_batch(&pool, &mut audit_logs, &mut analytics_events).await;
+            }
+        }
+    }
+}
+
+async fn flush_batch(
+    pool: &PgPool,
+    audit_logs: &mut Vec<Map<String, Value>>,
+    analytics_events: &mut Vec<Map<String, Value>>,
+) {
+    if !audit_logs.is_empty() {
+        write_audit_logs_bulk(pool, audit_logs).await;
+        audit_logs.clear();
+    }
+    if !analytics_events.is_empty() {
+        write_analytics_events_bulk(pool, analytics_events).await;
+        analytics_events.clear();
+    }
+}
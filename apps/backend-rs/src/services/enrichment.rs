@@ -92,6 +92,69 @@ pub async fn cached_unit_maps(
     Ok((names, property_map))
 }
 
+/// Cache key for one listing's `{id, title, monthly_recurring_total}`
+/// snapshot. Invalidate it when a listing's title or pricing changes.
+pub fn listing_context_cache_key(listing_id: &str) -> String {
+    format!("listing_context:{listing_id}")
+}
+
+/// Listing snapshots for application enrichment. Serves hot ids from
+/// `enrichment_cache` and only queries the ids that are missing.
+pub async fn cached_listing_context(
+    state: &AppState,
+    pool: &PgPool,
+    listing_ids: &[String],
+) -> AppResult<Vec<Value>> {
+    let mut snapshots = Vec::with_capacity(listing_ids.len());
+    let mut missing = Vec::new();
+    for listing_id in listing_ids {
+        match state
+            .enrichment_cache
+            .get(&listing_context_cache_key(listing_id))
+            .await
+        {
+            Some(snapshot) => snapshots.push(snapshot),
+            None => missing.push(Value::String(listing_id.clone())),
+        }
+    }
+    if missing.is_empty() {
+        return Ok(snapshots);
+    }
+
+    let limit = std::cmp::max(200, missing.len() as i64);
+    let mut filters = Map::new();
+    filters.insert("id".to_string(), Value::Array(missing));
+    let rows = list_rows(
+        pool,
+        "listings",
+        Some(&filters),
+        limit,
+        0,
+        "created_at",
+        false,
+    )
+    .await?;
+    for row in rows {
+        let Some(listing_id) = value_string(row.get("id")) else {
+            continue;
+        };
+        let snapshot = json!({
+            "id": listing_id,
+            "title": row.get("title").cloned().unwrap_or(Value::Null),
+            "monthly_recurring_total": row
+                .get("monthly_recurring_total")
+                .cloned()
+                .unwrap_or(Value::Null),
+        });
+        state
+            .enrichment_cache
+            .insert(listing_context_cache_key(&listing_id), snapshot.clone())
+            .await;
+        snapshots.push(snapshot);
+    }
+    Ok(snapshots)
+}
+
 /// Convenience: fetch all three enrichment maps (unit names, unit→property, property names).
 async fn cached_enrichment_maps(
     state: &AppState,
@@ -1,13 +1,14 @@
 use serde_json::Value;
 
-use crate::state::AppState;
+use crate::{error::AppError, state::AppState};
 
 /// Default fallback rate if no external API is reachable.
 const FALLBACK_USD_PYG: f64 = 7500.0;
 
 const FX_CACHE_KEY: &str = "usd_pyg_latest";
 
-/// Get USD→PYG rate for a specific date (no caching, used for expense enrichment).
+/// Get USD→PYG rate for a specific date, uncached. Callers should prefer
+/// `get_cached_usd_to_pyg_rate`.
 pub async fn get_usd_to_pyg_rate(http_client: &reqwest::Client, value_date: &str) -> Option<f64> {
     let day = value_date.trim();
     if day.is_empty() {
@@ -37,6 +38,28 @@ pub async fn get_usd_to_pyg_rate(http_client: &reqwest::Client, value_date: &str
     None
 }
 
+/// `get_usd_to_pyg_rate` memoized per day in `state.fx_cache`, so expenses
+/// sharing a date only reach the external API once. Failed lookups are not
+/// cached.
+pub async fn get_cached_usd_to_pyg_rate(state: &AppState, value_date: &str) -> Option<f64> {
+    let day = value_date.trim();
+    if day.is_empty() {
+        return None;
+    }
+
+    state
+        .fx_cache
+        .get_or_try_init(&format!("usd_pyg:{day}"), || async {
+            get_usd_to_pyg_rate(&state.http_client, day)
+                .await
+                .map(|rate| serde_json::json!(rate))
+                .ok_or_else(|| AppError::Dependency("USD to PYG rate is unavailable.".to_string()))
+        })
+        .await
+        .ok()
+        .and_then(|value| value.as_f64())
+}
+
 /// Get the latest USD→PYG rate with in-memory caching (1-hour TTL via `state.fx_cache`).
 /// Uses `get_or_try_init` for thundering-herd protection on cold starts.
 /// Falls back to hardcoded rate if all external APIs are unreachable.
@@ -17,6 +17,16 @@ pub fn value_str(row: &Value, key: &str) -> String {
         .unwrap_or_default()
 }
 
+/// Borrowing `value_str` for per-row loops that only compare or look up the
+/// value and would otherwise allocate a String for every row.
+pub fn value_str_ref<'a>(row: &'a Value, key: &str) -> &'a str {
+    row.as_object()
+        .and_then(|obj| obj.get(key))
+        .and_then(Value::as_str)
+        .map(str::trim)
+        .unwrap_or_default()
+}
+
 pub fn json_map(entries: &[(&str, Value)]) -> Map<String, Value> {
     let mut map = Map::new();
     for (key, value) in entries {
@@ -4,7 +4,7 @@ use sqlx::PgPool;
 
 use crate::{
     error::{AppError, AppResult},
-    repository::table_service::{create_row, list_rows},
+    repository::table_service::{create_rows_bulk, list_rows},
     services::json_helpers::round2,
 };
 
@@ -94,87 +94,95 @@ pub async fn ensure_monthly_lease_schedule(
         }
     }
 
-    let mut created_charges = Vec::new();
-    let mut created_collections = Vec::new();
-    let mut first_collection: Option<Value> = None;
-
-    for (index, due_date) in due_dates.iter().enumerate() {
+    // Insert every missing charge in one statement, then every missing
+    // collection (which needs the charge ids) in a second one.
+    let mut charge_payloads = Vec::new();
+    for due_date in &due_dates {
         let due_iso = due_date.to_string();
+        if existing_charge_by_due.contains_key(&due_iso) {
+            continue;
+        }
+        let mut payload = Map::new();
+        payload.insert(
+            "organization_id".to_string(),
+            Value::String(organization_id.to_string()),
+        );
+        payload.insert("lease_id".to_string(), Value::String(lease_id.to_string()));
+        payload.insert("charge_date".to_string(), Value::String(due_iso.clone()));
+        payload.insert(
+            "charge_type".to_string(),
+            Value::String("monthly_rent".to_string()),
+        );
+        payload.insert(
+            "description".to_string(),
+            Value::String(format!("Recurring monthly lease charge ({due_iso})")),
+        );
+        payload.insert("amount".to_string(), json!(round2(amount)));
+        payload.insert("currency".to_string(), Value::String(currency.to_string()));
+        payload.insert("status".to_string(), Value::String("scheduled".to_string()));
+        charge_payloads.push(payload);
+    }
+    let created_charges = create_rows_bulk(pool, "lease_charges", &charge_payloads).await?;
+    for charge in &created_charges {
+        if let Some(charge_date) = charge
+            .as_object()
+            .and_then(|obj| value_str(obj.get("charge_date")))
+        {
+            existing_charge_by_due.insert(charge_date.to_string(), charge.clone());
+        }
+    }
 
-        let charge = if let Some(existing) = existing_charge_by_due.get(&due_iso).cloned() {
-            existing
-        } else {
-            let mut payload = Map::new();
-            payload.insert(
-                "organization_id".to_string(),
-                Value::String(organization_id.to_string()),
-            );
-            payload.insert("lease_id".to_string(), Value::String(lease_id.to_string()));
-            payload.insert("charge_date".to_string(), Value::String(due_iso.clone()));
-            payload.insert(
-                "charge_type".to_string(),
-                Value::String("monthly_rent".to_string()),
-            );
-            payload.insert(
-                "description".to_string(),
-                Value::String(format!("Recurring monthly lease charge ({due_iso})")),
-            );
-            payload.insert("amount".to_string(), json!(round2(amount)));
-            payload.insert("currency".to_string(), Value::String(currency.to_string()));
-            payload.insert("status".to_string(), Value::String("scheduled".to_string()));
-
-            let created = create_row(pool, "lease_charges", &payload).await?;
-            existing_charge_by_due.insert(due_iso.clone(), created.clone());
-            created_charges.push(created.clone());
-            created
-        };
-
-        let collection = if let Some(existing) = existing_collection_by_due.get(&due_iso).cloned() {
-            existing
-        } else {
-            let mut payload = Map::new();
-            payload.insert(
-                "organization_id".to_string(),
-                Value::String(organization_id.to_string()),
-            );
-            payload.insert("lease_id".to_string(), Value::String(lease_id.to_string()));
-            if let Some(charge_id) = charge
-                .as_object()
-                .and_then(|obj| obj.get("id"))
-                .and_then(Value::as_str)
-                .map(str::trim)
-                .filter(|value| !value.is_empty())
-            {
-                payload.insert(
-                    "lease_charge_id".to_string(),
-                    Value::String(charge_id.to_string()),
-                );
-            }
-            payload.insert("due_date".to_string(), Value::String(due_iso.clone()));
-            payload.insert("amount".to_string(), json!(round2(amount)));
-            payload.insert("currency".to_string(), Value::String(currency.to_string()));
-            payload.insert("status".to_string(), Value::String("scheduled".to_string()));
-            if let Some(user_id) = created_by_user_id
+    let mut collection_payloads = Vec::new();
+    for due_date in &due_dates {
+        let due_iso = due_date.to_string();
+        if existing_collection_by_due.contains_key(&due_iso) {
+            continue;
+        }
+        let mut payload = Map::new();
+        payload.insert(
+            "organization_id".to_string(),
+            Value::String(organization_id.to_string()),
+        );
+        payload.insert("lease_id".to_string(), Value::String(lease_id.to_string()));
+        payload.insert(
+            "lease_charge_id".to_string(),
+            existing_charge_by_due
+                .get(&due_iso)
+                .and_then(Value::as_object)
+                .and_then(|obj| value_str(obj.get("id")))
+                .map(|charge_id| Value::String(charge_id.to_string()))
+                .unwrap_or(Value::Null),
+        );
+        payload.insert("due_date".to_string(), Value::String(due_iso.clone()));
+        payload.insert("amount".to_string(), json!(round2(amount)));
+        payload.insert("currency".to_string(), Value::String(currency.to_string()));
+        payload.insert("status".to_string(), Value::String("scheduled".to_string()));
+        payload.insert(
+            "created_by_user_id".to_string(),
+            created_by_user_id
                 .map(str::trim)
                 .filter(|value| !value.is_empty())
-            {
-                payload.insert(
-                    "created_by_user_id".to_string(),
-                    Value::String(user_id.to_string()),
-                );
-            }
-
-            let created = create_row(pool, "collection_records", &payload).await?;
-            existing_collection_by_due.insert(due_iso.clone(), created.clone());
-            created_collections.push(created.clone());
-            created
-        };
-
-        if index == 0 {
-            first_collection = Some(collection);
+                .map(|user_id| Value::String(user_id.to_string()))
+                .unwrap_or(Value::Null),
+        );
+        collection_payloads.push(payload);
+    }
+    let created_collections =
+        create_rows_bulk(pool, "collection_records", &collection_payloads).await?;
+    for collection in &created_collections {
+        if let Some(due_date) = collection
+            .as_object()
+            .and_then(|obj| value_str(obj.get("due_date")))
+        {
+            existing_collection_by_due.insert(due_date.to_string(), collection.clone());
         }
     }
 
+    let first_collection = due_dates
+        .first()
+        .and_then(|due_date| existing_collection_by_due.get(&due_date.to_string()))
+        .cloned();
+
     Ok(LeaseScheduleResult {
         due_dates: due_dates.iter().map(NaiveDate::to_string).collect(),
         charges: created_charges,
@@ -0,0 +1,160 @@
+//! Debounced lease status refresh.
+//!
+//! Paying or creating a collection can flip a lease between `active` and
+//! `delinquent`. Handlers mark the lease dirty and a background task refreshes
+//! each dirty lease once per `LEASE_STATUS_REFRESH_DEBOUNCE_MS` window, so a
+//! burst of payments on one lease costs a single refresh. When the task is not
+//! running, or its queue is full, the refresh runs inline instead.
+
+use std::collections::HashSet;
+use std::sync::OnceLock;
+use std::time::Duration;
+
+use chrono::Utc;
+use serde_json::{Map, Value};
+use sqlx::PgPool;
+use tokio::sync::{mpsc, oneshot};
+
+use crate::{
+    config::AppConfig,
+    error::AppResult,
+    repository::table_service::{get_row, row_exists, update_row},
+    services::json_helpers::{json_map, value_str},
+};
+
+enum RefreshMessage {
+    Dirty(String),
+    Flush(oneshot::Sender<()>),
+}
+
+static REFRESH_QUEUE: OnceLock<mpsc::Sender<RefreshMessage>> = OnceLock::new();
+
+/// Start the background refresher. Later calls are ignored.
+pub fn spawn_refresher(pool: PgPool, config: &AppConfig) {
+    let (sender, receiver) = mpsc::channel(1024);
+    if REFRESH_QUEUE.set(sender).is_err() {
+        tracing::warn!("Lease status refresher already running");
+        return;
+    }
+    let debounce = Duration::from_millis(config.lease_status_refresh_debounce_ms.max(1));
+    tokio::spawn(run_refresher(pool, receiver, debounce));
+}
+
+/// Run every pending refresh now. Called during graceful shutdown.
+pub async fn flush() {
+    let Some(sender) = REFRESH_QUEUE.get() else {
+        return;
+    };
+    let (ack, done) = oneshot::channel();
+    if sender.send(RefreshMessage::Flush(ack)).await.is_err() {
+        return;
+    }
+    if tokio::time::timeout(Duration::from_secs(5), done)
+        .await
+        .is_err()
+    {
+        tracing::warn!("Timed out flushing lease status refreshes on shutdown");
+    }
+}
+
+/// Mark a lease for a status refresh.
+pub async fn schedule_lease_status_refresh(pool: &PgPool, lease_id: &str) -> AppResult<()> {
+    let lease_id = lease_id.trim();
+    if lease_id.is_empty() {
+        return Ok(());
+    }
+    if let Some(sender) = REFRESH_QUEUE.get() {
+        if sender
+            .try_send(RefreshMessage::Dirty(lease_id.to_string()))
+            .is_ok()
+        {
+            return Ok(());
+        }
+    }
+    refresh_lease_status(pool, lease_id).await
+}
+
+/// Set `lease_status` to `delinquent` when an unpaid collection is past due,
+/// back to `active` otherwise. Leases in any other status are left alone.
+pub async fn refresh_lease_status(pool: &PgPool, lease_id: &str) -> AppResult<()> {
+    let lease = get_row(pool, "leases", lease_id, "id").await?;
+    let status = value_str(&lease, "lease_status");
+    if status != "active" && status != "delinquent" {
+        return Ok(());
+    }
+
+    let today_iso = Utc::now().date_naive().to_string();
+    let has_overdue = row_exists(
+        pool,
+        "collection_records",
+        Some(&json_map(&[
+            ("lease_id", Value::String(lease_id.to_string())),
+            (
+                "status",
+                Value::Array(
+                    ["scheduled", "pending", "late"]
+                        .iter()
+                        .map(|value| Value::String((*value).to_string()))
+                        .collect(),
+                ),
+            ),
+            ("due_date__lt", Value::String(today_iso)),
+        ])),
+    )
+    .await?;
+
+    let next_status = if has_overdue { "delinquent" } else { "active" };
+    if next_status != status {
+        let mut patch = Map::new();
+        patch.insert(
+            "lease_status".to_string(),
+            Value::String(next_status.to_string()),
+        );
+        update_row(pool, "leases", lease_id, &patch, "id").await?;
+    }
+
+    Ok(())
+}
+
+async fn run_refresher(
+    pool: PgPool,
+    mut receiver: mpsc::Receiver<RefreshMessage>,
+    debounce: Duration,
+) {
+    let mut dirty: HashSet<String> = HashSet::new();
+    let mut ticker = tokio::time::interval(debounce);
+    ticker.set_missed_tick_behavior(tokio::time::MissedTickBehavior::Delay);
+
+    loop {
+        tokio::select! {
+            message = receiver.recv() => match message {
+                Some(RefreshMessage::Dirty(lease_id)) => {
+                    dirty.insert(lease_id);
+                }
+                Some(RefreshMessage::Flush(ack)) => {
+                    refresh_dirty(&pool, &mut dirty).await;
+                    let _ = ack.send(());
+                }
+                None => {
+                    refresh_dirty(&pool, &mut dirty).await;
+                    break;
+                }
+            },
+            _ = ticker.tick() => {
+                refresh_dirty(&pool, &mut dirty).await;
+            }
+        }
+    }
+}
+
+async fn refresh_dirty(pool: &PgPool, dirty: &mut HashSet<String>) {
+    for lease_id in dirty.drain() {
+        if let Err(error) = refresh_lease_status(pool, &lease_id).await {
+            tracing::warn!(
+                lease_id = %lease_id,
+                error = %error,
+                "Failed to refresh lease status"
+            );
+        }
+    }
+}
@@ -9,7 +9,11 @@ use crate::{
     error::{AppError, AppResult},
     repository::table_service::{get_row, list_rows},
     schemas::LeasesOverviewQuery,
-    services::json_helpers::{json_map, non_empty_opt, round2, value_str},
+    services::{
+        enrichment::{cached_property_names, cached_unit_maps},
+        json_helpers::{json_map, non_empty_opt, round2, value_str, value_str_ref},
+    },
+    state::AppState,
 };
 
 type LeaseCollectionState = &'static str;
@@ -240,57 +244,115 @@ pub async fn build_lease_detail_overview(pool: &sqlx::PgPool, lease_id: &str) ->
     }))
 }
 
-pub async fn enrich_lease_rows(pool: &sqlx::PgPool, rows: Vec<Value>) -> AppResult<Vec<Value>> {
+/// Which lookups `enrich_lease_rows_with` runs, parsed from the
+/// comma-separated `include` query param. Each skipped lookup saves a query
+/// and leaves its fields out of the rows.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub struct LeaseIncludes {
+    pub property: bool,
+    pub unit: bool,
+    pub space: bool,
+    pub bed: bool,
+    pub collections: bool,
+    pub documents: bool,
+    pub renewal: bool,
+}
+
+impl LeaseIncludes {
+    pub const ALL: Self = Self {
+        property: true,
+        unit: true,
+        space: true,
+        bed: true,
+        collections: true,
+        documents: true,
+        renewal: true,
+    };
+
+    /// `None` or a blank value keeps every lookup. Unknown names are ignored.
+    pub fn parse(include: Option<&str>) -> Self {
+        let Some(include) = include.map(str::trim).filter(|value| !value.is_empty()) else {
+            return Self::ALL;
+        };
+        let mut includes = Self {
+            property: false,
+            unit: false,
+            space: false,
+            bed: false,
+            collections: false,
+            documents: false,
+            renewal: false,
+        };
+        for part in include.split(',') {
+            match part.trim().to_ascii_lowercase().as_str() {
+                "property" => includes.property = true,
+                "unit" => includes.unit = true,
+                "space" => includes.space = true,
+                "bed" => includes.bed = true,
+                "collections" => includes.collections = true,
+                "documents" => includes.documents = true,
+                "renewal" => includes.renewal = true,
+                _ => {}
+            }
+        }
+        includes
+    }
+}
+
+pub async fn enrich_lease_rows(
+    state: &AppState,
+    pool: &sqlx::PgPool,
+    rows: Vec<Value>,
+) -> AppResult<Vec<Value>> {
+    enrich_lease_rows_with(state, pool, rows, LeaseIncludes::ALL).await
+}
+
+pub async fn enrich_lease_rows_with(
+    state: &AppState,
+    pool: &sqlx::PgPool,
+    rows: Vec<Value>,
+    includes: LeaseIncludes,
+) -> AppResult<Vec<Value>> {
     if rows.is_empty() {
         return Ok(rows);
     }
+    let org_id = value_str(&rows[0], "organization_id");
 
-    let property_ids = extract_ids(&rows, "property_id");
-    let unit_ids = extract_ids(&rows, "unit_id");
-    let space_ids = extract_ids(&rows, "space_id");
-    let bed_ids = extract_ids(&rows, "bed_id");
-    let lease_ids = extract_ids(&rows, "id");
-
-    let property_ids_for_query = property_ids.clone();
-    let unit_ids_for_query = unit_ids.clone();
-    let space_ids_for_query = space_ids.clone();
-    let bed_ids_for_query = bed_ids.clone();
-    let lease_ids_for_query = lease_ids.clone();
-    let lease_ids_for_documents = lease_ids.clone();
-    let lease_ids_for_children = lease_ids.clone();
-
-    let (properties, units, spaces, beds, collections, documents, child_leases) = tokio::try_join!(
-        async move { rows_for_ids(pool, "properties", &property_ids_for_query).await },
-        async move { rows_for_ids(pool, "units", &unit_ids_for_query).await },
-        async move { rows_for_ids(pool, "unit_spaces", &space_ids_for_query).await },
-        async move { rows_for_ids(pool, "unit_beds", &bed_ids_for_query).await },
-        async move {
-            if lease_ids_for_query.is_empty() {
-                Ok(Vec::new())
-            } else {
-                list_rows(
-                    pool,
-                    "collection_records",
-                    Some(&json_map(&[(
-                        "lease_id",
-                        Value::Array(
-                            lease_ids_for_query
-                                .iter()
-                                .cloned()
-                                .map(Value::String)
-                                .collect(),
-                        ),
-                    )])),
-                    std::cmp::max(400, (lease_ids_for_query.len() as i64) * 12),
-                    0,
-                    "created_at",
-                    false,
-                )
-                .await
-            }
-        },
-        async move {
-            if lease_ids_for_documents.is_empty() {
+    let [property_ids, unit_ids, space_ids, bed_ids, lease_ids] = extract_id_sets(
+        &rows,
+        ["property_id", "unit_id", "space_id", "bed_id", "id"],
+    );
+    // An empty id set short-circuits its lookup without a query.
+    let none = HashSet::new();
+    let property_ids = if includes.property {
+        &property_ids
+    } else {
+        &none
+    };
+    let unit_ids = if includes.unit { &unit_ids } else { &none };
+    let space_ids = if includes.space { &space_ids } else { &none };
+    let bed_ids = if includes.bed { &bed_ids } else { &none };
+    let collection_lease_ids = if includes.collections {
+        &lease_ids
+    } else {
+        &none
+    };
+    let document_lease_ids = if includes.documents {
+        &lease_ids
+    } else {
+        &none
+    };
+    let renewal_lease_ids = if includes.renewal { &lease_ids } else { &none };
+
+    // The lookups are independent, so they share one round-trip of latency.
+    let (property_names, unit_names, spaces, beds, collection_stats, documents, child_leases) = tokio::try_join!(
+        lease_property_names(state, pool, &org_id, property_ids),
+        lease_unit_names(state, pool, &org_id, unit_ids),
+        async { rows_for_ids(pool, "unit_spaces", space_ids).await },
+        async { rows_for_ids(pool, "unit_beds", bed_ids).await },
+        collection_stats_for_leases(pool, collection_lease_ids),
+        async {
+            if document_lease_ids.is_empty() {
                 Ok(Vec::new())
             } else {
                 list_rows(
@@ -301,7 +363,7 @@ pub async fn enrich_lease_rows(pool: &sqlx::PgPool, rows: Vec<Value>) -> AppResu
                         (
                             "entity_id",
                             Value::Array(
-                                lease_ids_for_documents
+                                document_lease_ids
                                     .iter()
                                     .cloned()
                                     .map(Value::String)
@@ -309,7 +371,7 @@ pub async fn enrich_lease_rows(pool: &sqlx::PgPool, rows: Vec<Value>) -> AppResu
                             ),
                         ),
                     ])),
-                    std::cmp::max(300, lease_ids_for_documents.len() as i64),
+                    std::cmp::max(300, document_lease_ids.len() as i64),
                     0,
                     "created_at",
                     false,
@@ -317,8 +379,8 @@ pub async fn enrich_lease_rows(pool: &sqlx::PgPool, rows: Vec<Value>) -> AppResu
                 .await
             }
         },
-        async move {
-            if lease_ids_for_children.is_empty() {
+        async {
+            if renewal_lease_ids.is_empty() {
                 Ok(Vec::new())
             } else {
                 list_rows(
@@ -327,14 +389,14 @@ pub async fn enrich_lease_rows(pool: &sqlx::PgPool, rows: Vec<Value>) -> AppResu
                     Some(&json_map(&[(
                         "parent_lease_id",
                         Value::Array(
-                            lease_ids_for_children
+                            renewal_lease_ids
                                 .iter()
                                 .cloned()
                                 .map(Value::String)
                                 .collect(),
                         ),
                     )])),
-                    std::cmp::max(200, lease_ids_for_children.len() as i64),
+                    std::cmp::max(200, renewal_lease_ids.len() as i64),
                     0,
                     "created_at",
                     false,
@@ -344,61 +406,53 @@ pub async fn enrich_lease_rows(pool: &sqlx::PgPool, rows: Vec<Value>) -> AppResu
         }
     )?;
 
-    let property_names = map_by_id_field(&properties, "name");
-    let unit_names = map_by_first_present_field(&units, &["name", "code"]);
     let space_names = map_by_id_field(&spaces, "name");
     let bed_codes = map_by_id_field(&beds, "code");
 
-    let mut collection_stats = HashMap::<String, LeaseCollectionStats>::new();
-    let today = Utc::now().date_naive().to_string();
-    for collection in collections {
-        let lease_id = value_str(&collection, "lease_id");
+    let mut documents_count_by_lease_id = HashMap::<String, i32>::new();
+    for document in &documents {
+        let lease_id = value_str_ref(document, "entity_id");
         if lease_id.is_empty() {
             continue;
         }
-        let stats = collection_stats.entry(lease_id).or_default();
-        let amount = value_f64(&collection, "amount");
-        let status = value_str(&collection, "status");
-        if status == "paid" {
-            stats.paid_count += 1;
-        }
-        if matches!(status.as_str(), "scheduled" | "pending" | "late") {
-            stats.open_count += 1;
-            stats.unpaid_amount += amount;
-            let due_date = value_str(&collection, "due_date");
-            if !due_date.is_empty() && due_date < today {
-                stats.overdue_count += 1;
+        match documents_count_by_lease_id.get_mut(lease_id) {
+            Some(count) => *count += 1,
+            None => {
+                documents_count_by_lease_id.insert(lease_id.to_string(), 1);
             }
         }
     }
 
-    let mut documents_count_by_lease_id = HashMap::<String, i32>::new();
-    for document in documents {
-        let lease_id = value_str(&document, "entity_id");
-        if lease_id.is_empty() {
-            continue;
-        }
-        *documents_count_by_lease_id.entry(lease_id).or_insert(0) += 1;
-    }
-
     let mut child_lease_by_parent = HashMap::<String, String>::new();
-    for child in child_leases {
-        let parent_id = value_str(&child, "parent_lease_id");
-        let child_id = value_str(&child, "id");
-        if parent_id.is_empty() || child_id.is_empty() {
+    for child in &child_leases {
+        let parent_id = value_str_ref(child, "parent_lease_id");
+        let child_id = value_str_ref(child, "id");
+        if parent_id.is_empty()
+            || child_id.is_empty()
+            || child_lease_by_parent.contains_key(parent_id)
+        {
             continue;
         }
-        child_lease_by_parent.entry(parent_id).or_insert(child_id);
+        child_lease_by_parent.insert(parent_id.to_string(), child_id.to_string());
     }
 
+    let no_collections = LeaseCollectionStats::default();
     let mut enriched = Vec::with_capacity(rows.len());
     for mut row in rows {
         let lease_status = value_str(&row, "lease_status");
         if let Some(obj) = row.as_object_mut() {
-            set_lookup_field(obj, "property_id", "property_name", &property_names);
-            set_lookup_field(obj, "unit_id", "unit_name", &unit_names);
-            set_lookup_field(obj, "space_id", "space_name", &space_names);
-            set_lookup_field(obj, "bed_id", "bed_code", &bed_codes);
+            if includes.property {
+                set_lookup_field(obj, "property_id", "property_name", &property_names);
+            }
+            if includes.unit {
+                set_lookup_field(obj, "unit_id", "unit_name", &unit_names);
+            }
+            if includes.space {
+                set_lookup_field(obj, "space_id", "space_name", &space_names);
+            }
+            if includes.bed {
+                set_lookup_field(obj, "bed_id", "bed_code", &bed_codes);
+            }
 
             let lease_id = obj
                 .get("id")
@@ -406,32 +460,25 @@ pub async fn enrich_lease_rows(pool: &sqlx::PgPool, rows: Vec<Value>) -> AppResu
                 .map(str::trim)
                 .unwrap_or_default()
                 .to_string();
-            let stats = collection_stats.get(&lease_id).cloned().unwrap_or_default();
-            obj.insert("collection_paid_count".to_string(), json!(stats.paid_count));
-            obj.insert("collection_open_count".to_string(), json!(stats.open_count));
-            obj.insert("overdue_count".to_string(), json!(stats.overdue_count));
-            obj.insert(
-                "unpaid_amount".to_string(),
-                json!(round2(stats.unpaid_amount)),
-            );
-            obj.insert(
-                "documents_count".to_string(),
-                json!(documents_count_by_lease_id
-                    .get(&lease_id)
-                    .copied()
-                    .unwrap_or(0)),
-            );
+            if includes.collections {
+                let stats = collection_stats.get(&lease_id).unwrap_or(&no_collections);
+                insert_collection_stats(obj, stats, &lease_status);
+            }
+            if includes.documents {
+                obj.insert(
+                    "documents_count".to_string(),
+                    json!(documents_count_by_lease_id
+                        .get(&lease_id)
+                        .copied()
+                        .unwrap_or(0)),
+                );
+            }
             if let Some(child_lease_id) = child_lease_by_parent.get(&lease_id) {
                 obj.insert(
                     "child_lease_id".to_string(),
                     Value::String(child_lease_id.clone()),
                 );
             }
-            let collection_state = collection_state_from_stats(&stats, lease_status.as_str());
-            obj.insert(
-                "collection_state".to_string(),
-                Value::String(collection_state.to_string()),
-            );
         }
         enriched.push(row);
     }
@@ -713,32 +760,28 @@ fn matches_view(row: &OverviewLeaseRow, view: Option<&str>) -> bool {
     }
 }
 
+/// Sort keys that need work to build (casefolding, timestamp parsing) are
+/// computed once per row rather than once per comparison.
 fn sort_rows(rows: &mut [OverviewLeaseRow], sort: Option<&str>) {
     match non_empty_opt(sort) {
-        Some(value) if value == "tenant_asc" => rows.sort_by(|left, right| {
-            left.tenant_name
-                .to_ascii_lowercase()
-                .cmp(&right.tenant_name.to_ascii_lowercase())
-        }),
+        Some(value) if value == "tenant_asc" => {
+            rows.sort_by_cached_key(|row| row.tenant_name.to_ascii_lowercase())
+        }
         Some(value) if value == "rent_desc" => rows.sort_by(|left, right| {
             right
                 .monthly_recurring_total
                 .partial_cmp(&left.monthly_recurring_total)
                 .unwrap_or(std::cmp::Ordering::Equal)
         }),
-        Some(value) if value == "updated_desc" => rows.sort_by(|left, right| {
-            let left_ms = parse_millis(left.updated_at.as_deref());
-            let right_ms = parse_millis(right.updated_at.as_deref());
-            right_ms.cmp(&left_ms)
-        }),
-        _ => rows.sort_by(|left, right| {
-            let left_end = left.ends_on.as_deref().unwrap_or("9999-12-31");
-            let right_end = right.ends_on.as_deref().unwrap_or("9999-12-31");
-            left_end.cmp(right_end).then_with(|| {
-                left.tenant_name
-                    .to_ascii_lowercase()
-                    .cmp(&right.tenant_name.to_ascii_lowercase())
-            })
+        Some(value) if value == "updated_desc" => rows
+            .sort_by_cached_key(|row| std::cmp::Reverse(parse_millis(row.updated_at.as_deref()))),
+        _ => rows.sort_by_cached_key(|row| {
+            (
+                row.ends_on
+                    .clone()
+                    .unwrap_or_else(|| "9999-12-31".to_string()),
+                row.tenant_name.to_ascii_lowercase(),
+            )
         }),
     }
 }
@@ -845,6 +888,52 @@ fn collection_state(row: &OverviewLeaseRow) -> LeaseCollectionState {
     )
 }
 
+/// Fill in the collection fields of a single enriched lease from collection
+/// rows the caller already loaded, e.g. `get_lease`, which returns them
+/// alongside the lease. Pair with `enrich_lease_rows_with` and
+/// `collections: false` to skip the stats query.
+pub fn apply_collection_stats(lease: &mut Value, collections: &[Value]) {
+    let lease_status = value_str(lease, "lease_status");
+    let today = Utc::now().date_naive().to_string();
+    let mut stats = LeaseCollectionStats::default();
+    for collection in collections {
+        let status = value_str_ref(collection, "status");
+        if status == "paid" {
+            stats.paid_count += 1;
+        }
+        if matches!(status, "scheduled" | "pending" | "late") {
+            stats.open_count += 1;
+            stats.unpaid_amount += value_f64(collection, "amount");
+            let due_date = value_str_ref(collection, "due_date");
+            if !due_date.is_empty() && due_date < today.as_str() {
+                stats.overdue_count += 1;
+            }
+        }
+    }
+    if let Some(obj) = lease.as_object_mut() {
+        insert_collection_stats(obj, &stats, &lease_status);
+    }
+}
+
+fn insert_collection_stats(
+    obj: &mut Map<String, Value>,
+    stats: &LeaseCollectionStats,
+    lease_status: &str,
+) {
+    obj.insert("collection_paid_count".to_string(), json!(stats.paid_count));
+    obj.insert("collection_open_count".to_string(), json!(stats.open_count));
+    obj.insert("overdue_count".to_string(), json!(stats.overdue_count));
+    obj.insert(
+        "unpaid_amount".to_string(),
+        json!(round2(stats.unpaid_amount)),
+    );
+    let collection_state = collection_state_from_stats(stats, lease_status);
+    obj.insert(
+        "collection_state".to_string(),
+        Value::String(collection_state.to_string()),
+    );
+}
+
 fn collection_state_from_stats(
     stats: &LeaseCollectionStats,
     lease_status: &str,
@@ -938,13 +1027,130 @@ async fn rows_for_ids(
     .await
 }
 
-fn extract_ids(rows: &[Value], key: &str) -> HashSet<String> {
-    rows.iter()
-        .map(|row| value_str(row, key))
-        .filter(|value| !value.is_empty())
+/// Property names from the org's cached name map, querying only ids the
+/// cache does not cover.
+async fn lease_property_names(
+    state: &AppState,
+    pool: &sqlx::PgPool,
+    org_id: &str,
+    ids: &HashSet<String>,
+) -> AppResult<HashMap<String, String>> {
+    if ids.is_empty() {
+        return Ok(HashMap::new());
+    }
+    let mut names = if org_id.is_empty() {
+        HashMap::new()
+    } else {
+        cached_property_names(state, pool, org_id).await?
+    };
+    let missing = missing_ids(ids, &names);
+    names.extend(map_by_id_field(
+        &rows_for_ids(pool, "properties", &missing).await?,
+        "name",
+    ));
+    Ok(names)
+}
+
+/// Unit labels (name, else code) from the org's cached unit map, querying
+/// only ids the cache does not cover. The cache holds names only, so units
+/// labelled by code alone are fetched here.
+async fn lease_unit_names(
+    state: &AppState,
+    pool: &sqlx::PgPool,
+    org_id: &str,
+    ids: &HashSet<String>,
+) -> AppResult<HashMap<String, String>> {
+    if ids.is_empty() {
+        return Ok(HashMap::new());
+    }
+    let mut names = if org_id.is_empty() {
+        HashMap::new()
+    } else {
+        cached_unit_maps(state, pool, org_id).await?.0
+    };
+    let missing = missing_ids(ids, &names);
+    names.extend(map_by_first_present_field(
+        &rows_for_ids(pool, "units", &missing).await?,
+        &["name", "code"],
+    ));
+    Ok(names)
+}
+
+fn missing_ids(ids: &HashSet<String>, known: &HashMap<String, String>) -> HashSet<String> {
+    ids.iter()
+        .filter(|id| !known.contains_key(*id))
+        .cloned()
         .collect()
 }
 
+/// Per-lease collection counters, aggregated in the database so a page of
+/// leases does not pull every collection row back to count it.
+async fn collection_stats_for_leases(
+    pool: &sqlx::PgPool,
+    lease_ids: &HashSet<String>,
+) -> AppResult<HashMap<String, LeaseCollectionStats>> {
+    if lease_ids.is_empty() {
+        return Ok(HashMap::new());
+    }
+
+    // Overdue is judged against the UTC date, like `apply_collection_stats`,
+    // rather than the session's CURRENT_DATE.
+    let rows = sqlx::query(
+        "SELECT
+            lease_id::text AS lease_id,
+            COUNT(*) FILTER (WHERE status = 'paid')::int AS paid_count,
+            COUNT(*) FILTER (WHERE status IN ('scheduled', 'pending', 'late'))::int AS open_count,
+            COUNT(*) FILTER (
+              WHERE status IN ('scheduled', 'pending', 'late') AND due_date < $2::date
+            )::int AS overdue_count,
+            COALESCE(SUM(amount) FILTER (WHERE status IN ('scheduled', 'pending', 'late')), 0)::float8 AS unpaid_amount
+         FROM collection_records
+         WHERE lease_id = ANY($1::text[]::uuid[])
+         GROUP BY lease_id",
+    )
+    .bind(lease_ids.iter().cloned().collect::<Vec<String>>())
+    .bind(Utc::now().date_naive())
+    .fetch_all(pool)
+    .await
+    .map_err(|err| AppError::Internal(format!("lease collection stats query failed: {err}")))?;
+
+    Ok(rows
+        .into_iter()
+        .map(|row| {
+            let lease_id = row.try_get::<String, _>("lease_id").unwrap_or_default();
+            let stats = LeaseCollectionStats {
+                paid_count: row.try_get::<i32, _>("paid_count").unwrap_or_default(),
+                open_count: row.try_get::<i32, _>("open_count").unwrap_or_default(),
+                overdue_count: row.try_get::<i32, _>("overdue_count").unwrap_or_default(),
+                unpaid_amount: row.try_get::<f64, _>("unpaid_amount").unwrap_or_default(),
+            };
+            (lease_id, stats)
+        })
+        .collect())
+}
+
+/// Distinct non-empty values of each key, collected in one pass over `rows`.
+/// Ids shared by many rows are only allocated once.
+fn extract_id_sets<const N: usize>(rows: &[Value], keys: [&str; N]) -> [HashSet<String>; N] {
+    let mut sets: [HashSet<String>; N] = std::array::from_fn(|_| HashSet::new());
+    for row in rows {
+        let Some(obj) = row.as_object() else {
+            continue;
+        };
+        for (key, ids) in keys.iter().zip(sets.iter_mut()) {
+            let id = obj
+                .get(*key)
+                .and_then(Value::as_str)
+                .map(str::trim)
+                .unwrap_or_default();
+            if !id.is_empty() && !ids.contains(id) {
+                ids.insert(id.to_string());
+            }
+        }
+    }
+    sets
+}
+
 fn map_by_id_field(rows: &[Value], field: &str) -> HashMap<String, String> {
     let mut values = HashMap::new();
     for row in rows {
@@ -1034,3 +1240,26 @@ fn value_f64(row: &Value, key: &str) -> f64 {
 async fn get_lease_row(pool: &sqlx::PgPool, lease_id: &str) -> AppResult<Value> {
     get_row(pool, "leases", lease_id, "id").await
 }
+
+#[cfg(test)]
+mod tests {
+    use super::LeaseIncludes;
+
+    #[test]
+    fn lease_includes_default_to_all() {
+        assert_eq!(LeaseIncludes::parse(None), LeaseIncludes::ALL);
+        assert_eq!(LeaseIncludes::parse(Some("  ")), LeaseIncludes::ALL);
+    }
+
+    #[test]
+    fn lease_includes_parse_listed_parts_only() {
+        let includes = LeaseIncludes::parse(Some("property, Unit,unknown"));
+        assert!(includes.property);
+        assert!(includes.unit);
+        assert!(!includes.space);
+        assert!(!includes.bed);
+        assert!(!includes.collections);
+        assert!(!includes.documents);
+        assert!(!includes.renewal);
+    }
+}
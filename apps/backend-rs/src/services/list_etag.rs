@@ -0,0 +1,95 @@
+//! Conditional GET support for org-scoped list endpoints.
+//!
+//! The ETag hashes the org's table version (see
+//! `table_service::org_tables_version`) together with the request's query,
+//! so a client polling an unchanged list gets a `304` without the list query
+//! or its enrichment running.
+
+use axum::{
+    http::{
+        header::{CACHE_CONTROL, ETAG, IF_NONE_MATCH},
+        HeaderMap, HeaderValue, StatusCode,
+    },
+    response::{IntoResponse, Response},
+    Json,
+};
+use serde_json::Value;
+use sha2::{Digest, Sha256};
+
+/// Quoted strong ETag over `parts`.
+pub fn list_etag(parts: &[&str]) -> String {
+    let mut hasher = Sha256::new();
+    for part in parts {
+        hasher.update(part.as_bytes());
+        hasher.update([0u8]);
+    }
+    let hash = hasher.finalize();
+    format!(
+        "\"{}\"",
+        hash[..16]
+            .iter()
+            .map(|b| format!("{b:02x}"))
+            .collect::<String>()
+    )
+}
+
+/// Whether the request's `If-None-Match` already names `etag`.
+pub fn etag_matches(headers: &HeaderMap, etag: &str) -> bool {
+    let Some(if_none_match) = headers.get(IF_NONE_MATCH).and_then(|v| v.to_str().ok()) else {
+        return false;
+    };
+    if_none_match.split(',').map(str::trim).any(|candidate| {
+        candidate == "*"
+            || candidate.trim_start_matches("W/").trim_matches('"') == etag.trim_matches('"')
+    })
+}
+
+pub fn not_modified(etag: &str) -> Response {
+    let mut response = StatusCode::NOT_MODIFIED.into_response();
+    set_cache_headers(response.headers_mut(), etag);
+    response
+}
+
+/// JSON response carrying `etag`. `no-cache` lets the client keep the body
+/// but makes it revalidate every time, so writes show up immediately.
+pub fn json_with_etag(body: Value, etag: &str) -> Response {
+    let mut response = Json(body).into_response();
+    set_cache_headers(response.headers_mut(), etag);
+    response
+}
+
+fn set_cache_headers(headers: &mut HeaderMap, etag: &str) {
+    if let Ok(value) = HeaderValue::from_str(etag) {
+        headers.insert(ETAG, value);
+    }
+    headers.insert(CACHE_CONTROL, HeaderValue::from_static("private, no-cache"));
+}
+
+#[cfg(test)]
+mod tests {
+    use axum::http::{header::IF_NONE_MATCH, HeaderMap, HeaderValue};
+
+    use super::{etag_matches, list_etag};
+
+    #[test]
+    fn list_etag_depends_on_every_part() {
+        let base = list_etag(&["org", "3:2026-03-01", "{}"]);
+        assert_eq!(base, list_etag(&["org", "3:2026-03-01", "{}"]));
+        assert_ne!(base, list_etag(&["org", "4:2026-03-01", "{}"]));
+        assert_ne!(list_etag(&["ab", "c"]), list_etag(&["a", "bc"]));
+    }
+
+    #[test]
+    fn etag_matches_if_none_match_lists() {
+        let etag = list_etag(&["org"]);
+        let mut headers = HeaderMap::new();
+        assert!(!etag_matches(&headers, &etag));
+
+        let listed = format!("\"other\", W/{etag}");
+        headers.insert(IF_NONE_MATCH, HeaderValue::from_str(&listed).unwrap());
+        assert!(etag_matches(&headers, &etag));
+
+        headers.insert(IF_NONE_MATCH, HeaderValue::from_static("\"other\""));
+        assert!(!etag_matches(&headers, &etag));
+    }
+}
@@ -4,7 +4,7 @@ use sqlx::{Postgres, QueryBuilder, Row};
 
 use crate::{
     error::{AppError, AppResult},
-    repository::table_service::{count_rows, list_rows},
+    repository::table_service::{count_rows, like_contains_pattern},
     schemas::{ListingsOverviewQuery, PublicListingsQuery},
     services::{
         json_helpers::{json_map, non_empty_opt, value_str},
@@ -15,6 +15,14 @@ use crate::{
 };
 
 const OVERVIEW_ROW_CAP: i64 = 1_000;
+/// Select-list column and join that aggregate a listing's fee lines in the
+/// row query itself; finish the row with `with_fee_line_totals`.
+const FEE_LINES_COLUMN: &str = "COALESCE(fl.lines, '[]'::json) AS fee_lines";
+const FEE_LINES_JOIN: &str = "LEFT JOIN LATERAL (
+            SELECT json_agg(row_to_json(f) ORDER BY f.sort_order) AS lines
+            FROM listing_fee_lines f
+            WHERE f.listing_id = l.id
+        ) fl ON TRUE";
 const MAX_GALLERY_IMAGES: usize = 8;
 const MAX_SPATIAL_ASSETS: usize = 16;
 const MAX_AMENITIES: usize = 24;
@@ -34,142 +42,50 @@ pub async fn attach_listing_fee_lines(
         .filter_map(Value::as_str)
         .map(str::trim)
         .filter(|value| !value.is_empty())
-        .map(ToOwned::to_owned)
         .collect::<std::collections::HashSet<_>>()
         .into_iter()
-        .collect::<Vec<_>>();
+        .map(|id| parse_uuid(id, "listing_id"))
+        .collect::<AppResult<Vec<_>>>()?;
     if row_ids.is_empty() {
         return Ok(rows);
     }
 
-    let unit_ids = rows
-        .iter()
-        .filter_map(Value::as_object)
-        .filter_map(|row| row.get("unit_id"))
-        .filter_map(Value::as_str)
-        .map(str::trim)
-        .filter(|value| !value.is_empty())
-        .map(ToOwned::to_owned)
-        .collect::<std::collections::HashSet<_>>()
-        .into_iter()
-        .collect::<Vec<_>>();
-    let property_ids = rows
-        .iter()
-        .filter_map(Value::as_object)
-        .filter_map(|row| row.get("property_id"))
-        .filter_map(Value::as_str)
-        .map(str::trim)
-        .filter(|value| !value.is_empty())
-        .map(ToOwned::to_owned)
-        .collect::<std::collections::HashSet<_>>()
-        .into_iter()
-        .collect::<Vec<_>>();
-
-    let row_ids_for_query = row_ids.clone();
-    let unit_ids_for_query = unit_ids.clone();
-    let property_ids_for_query = property_ids.clone();
-
-    let (fee_lines, units, properties) = tokio::try_join!(
-        async move {
-            list_rows(
-                pool,
-                "listing_fee_lines",
-                Some(&json_map(&[(
-                    "listing_id",
-                    Value::Array(
-                        row_ids_for_query
-                            .iter()
-                            .cloned()
-                            .map(Value::String)
-                            .collect(),
-                    ),
-                )])),
-                std::cmp::max(200, (row_ids_for_query.len() as i64) * 20),
-                0,
-                "sort_order",
-                true,
-            )
-            .await
-        },
-        async move {
-            if unit_ids_for_query.is_empty() {
-                Ok(Vec::new())
-            } else {
-                list_rows(
-                    pool,
-                    "units",
-                    Some(&json_map(&[(
-                        "id",
-                        Value::Array(
-                            unit_ids_for_query
-                                .iter()
-                                .cloned()
-                                .map(Value::String)
-                                .collect(),
-                        ),
-                    )])),
-                    std::cmp::max(200, unit_ids_for_query.len() as i64),
-                    0,
-                    "created_at",
-                    false,
-                )
-                .await
-            }
-        },
-        async move {
-            if property_ids_for_query.is_empty() {
-                Ok(Vec::new())
-            } else {
-                list_rows(
-                    pool,
-                    "properties",
-                    Some(&json_map(&[(
-                        "id",
-                        Value::Array(
-                            property_ids_for_query
-                                .iter()
-                                .cloned()
-                                .map(Value::String)
-                                .collect(),
-                        ),
-                    )])),
-                    std::cmp::max(200, property_ids_for_query.len() as i64),
-                    0,
-                    "created_at",
-                    false,
-                )
-                .await
-            }
-        }
-    )?;
-
-    let mut grouped: std::collections::HashMap<String, Vec<Value>> =
-        std::collections::HashMap::new();
-    for line in fee_lines {
-        let key = value_str(&line, "listing_id");
-        if key.is_empty() {
-            continue;
-        }
-        grouped.entry(key).or_default().push(line);
-    }
-
-    let mut unit_name: std::collections::HashMap<String, String> = std::collections::HashMap::new();
-    for unit in units {
-        let id = value_str(&unit, "id");
-        if id.is_empty() {
-            continue;
-        }
-        unit_name.insert(id, value_str(&unit, "name"));
-    }
+    // Fee lines, unit name and property name for every listing in one round
+    // trip instead of one query per table.
+    let context_rows = sqlx::query(&format!(
+        "SELECT l.id::text AS id,
+                {FEE_LINES_COLUMN},
+                u.name AS unit_name,
+                p.name AS property_name
+         FROM listings l
+         LEFT JOIN units u ON u.id = l.unit_id
+         LEFT JOIN properties p ON p.id = l.property_id
+         {FEE_LINES_JOIN}
+         WHERE l.id = ANY($1)"
+    ))
+    .bind(row_ids)
+    .fetch_all(pool)
+    .await
+    .map_err(map_db_error)?;
 
-    let mut property_name: std::collections::HashMap<String, String> =
-        std::collections::HashMap::new();
-    for property in properties {
-        let id = value_str(&property, "id");
-        if id.is_empty() {
+    let mut contexts: std::collections::HashMap<String, ListingContext> =
+        std::collections::HashMap::with_capacity(context_rows.len());
+    for context in context_rows {
+        let Ok(id) = context.try_get::<String, _>("id") else {
             continue;
-        }
-        property_name.insert(id, value_str(&property, "name"));
+        };
+        let fee_lines = match context.try_get::<Option<Value>, _>("fee_lines") {
+            Ok(Some(Value::Array(lines))) => lines,
+            _ => Vec::new(),
+        };
+        contexts.insert(
+            id,
+            ListingContext {
+                fee_lines,
+                unit_name: context.try_get("unit_name").ok().flatten(),
+                property_name: context.try_get("property_name").ok().flatten(),
+            },
+        );
     }
 
     let mut attached = Vec::with_capacity(rows.len());
@@ -179,61 +95,32 @@ pub async fn attach_listing_fee_lines(
                 .get("id")
                 .and_then(Value::as_str)
                 .map(str::trim)
-                .filter(|value| !value.is_empty())
-                .map(ToOwned::to_owned)
                 .unwrap_or_default();
-            let lines = grouped.get(&listing_id).cloned().unwrap_or_default();
-            let totals = compute_pricing_totals(&lines);
-            let missing = missing_required_fee_types(&lines);
-
-            obj.insert("fee_lines".to_string(), Value::Array(lines));
-            obj.insert("total_move_in".to_string(), json!(totals.total_move_in));
-            obj.insert(
-                "monthly_recurring_total".to_string(),
-                json!(totals.monthly_recurring_total),
-            );
-            obj.insert(
-                "fee_breakdown_complete".to_string(),
-                Value::Bool(missing.is_empty()),
-            );
-            obj.insert(
-                "missing_required_fee_lines".to_string(),
-                Value::Array(missing.into_iter().map(Value::String).collect()),
-            );
-
-            if let Some(property_id) = obj
+            let context = contexts.remove(listing_id).unwrap_or_default();
+            insert_fee_line_totals(obj, context.fee_lines);
+
+            let has_property = obj
                 .get("property_id")
                 .and_then(Value::as_str)
-                .map(str::trim)
-                .filter(|value| !value.is_empty())
-            {
-                if !obj.contains_key("property_name") {
-                    obj.insert(
-                        "property_name".to_string(),
-                        property_name
-                            .get(property_id)
-                            .cloned()
-                            .map(Value::String)
-                            .unwrap_or(Value::Null),
-                    );
-                }
+                .is_some_and(|value| !value.trim().is_empty());
+            if has_property && !obj.contains_key("property_name") {
+                obj.insert(
+                    "property_name".to_string(),
+                    context
+                        .property_name
+                        .map(Value::String)
+                        .unwrap_or(Value::Null),
+                );
             }
-            if let Some(unit_id) = obj
+            let has_unit = obj
                 .get("unit_id")
                 .and_then(Value::as_str)
-                .map(str::trim)
-                .filter(|value| !value.is_empty())
-            {
-                if !obj.contains_key("unit_name") {
-                    obj.insert(
-                        "unit_name".to_string(),
-                        unit_name
-                            .get(unit_id)
-                            .cloned()
-                            .map(Value::String)
-                            .unwrap_or(Value::Null),
-                    );
-                }
+                .is_some_and(|value| !value.trim().is_empty());
+            if has_unit && !obj.contains_key("unit_name") {
+                obj.insert(
+                    "unit_name".to_string(),
+                    context.unit_name.map(Value::String).unwrap_or(Value::Null),
+                );
             }
         }
         attached.push(row);
@@ -242,6 +129,124 @@ pub async fn attach_listing_fee_lines(
     Ok(attached)
 }
 
+/// Finish a row whose query selected `FEE_LINES_COLUMN`: add the pricing
+/// totals and fee-breakdown flags `attach_listing_fee_lines` would add,
+/// without another round trip.
+pub fn with_fee_line_totals(mut row: Value) -> Value {
+    if let Some(obj) = row.as_object_mut() {
+        let lines = match obj.remove("fee_lines") {
+            Some(Value::Array(lines)) => lines,
+            _ => Vec::new(),
+        };
+        insert_fee_line_totals(obj, lines);
+    }
+    row
+}
+
+fn insert_fee_line_totals(obj: &mut Map<String, Value>, lines: Vec<Value>) {
+    let totals = compute_pricing_totals(&lines);
+    let missing = missing_required_fee_types(&lines);
+
+    obj.insert("fee_lines".to_string(), Value::Array(lines));
+    obj.insert("total_move_in".to_string(), json!(totals.total_move_in));
+    obj.insert(
+        "monthly_recurring_total".to_string(),
+        json!(totals.monthly_recurring_total),
+    );
+    obj.insert(
+        "fee_breakdown_complete".to_string(),
+        Value::Bool(missing.is_empty()),
+    );
+    obj.insert(
+        "missing_required_fee_lines".to_string(),
+        Value::Array(missing.into_iter().map(Value::String).collect()),
+    );
+}
+
+/// Per-listing data joined in by `attach_listing_fee_lines`.
+#[derive(Default)]
+struct ListingContext {
+    fee_lines: Vec<Value>,
+    unit_name: Option<String>,
+    property_name: Option<String>,
+}
+
+/// Rows a listing write points at, narrowed to the columns the create and
+/// update handlers check or copy onto the listing.
+#[derive(Default)]
+pub struct ListingRefs {
+    pub integration: Option<Value>,
+    pub unit: Option<Value>,
+    pub property: Option<Value>,
+}
+
+/// Load the integration, unit and property referenced by a listing payload in
+/// one round trip. When `property_id` is absent the unit's property is loaded.
+/// A referenced id with no row is reported the way `get_row` reports it.
+pub async fn load_listing_refs(
+    pool: &sqlx::PgPool,
+    integration_id: Option<&str>,
+    unit_id: Option<&str>,
+    property_id: Option<&str>,
+) -> AppResult<ListingRefs> {
+    if integration_id.is_none() && unit_id.is_none() && property_id.is_none() {
+        return Ok(ListingRefs::default());
+    }
+    let integration_uuid = integration_id
+        .map(|id| parse_uuid(id, "integration_id"))
+        .transpose()?;
+    let unit_uuid = unit_id.map(|id| parse_uuid(id, "unit_id")).transpose()?;
+    let property_uuid = property_id
+        .map(|id| parse_uuid(id, "property_id"))
+        .transpose()?;
+
+    let row = sqlx::query(
+        "SELECT
+            (SELECT json_build_object('organization_id', i.organization_id)
+               FROM integrations i WHERE i.id = $1) AS integration,
+            (SELECT json_build_object(
+                      'organization_id', u.organization_id,
+                      'property_id', u.property_id,
+                      'bedrooms', u.bedrooms,
+                      'bathrooms', u.bathrooms,
+                      'square_meters', u.square_meters)
+               FROM units u WHERE u.id = $2) AS unit,
+            (SELECT json_build_object(
+                      'organization_id', p.organization_id,
+                      'city', p.city,
+                      'neighborhood', p.neighborhood)
+               FROM properties p
+              WHERE p.id = COALESCE($3, (SELECT property_id FROM units WHERE id = $2))
+            ) AS property",
+    )
+    .bind(integration_uuid)
+    .bind(unit_uuid)
+    .bind(property_uuid)
+    .fetch_one(pool)
+    .await
+    .map_err(map_db_error)?;
+
+    let refs = ListingRefs {
+        integration: row.try_get("integration").ok().flatten(),
+        unit: row.try_get("unit").ok().flatten(),
+        property: row.try_get("property").ok().flatten(),
+    };
+    if integration_id.is_some() && refs.integration.is_none() {
+        return Err(AppError::NotFound(
+            "integrations record not found.".to_string(),
+        ));
+    }
+    if unit_id.is_some() && refs.unit.is_none() {
+        return Err(AppError::NotFound("units record not found.".to_string()));
+    }
+    if property_id.is_some() && refs.property.is_none() {
+        return Err(AppError::NotFound(
+            "properties record not found.".to_string(),
+        ));
+    }
+    Ok(refs)
+}
+
 pub async fn list_public_listing_rows(
     pool: &sqlx::PgPool,
     query: &PublicListingsQuery,
@@ -265,27 +270,29 @@ pub async fn list_public_listing_rows(
             .push(" AND lower(l.city) = ")
             .push_bind(city.to_ascii_lowercase());
     }
+    // Text predicates use ILIKE on the bare columns so the trigram indexes on
+    // published listings can serve them; NULL never matches, as before.
     if let Some(neighborhood) = non_empty_opt(query.neighborhood.as_deref()) {
         builder
-            .push(" AND lower(coalesce(l.neighborhood, '')) LIKE ")
-            .push_bind(format!("%{}%", neighborhood.to_ascii_lowercase()));
+            .push(" AND l.neighborhood ILIKE ")
+            .push_bind(like_contains_pattern(&neighborhood));
     }
     if let Some(q) = non_empty_opt(query.q.as_deref()) {
-        let needle = format!("%{}%", q.to_ascii_lowercase());
+        let needle = like_contains_pattern(&q);
         builder
-            .push(" AND (lower(coalesce(l.title, '')) LIKE ")
+            .push(" AND (l.title ILIKE ")
             .push_bind(needle.clone())
-            .push(" OR lower(coalesce(l.summary, '')) LIKE ")
+            .push(" OR l.summary ILIKE ")
             .push_bind(needle.clone())
-            .push(" OR lower(coalesce(l.neighborhood, '')) LIKE ")
+            .push(" OR l.neighborhood ILIKE ")
             .push_bind(needle.clone())
-            .push(" OR lower(coalesce(l.description, '')) LIKE ")
+            .push(" OR l.description ILIKE ")
             .push_bind(needle)
             .push(")");
     }
     if let Some(property_type) = non_empty_opt(query.property_type.as_deref()) {
         builder
-            .push(" AND lower(coalesce(l.property_type, '')) = ")
+            .push(" AND lower(l.property_type) = ")
             .push_bind(property_type.to_ascii_lowercase());
     }
     if let Some(furnished) = query.furnished {
@@ -293,53 +300,105 @@ pub async fn list_public_listing_rows(
     }
     if let Some(pet_policy) = non_empty_opt(query.pet_policy.as_deref()) {
         builder
-            .push(" AND lower(coalesce(l.pet_policy, '')) LIKE ")
-            .push_bind(format!("%{}%", pet_policy.to_ascii_lowercase()));
+            .push(" AND l.pet_policy ILIKE ")
+            .push_bind(like_contains_pattern(&pet_policy));
     }
     if let Some(min_parking) = query.min_parking {
-        builder
-            .push(" AND coalesce(l.parking_spaces, 0) >= ")
-            .push_bind(min_parking);
+        push_bound(
+            &mut builder,
+            "l.parking_spaces",
+            ">=",
+            min_parking,
+            min_parking <= 0,
+        );
     }
     if let Some(min_bedrooms) = query.min_bedrooms {
-        builder
-            .push(" AND coalesce(l.bedrooms, 0) >= ")
-            .push_bind(min_bedrooms);
+        push_bound(
+            &mut builder,
+            "l.bedrooms",
+            ">=",
+            min_bedrooms,
+            min_bedrooms <= 0,
+        );
     }
     if let Some(min_bathrooms) = query.min_bathrooms {
-        builder
-            .push(" AND coalesce(l.bathrooms, 0) >= ")
-            .push_bind(min_bathrooms);
+        push_bound(
+            &mut builder,
+            "l.bathrooms",
+            ">=",
+            min_bathrooms,
+            min_bathrooms <= 0.0,
+        );
     }
     if let Some(max_lease_months) = query.max_lease_months {
-        builder
-            .push(" AND coalesce(l.minimum_lease_months, 0) <= ")
-            .push_bind(max_lease_months);
+        push_bound(
+            &mut builder,
+            "l.minimum_lease_months",
+            "<=",
+            max_lease_months,
+            max_lease_months >= 0,
+        );
     }
     if let Some(min_monthly) = query.min_monthly {
-        builder
-            .push(" AND coalesce(l.monthly_recurring_total, 0) >= ")
-            .push_bind(min_monthly);
+        push_bound(
+            &mut builder,
+            "l.monthly_recurring_total",
+            ">=",
+            min_monthly,
+            min_monthly <= 0.0,
+        );
     }
     if let Some(max_monthly) = query.max_monthly {
-        builder
-            .push(" AND coalesce(l.monthly_recurring_total, 0) <= ")
-            .push_bind(max_monthly);
+        push_bound(
+            &mut builder,
+            "l.monthly_recurring_total",
+            "<=",
+            max_monthly,
+            max_monthly >= 0.0,
+        );
     }
     if let Some(min_move_in) = query.min_move_in {
-        builder
-            .push(" AND coalesce(l.total_move_in, 0) >= ")
-            .push_bind(min_move_in);
+        push_bound(
+            &mut builder,
+            "l.total_move_in",
+            ">=",
+            min_move_in,
+            min_move_in <= 0.0,
+        );
     }
     if let Some(max_move_in) = query.max_move_in {
-        builder
-            .push(" AND coalesce(l.total_move_in, 0) <= ")
-            .push_bind(max_move_in);
+        push_bound(
+            &mut builder,
+            "l.total_move_in",
+            "<=",
+            max_move_in,
+            max_move_in >= 0.0,
+        );
+    }
+
+    // Keyset pagination on (published_at DESC NULLS LAST, id DESC): seek past
+    // the last row of the previous page instead of re-reading it.
+    if let Some(cursor) = non_empty_opt(query.cursor.as_deref()) {
+        match parse_public_listing_cursor(&cursor)? {
+            (Some(published_at), id) => {
+                builder
+                    .push(" AND (l.published_at IS NULL OR (l.published_at, l.id) < (")
+                    .push_bind(published_at)
+                    .push(", ")
+                    .push_bind(id)
+                    .push("))");
+            }
+            (None, id) => {
+                builder
+                    .push(" AND l.published_at IS NULL AND l.id < ")
+                    .push_bind(id);
+            }
+        }
     }
 
     builder
-        .push(" ORDER BY l.published_at DESC NULLS LAST, l.created_at DESC LIMIT ")
-        .push_bind(query.limit.clamp(1, 200));
+        .push(" ORDER BY l.published_at DESC NULLS LAST, l.id DESC LIMIT ")
+        .push_bind(public_listings_limit(query));
     builder.push(") t");
 
     let rows = builder
@@ -353,13 +412,67 @@ pub async fn list_public_listing_rows(
         .collect())
 }
 
+pub fn public_listings_limit(query: &PublicListingsQuery) -> i64 {
+    query.limit.clamp(1, 200)
+}
+
+/// `next_cursor` for a page ending at `row`; `published_at` is left empty for
+/// listings that were never stamped.
+pub fn public_listing_cursor(row: &Value) -> String {
+    format!(
+        "{}|{}",
+        value_str(row, "published_at"),
+        value_str(row, "id")
+    )
+}
+
+fn parse_public_listing_cursor(
+    cursor: &str,
+) -> AppResult<(Option<chrono::DateTime<chrono::FixedOffset>>, uuid::Uuid)> {
+    let invalid = || AppError::BadRequest("Invalid listings cursor.".to_string());
+    let (published_at, id) = cursor.split_once('|').ok_or_else(invalid)?;
+    let published_at = match published_at.trim() {
+        "" => None,
+        value => Some(chrono::DateTime::parse_from_rfc3339(value).map_err(|_| invalid())?),
+    };
+    let id = uuid::Uuid::parse_str(id.trim()).map_err(|_| invalid())?;
+    Ok((published_at, id))
+}
+
+/// Compare `column` against `value` the way `coalesce(column, 0) <op> value`
+/// would, without wrapping the column so an index on it stays usable.
+/// `null_matches` is whether a missing value (read as 0) passes the bound.
+fn push_bound<'args, T>(
+    builder: &mut QueryBuilder<'args, Postgres>,
+    column: &str,
+    op: &str,
+    value: T,
+    null_matches: bool,
+) where
+    T: 'args + sqlx::Encode<'args, Postgres> + sqlx::Type<Postgres> + Send,
+{
+    if null_matches {
+        builder
+            .push(format!(" AND ({column} IS NULL OR {column} {op} "))
+            .push_bind(value)
+            .push(")");
+    } else {
+        builder
+            .push(format!(" AND {column} {op} "))
+            .push_bind(value);
+    }
+}
+
+/// Listing row with its unit, property, organization and application stats
+/// joined in, plus the raw `fee_lines` (see `with_fee_line_totals`).
 pub async fn get_listing_row_with_context(
     pool: &sqlx::PgPool,
     listing_id: &str,
 ) -> AppResult<Value> {
     let parsed_id = parse_uuid(listing_id, "listing_id")?;
-    let query = "SELECT row_to_json(t) AS row FROM (
-        SELECT l.*, p.name AS property_name, u.name AS unit_name, pt.name AS pricing_template_label,
+    let query = format!(
+        "SELECT row_to_json(t) AS row FROM (
+        SELECT l.*, {FEE_LINES_COLUMN}, p.name AS property_name, u.name AS unit_name, pt.name AS pricing_template_label,
                o.name AS organization_name, o.logo_url AS organization_logo_url, o.brand_color AS organization_brand_color,
                o.org_slug AS organization_slug, o.booking_enabled AS booking_enabled, owner.full_name AS host_name,
                COALESCE(app_stats.total_applications, 0) AS application_count,
@@ -380,10 +493,12 @@ pub async fn get_listing_row_with_context(
             FROM application_submissions
             WHERE listing_id = l.id
         ) app_stats ON TRUE
+        {FEE_LINES_JOIN}
         WHERE l.id = $1
-    ) t LIMIT 1";
+    ) t LIMIT 1"
+    );
 
-    let row = sqlx::query(query)
+    let row = sqlx::query(&query)
         .bind(parsed_id)
         .fetch_optional(pool)
         .await
@@ -398,15 +513,16 @@ pub async fn get_public_listing_row_by_slug(
     slug: &str,
     include_drafts: bool,
 ) -> AppResult<Value> {
-    let mut builder = QueryBuilder::<Postgres>::new(
+    let mut builder = QueryBuilder::<Postgres>::new(format!(
         "SELECT row_to_json(t) AS row FROM (
-            SELECT l.*, o.name AS organization_name, o.logo_url AS organization_logo_url, o.brand_color AS organization_brand_color,
+            SELECT l.*, {FEE_LINES_COLUMN}, o.name AS organization_name, o.logo_url AS organization_logo_url, o.brand_color AS organization_brand_color,
                    o.org_slug AS organization_slug, o.booking_enabled AS booking_enabled, u.full_name AS host_name
             FROM listings l
             LEFT JOIN organizations o ON l.organization_id = o.id
             LEFT JOIN app_users u ON o.owner_user_id = u.id
-            WHERE l.public_slug = ",
-    );
+            {FEE_LINES_JOIN}
+            WHERE l.public_slug = "
+    ));
     builder.push_bind(slug.to_string());
     if !include_drafts {
         builder.push(" AND l.is_published = true");
@@ -526,17 +642,18 @@ pub async fn build_listings_overview(
     }))
 }
 
+/// Detail overview for a listing row loaded with
+/// `get_listing_row_with_context`.
 pub async fn build_listing_detail_overview(
     state: &AppState,
     pool: &sqlx::PgPool,
     listing_id: &str,
+    row: Value,
 ) -> AppResult<Value> {
-    let row = get_listing_row_with_context(pool, listing_id).await?;
-    let mut attached = attach_listing_fee_lines(pool, vec![row]).await?;
-    let row = attached.pop().unwrap_or_else(|| Value::Object(Map::new()));
+    let row = with_fee_line_totals(row);
     let lifecycle = listing_lifecycle_state(state, &row);
     let readiness_report = listing_readiness_report(&row);
-    let preview = public_listing_shape(state, &row);
+    let preview = public_listing_shape(state, row.clone());
 
     let unit_id = non_empty_opt(row.get("unit_id").and_then(Value::as_str));
     let listing_uuid = parse_uuid(listing_id, "listing_id")?;
@@ -685,71 +802,93 @@ pub async fn build_listing_detail_overview(
     }))
 }
 
-pub async fn build_listing_preview(
-    state: &AppState,
-    pool: &sqlx::PgPool,
-    listing_id: &str,
-) -> AppResult<Value> {
-    let row = get_listing_row_with_context(pool, listing_id).await?;
-    let mut attached = attach_listing_fee_lines(pool, vec![row]).await?;
-    let row = attached.pop().unwrap_or_else(|| Value::Object(Map::new()));
-    Ok(public_listing_shape(state, &row))
+/// Public preview of a listing row loaded with
+/// `get_listing_row_with_context`.
+pub fn build_listing_preview(state: &AppState, row: Value) -> Value {
+    public_listing_shape(state, with_fee_line_totals(row))
 }
 
-pub fn public_listing_shape(state: &AppState, row: &Value) -> Value {
-    let fee_lines = row
-        .get("fee_lines")
-        .and_then(Value::as_array)
-        .cloned()
+/// Public view of a listing row. Takes the row by value and moves each field
+/// out instead of cloning it; long text such as `description` and the fee
+/// lines are not copied.
+pub fn public_listing_shape(state: &AppState, row: Value) -> Value {
+    let mut row = match row {
+        Value::Object(map) => map,
+        _ => Map::new(),
+    };
+    // Writes already store a clean gallery; only older or hand-edited rows
+    // need rebuilding.
+    let gallery_image_urls = match row.remove("gallery_image_urls") {
+        Some(Value::Array(items)) if is_clean_gallery(&items) => Value::Array(items),
+        other => json!(normalize_gallery_urls(other.as_ref(), false).unwrap_or_default()),
+    };
+    let floor_plans =
+        normalize_spatial_assets(row.get("floor_plans"), "floor_plans", false).unwrap_or_default();
+    let virtual_tours = normalize_spatial_assets(row.get("virtual_tours"), "virtual_tours", false)
         .unwrap_or_default();
+    let amenities = normalize_amenities(row.get("amenities"), false).unwrap_or_default();
+    let poi_context =
+        normalize_poi_context(row.get("poi_context"), false).unwrap_or_else(|_| json!({}));
+    let booking_enabled = bool_value(row.get("booking_enabled"));
+    let furnished = bool_value(row.get("furnished"));
+    let fee_breakdown_complete = bool_value(row.get("fee_breakdown_complete"));
+    let fee_lines = match row.remove("fee_lines") {
+        Some(Value::Array(lines)) => lines,
+        _ => Vec::new(),
+    };
+    let missing_required_fee_lines = row
+        .remove("missing_required_fee_lines")
+        .unwrap_or_else(|| Value::Array(Vec::new()));
+    let mut take = |key: &str| row.remove(key).unwrap_or(Value::Null);
+
     json!({
-        "id": row.get("id").cloned().unwrap_or(Value::Null),
-        "organization_id": row.get("organization_id").cloned().unwrap_or(Value::Null),
-        "organization_name": row.get("organization_name").cloned().unwrap_or(Value::Null),
-        "organization_logo_url": row.get("organization_logo_url").cloned().unwrap_or(Value::Null),
-        "organization_brand_color": row.get("organization_brand_color").cloned().unwrap_or(Value::Null),
-        "host_name": row.get("host_name").cloned().unwrap_or(Value::Null),
-        "organization_slug": row.get("organization_slug").cloned().unwrap_or(Value::Null),
-        "booking_enabled": bool_value(row.get("booking_enabled")),
-        "public_slug": row.get("public_slug").cloned().unwrap_or(Value::Null),
-        "title": row.get("title").cloned().unwrap_or(Value::Null),
-        "summary": row.get("summary").cloned().unwrap_or(Value::Null),
-        "description": row.get("description").cloned().unwrap_or(Value::Null),
-        "city": row.get("city").cloned().unwrap_or(Value::Null),
-        "neighborhood": row.get("neighborhood").cloned().unwrap_or(Value::Null),
-        "country_code": row.get("country_code").cloned().unwrap_or(Value::Null),
-        "currency": row.get("currency").cloned().unwrap_or(Value::Null),
-        "application_url": row.get("application_url").cloned().unwrap_or(Value::Null),
-        "cover_image_url": row.get("cover_image_url").cloned().unwrap_or(Value::Null),
-        "gallery_image_urls": normalize_gallery_urls(row.get("gallery_image_urls"), false).unwrap_or_default(),
-        "floor_plans": normalize_spatial_assets(row.get("floor_plans"), "floor_plans", false).unwrap_or_default(),
-        "virtual_tours": normalize_spatial_assets(row.get("virtual_tours"), "virtual_tours", false).unwrap_or_default(),
-        "bedrooms": row.get("bedrooms").cloned().unwrap_or(Value::Null),
-        "bathrooms": row.get("bathrooms").cloned().unwrap_or(Value::Null),
-        "square_meters": row.get("square_meters").cloned().unwrap_or(Value::Null),
-        "property_type": row.get("property_type").cloned().unwrap_or(Value::Null),
-        "furnished": bool_value(row.get("furnished")),
-        "pet_policy": row.get("pet_policy").cloned().unwrap_or(Value::Null),
-        "parking_spaces": row.get("parking_spaces").cloned().unwrap_or(Value::Null),
-        "minimum_lease_months": row.get("minimum_lease_months").cloned().unwrap_or(Value::Null),
-        "available_from": row.get("available_from").cloned().unwrap_or(Value::Null),
-        "amenities": normalize_amenities(row.get("amenities"), false).unwrap_or_default(),
-        "poi_context": normalize_poi_context(row.get("poi_context"), false).unwrap_or_else(|_| json!({})),
-        "walkability_score": row.get("walkability_score").cloned().unwrap_or(Value::Null),
-        "transit_score": row.get("transit_score").cloned().unwrap_or(Value::Null),
-        "private_space_summary": row.get("private_space_summary").cloned().unwrap_or(Value::Null),
-        "shared_space_summary": row.get("shared_space_summary").cloned().unwrap_or(Value::Null),
-        "maintenance_fee": row.get("maintenance_fee").cloned().unwrap_or(Value::Null),
+        "id": take("id"),
+        "organization_id": take("organization_id"),
+        "organization_name": take("organization_name"),
+        "organization_logo_url": take("organization_logo_url"),
+        "organization_brand_color": take("organization_brand_color"),
+        "host_name": take("host_name"),
+        "organization_slug": take("organization_slug"),
+        "booking_enabled": booking_enabled,
+        "public_slug": take("public_slug"),
+        "title": take("title"),
+        "summary": take("summary"),
+        "description": take("description"),
+        "city": take("city"),
+        "neighborhood": take("neighborhood"),
+        "country_code": take("country_code"),
+        "currency": take("currency"),
+        "application_url": take("application_url"),
+        "cover_image_url": take("cover_image_url"),
+        "gallery_image_urls": gallery_image_urls,
+        "floor_plans": floor_plans,
+        "virtual_tours": virtual_tours,
+        "bedrooms": take("bedrooms"),
+        "bathrooms": take("bathrooms"),
+        "square_meters": take("square_meters"),
+        "property_type": take("property_type"),
+        "furnished": furnished,
+        "pet_policy": take("pet_policy"),
+        "parking_spaces": take("parking_spaces"),
+        "minimum_lease_months": take("minimum_lease_months"),
+        "available_from": take("available_from"),
+        "amenities": amenities,
+        "poi_context": poi_context,
+        "walkability_score": take("walkability_score"),
+        "transit_score": take("transit_score"),
+        "private_space_summary": take("private_space_summary"),
+        "shared_space_summary": take("shared_space_summary"),
+        "maintenance_fee": take("maintenance_fee"),
         "whatsapp_contact_url": whatsapp_contact_url(state),
-        "published_at": row.get("published_at").cloned().unwrap_or(Value::Null),
-        "total_move_in": row.get("total_move_in").cloned().unwrap_or(Value::Null),
-        "monthly_recurring_total": row.get("monthly_recurring_total").cloned().unwrap_or(Value::Null),
+        "published_at": take("published_at"),
+        "total_move_in": take("total_move_in"),
+        "monthly_recurring_total": take("monthly_recurring_total"),
         "fee_lines": fee_lines,
-        "fee_breakdown_complete": bool_value(row.get("fee_breakdown_complete")),
-        "missing_required_fee_lines": row.get("missing_required_fee_lines").cloned().unwrap_or_else(|| Value::Array(Vec::new())),
-        "property_id": row.get("property_id").cloned().unwrap_or(Value::Null),
-        "unit_id": row.get("unit_id").cloned().unwrap_or(Value::Null),
-        "created_at": row.get("created_at").cloned().unwrap_or(Value::Null),
+        "fee_breakdown_complete": fee_breakdown_complete,
+        "missing_required_fee_lines": missing_required_fee_lines,
+        "property_id": take("property_id"),
+        "unit_id": take("unit_id"),
+        "created_at": take("created_at"),
     })
 }
 
@@ -1049,27 +1188,14 @@ fn map_db_error(error: sqlx::Error) -> AppError {
 }
 
 fn whatsapp_contact_url(state: &AppState) -> Value {
-    let normalized = state
+    state
         .config
-        .marketplace_whatsapp_phone_e164
-        .as_deref()
-        .and_then(normalize_whatsapp_phone);
-    normalized
-        .map(|phone| Value::String(format!("https://wa.me/{phone}")))
+        .marketplace_whatsapp_contact_url
+        .clone()
+        .map(Value::String)
         .unwrap_or(Value::Null)
 }
 
-fn normalize_whatsapp_phone(value: &str) -> Option<String> {
-    let digits = value
-        .chars()
-        .filter(|character| character.is_ascii_digit())
-        .collect::<String>();
-    if digits.is_empty() {
-        return None;
-    }
-    Some(digits)
-}
-
 fn normalize_spatial_assets(
     value: Option<&Value>,
     field: &str,
@@ -1119,6 +1245,16 @@ fn normalize_poi_context(value: Option<&Value>, strict: bool) -> AppResult<Value
     }
 }
 
+/// Whether a stored gallery is already what `normalize_gallery_urls` would
+/// return for it.
+fn is_clean_gallery(items: &[Value]) -> bool {
+    items.len() <= MAX_GALLERY_IMAGES
+        && items.iter().all(|item| {
+            item.as_str()
+                .is_some_and(|text| !text.is_empty() && text.trim() == text)
+        })
+}
+
 fn normalize_gallery_urls(value: Option<&Value>, strict: bool) -> AppResult<Vec<String>> {
     let Some(raw) = value else {
         return Ok(Vec::new());
@@ -1194,3 +1330,39 @@ fn normalize_amenities(value: Option<&Value>, strict: bool) -> AppResult<Vec<Str
     }
     Ok(normalized)
 }
+
+#[cfg(test)]
+mod tests {
+    use serde_json::json;
+
+    use super::{parse_public_listing_cursor, public_listing_cursor};
+
+    #[test]
+    fn public_listing_cursor_round_trips() {
+        let row = json!({
+            "id": "7d9a4c58-2a0e-4f3e-9d4a-0c1b2e3f4a5b",
+            "published_at": "2026-02-14T10:30:00.123456+00:00",
+        });
+        let cursor = public_listing_cursor(&row);
+        let (published_at, id) = parse_public_listing_cursor(&cursor).expect("valid cursor");
+        assert_eq!(
+            published_at.map(|value| value.to_rfc3339()),
+            Some("2026-02-14T10:30:00.123456+00:00".to_string())
+        );
+        assert_eq!(id.to_string(), "7d9a4c58-2a0e-4f3e-9d4a-0c1b2e3f4a5b");
+
+        let unpublished = json!({ "id": "7d9a4c58-2a0e-4f3e-9d4a-0c1b2e3f4a5b" });
+        let (published_at, _) = parse_public_listing_cursor(&public_listing_cursor(&unpublished))
+            .expect("valid cursor");
+        assert!(published_at.is_none());
+    }
+
+    #[test]
+    fn parse_public_listing_cursor_rejects_malformed_values() {
+        assert!(parse_public_listing_cursor("2026-02-14T10:30:00+00:00").is_err());
+        assert!(
+            parse_public_listing_cursor("yesterday|7d9a4c58-2a0e-4f3e-9d4a-0c1b2e3f4a5b").is_err()
+        );
+        assert!(parse_public_listing_cursor("2026-02-14T10:30:00+00:00|1; --").is_err());
+    }
+}
@@ -11,6 +11,7 @@ pub mod alerting;
 pub mod analytics;
 pub mod anomaly_detection;
 pub mod audit;
+pub mod audit_queue;
 pub mod channel_optimizer;
 pub mod collection_cycle;
 pub mod cron;
@@ -27,8 +28,10 @@ pub mod json_helpers;
 pub mod lease_abstraction;
 pub mod lease_renewal;
 pub mod lease_schedule;
+pub mod lease_status_refresh;
 pub mod leases;
 pub mod leasing_agent;
+pub mod list_etag;
 pub mod listings;
 pub mod llm_client;
 pub mod maintenance_dispatch;
@@ -74,6 +74,7 @@ pub struct AppState {
     pub enrichment_cache: CacheLayer,
     pub agent_config_cache: CacheLayer,
     pub fx_cache: CacheLayer,
+    pub auth_user_cache: CacheLayer,
 }
 
 impl AppState {
@@ -121,6 +122,11 @@ impl AppState {
             config.fx_cache_max_entries as u64,
             Duration::from_secs(config.fx_cache_ttl_seconds.max(1)),
         );
+        let auth_user_cache = CacheLayer::new(
+            "auth_user",
+            config.auth_user_cache_max_entries as u64,
+            Duration::from_secs(config.auth_user_cache_ttl_seconds.max(1)),
+        );
 
         let config = Arc::new(config);
         let llm_client = LlmClient::new(http_client.clone(), Arc::clone(&config));
@@ -137,6 +143,7 @@ impl AppState {
             enrichment_cache,
             agent_config_cache,
             fx_cache,
+            auth_user_cache,
         })
     }
 
@@ -0,0 +1,5 @@
+-- Keyset pagination for GET /expenses seeks on (expense_date, id) per org.
+-- 2026-03-08
+
+CREATE INDEX IF NOT EXISTS idx_expenses_org_date_id
+  ON expenses (organization_id, expense_date DESC, id DESC);
@@ -0,0 +1,8 @@
+-- Trigram index for the GET /expenses vendor_name filter
+-- (vendor_name ILIKE '%query%'), which a btree index cannot serve.
+-- 2026-03-08
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_expenses_vendor_name_trgm
+  ON expenses USING gin (vendor_name gin_trgm_ops);
@@ -0,0 +1,26 @@
+-- Indexes for the GET /public/listings filters, which run against published
+-- listings only. Trigram indexes serve the neighborhood / free-text ILIKE
+-- predicates; the lower(city) index serves the exact city match.
+-- 2026-03-09
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_listings_public_city_lower
+  ON listings (lower(city), published_at DESC)
+  WHERE is_published = true;
+
+CREATE INDEX IF NOT EXISTS idx_listings_public_title_trgm
+  ON listings USING gin (title gin_trgm_ops)
+  WHERE is_published = true;
+
+CREATE INDEX IF NOT EXISTS idx_listings_public_summary_trgm
+  ON listings USING gin (summary gin_trgm_ops)
+  WHERE is_published = true;
+
+CREATE INDEX IF NOT EXISTS idx_listings_public_neighborhood_trgm
+  ON listings USING gin (neighborhood gin_trgm_ops)
+  WHERE is_published = true;
+
+CREATE INDEX IF NOT EXISTS idx_listings_public_description_trgm
+  ON listings USING gin (description gin_trgm_ops)
+  WHERE is_published = true;
@@ -0,0 +1,12 @@
+-- Keyset pagination for GET /public/listings orders published listings by
+-- (published_at DESC NULLS LAST, id DESC). These indexes serve the seek for
+-- the whole marketplace and for a single organization's storefront.
+-- 2026-03-10
+
+CREATE INDEX IF NOT EXISTS idx_listings_public_keyset
+  ON listings (published_at DESC NULLS LAST, id DESC)
+  WHERE is_published = true;
+
+CREATE INDEX IF NOT EXISTS idx_listings_public_org_keyset
+  ON listings (organization_id, published_at DESC NULLS LAST, id DESC)
+  WHERE is_published = true;
@@ -0,0 +1,22 @@
+-- Line items and reconciliation captured when an owner statement is
+-- finalized, so reading a closed statement no longer rebuilds its breakdown
+-- from reservations, expenses, leases, charges and collections. Kept out of
+-- owner_statements so statement lists do not carry the line items.
+-- 2026-03-11
+
+CREATE TABLE IF NOT EXISTS owner_statement_snapshots (
+  statement_id uuid PRIMARY KEY REFERENCES owner_statements(id) ON DELETE CASCADE,
+  organization_id uuid NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+  line_items jsonb NOT NULL DEFAULT '[]'::jsonb,
+  gross_total numeric(12, 2) NOT NULL DEFAULT 0,
+  computed_net_payout numeric(12, 2) NOT NULL DEFAULT 0,
+  created_at timestamptz NOT NULL DEFAULT now()
+);
+
+ALTER TABLE owner_statement_snapshots ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS owner_statement_snapshots_org_member_all ON owner_statement_snapshots;
+CREATE POLICY owner_statement_snapshots_org_member_all
+  ON owner_statement_snapshots FOR ALL
+  USING (is_org_member(organization_id))
+  WITH CHECK (is_org_member(organization_id));
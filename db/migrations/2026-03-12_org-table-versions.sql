@@ -0,0 +1,95 @@
+-- Per-organization change markers for the tables behind cached list and
+-- statement responses. Every insert, update or delete bumps the row for
+-- (organization_id, table_name) to a fresh sequence value, so reading the
+-- marker is a single index lookup and a write is visible in it as soon as it
+-- commits (updated_at uses the transaction start time and can lag).
+-- No foreign key to organizations: the cascade that deletes an organization
+-- fires these triggers after the organization row is gone.
+-- 2026-03-12
+
+CREATE SEQUENCE IF NOT EXISTS org_table_version_seq;
+
+CREATE TABLE IF NOT EXISTS org_table_versions (
+  organization_id uuid NOT NULL,
+  table_name text NOT NULL,
+  version bigint NOT NULL DEFAULT nextval('org_table_version_seq'),
+  PRIMARY KEY (organization_id, table_name)
+);
+
+CREATE OR REPLACE FUNCTION bump_org_table_version()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  org_id uuid;
+BEGIN
+  IF TG_OP = 'DELETE' THEN
+    org_id := OLD.organization_id;
+  ELSE
+    org_id := NEW.organization_id;
+  END IF;
+
+  INSERT INTO org_table_versions (organization_id, table_name)
+  VALUES (org_id, TG_TABLE_NAME)
+  ON CONFLICT (organization_id, table_name)
+  DO UPDATE SET version = nextval('org_table_version_seq');
+
+  IF TG_OP = 'UPDATE' AND OLD.organization_id IS DISTINCT FROM NEW.organization_id THEN
+    INSERT INTO org_table_versions (organization_id, table_name)
+    VALUES (OLD.organization_id, TG_TABLE_NAME)
+    ON CONFLICT (organization_id, table_name)
+    DO UPDATE SET version = nextval('org_table_version_seq');
+  END IF;
+
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_leases_org_version ON leases;
+CREATE TRIGGER trg_leases_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON leases
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
+DROP TRIGGER IF EXISTS trg_collection_records_org_version ON collection_records;
+CREATE TRIGGER trg_collection_records_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON collection_records
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
+DROP TRIGGER IF EXISTS trg_documents_org_version ON documents;
+CREATE TRIGGER trg_documents_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON documents
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
+DROP TRIGGER IF EXISTS trg_properties_org_version ON properties;
+CREATE TRIGGER trg_properties_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON properties
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
+DROP TRIGGER IF EXISTS trg_units_org_version ON units;
+CREATE TRIGGER trg_units_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON units
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
+DROP TRIGGER IF EXISTS trg_unit_spaces_org_version ON unit_spaces;
+CREATE TRIGGER trg_unit_spaces_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON unit_spaces
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
+DROP TRIGGER IF EXISTS trg_unit_beds_org_version ON unit_beds;
+CREATE TRIGGER trg_unit_beds_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON unit_beds
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
+DROP TRIGGER IF EXISTS trg_expenses_org_version ON expenses;
+CREATE TRIGGER trg_expenses_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON expenses
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
+ALTER TABLE org_table_versions ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS org_table_versions_org_member_read ON org_table_versions;
+CREATE POLICY org_table_versions_org_member_read
+  ON org_table_versions FOR SELECT
+  USING (is_org_member(organization_id));
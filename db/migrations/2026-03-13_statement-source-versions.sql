@@ -0,0 +1,13 @@
+-- Change markers for the remaining tables behind the draft owner statement
+-- cache (expenses, leases, collection_records and units already have them).
+-- 2026-03-13
+
+DROP TRIGGER IF EXISTS trg_reservations_org_version ON reservations;
+CREATE TRIGGER trg_reservations_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON reservations
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
+DROP TRIGGER IF EXISTS trg_lease_charges_org_version ON lease_charges;
+CREATE TRIGGER trg_lease_charges_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON lease_charges
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
@@ -5,6 +5,7 @@
 CREATE EXTENSION IF NOT EXISTS pgcrypto;
 CREATE EXTENSION IF NOT EXISTS btree_gist;
 CREATE EXTENSION IF NOT EXISTS citext;
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
 CREATE EXTENSION IF NOT EXISTS vector;
 
 -- ---------- Enums ----------
@@ -746,6 +747,10 @@ CREATE TABLE expenses (
 CREATE INDEX idx_expenses_org_date ON expenses(organization_id, expense_date);
 CREATE INDEX idx_expenses_org_category ON expenses(organization_id, category);
 CREATE INDEX idx_expenses_reservation_id ON expenses(reservation_id);
+CREATE INDEX idx_expenses_org_date_id
+  ON expenses(organization_id, expense_date DESC, id DESC);
+CREATE INDEX idx_expenses_vendor_name_trgm
+  ON expenses USING gin (vendor_name gin_trgm_ops);
 
 CREATE TABLE owner_statements (
   id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -780,6 +785,15 @@ CREATE TABLE owner_statements (
 CREATE INDEX idx_owner_statements_org_period
   ON owner_statements(organization_id, period_start, period_end);
 
+CREATE TABLE owner_statement_snapshots (
+  statement_id uuid PRIMARY KEY REFERENCES owner_statements(id) ON DELETE CASCADE,
+  organization_id uuid NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+  line_items jsonb NOT NULL DEFAULT '[]'::jsonb,
+  gross_total numeric(12, 2) NOT NULL DEFAULT 0,
+  computed_net_payout numeric(12, 2) NOT NULL DEFAULT 0,
+  created_at timestamptz NOT NULL DEFAULT now()
+);
+
 CREATE TABLE pricing_templates (
   id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
   organization_id uuid NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
@@ -875,6 +889,27 @@ CREATE INDEX idx_listings_org_updated
 CREATE UNIQUE INDEX idx_listings_one_published_per_unit
   ON listings(organization_id, unit_id)
   WHERE unit_id IS NOT NULL AND is_published = true;
+CREATE INDEX idx_listings_public_city_lower
+  ON listings(lower(city), published_at DESC)
+  WHERE is_published = true;
+CREATE INDEX idx_listings_public_title_trgm
+  ON listings USING gin (title gin_trgm_ops)
+  WHERE is_published = true;
+CREATE INDEX idx_listings_public_summary_trgm
+  ON listings USING gin (summary gin_trgm_ops)
+  WHERE is_published = true;
+CREATE INDEX idx_listings_public_neighborhood_trgm
+  ON listings USING gin (neighborhood gin_trgm_ops)
+  WHERE is_published = true;
+CREATE INDEX idx_listings_public_description_trgm
+  ON listings USING gin (description gin_trgm_ops)
+  WHERE is_published = true;
+CREATE INDEX idx_listings_public_keyset
+  ON listings(published_at DESC NULLS LAST, id DESC)
+  WHERE is_published = true;
+CREATE INDEX idx_listings_public_org_keyset
+  ON listings(organization_id, published_at DESC NULLS LAST, id DESC)
+  WHERE is_published = true;
 
 CREATE TABLE listing_fee_lines (
   id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -2328,6 +2363,90 @@ CREATE TRIGGER trg_integration_events_updated_at
   BEFORE UPDATE ON integration_events
   FOR EACH ROW EXECUTE FUNCTION set_updated_at();
 
+-- ---------- Change markers ----------
+-- Bumped on every write to the tables below; read by cached list and
+-- statement endpoints instead of scanning the tables themselves.
+
+CREATE SEQUENCE org_table_version_seq;
+
+CREATE TABLE org_table_versions (
+  organization_id uuid NOT NULL,
+  table_name text NOT NULL,
+  version bigint NOT NULL DEFAULT nextval('org_table_version_seq'),
+  PRIMARY KEY (organization_id, table_name)
+);
+
+CREATE OR REPLACE FUNCTION bump_org_table_version()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  org_id uuid;
+BEGIN
+  IF TG_OP = 'DELETE' THEN
+    org_id := OLD.organization_id;
+  ELSE
+    org_id := NEW.organization_id;
+  END IF;
+
+  INSERT INTO org_table_versions (organization_id, table_name)
+  VALUES (org_id, TG_TABLE_NAME)
+  ON CONFLICT (organization_id, table_name)
+  DO UPDATE SET version = nextval('org_table_version_seq');
+
+  IF TG_OP = 'UPDATE' AND OLD.organization_id IS DISTINCT FROM NEW.organization_id THEN
+    INSERT INTO org_table_versions (organization_id, table_name)
+    VALUES (OLD.organization_id, TG_TABLE_NAME)
+    ON CONFLICT (organization_id, table_name)
+    DO UPDATE SET version = nextval('org_table_version_seq');
+  END IF;
+
+  RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER trg_leases_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON leases
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
+CREATE TRIGGER trg_collection_records_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON collection_records
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
+CREATE TRIGGER trg_documents_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON documents
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
+CREATE TRIGGER trg_properties_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON properties
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
+CREATE TRIGGER trg_units_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON units
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
+CREATE TRIGGER trg_unit_spaces_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON unit_spaces
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
+CREATE TRIGGER trg_unit_beds_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON unit_beds
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
+CREATE TRIGGER trg_expenses_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON expenses
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
+CREATE TRIGGER trg_reservations_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON reservations
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
+CREATE TRIGGER trg_lease_charges_org_version
+  AFTER INSERT OR UPDATE OR DELETE ON lease_charges
+  FOR EACH ROW EXECUTE FUNCTION bump_org_table_version();
+
 -- ---------- Optional RLS policies (Supabase-friendly) ----------
 -- If you are on Neon and enforcing tenancy in application code, keep RLS disabled
 -- or adapt auth_user_id() to your session variable model.
@@ -2402,6 +2521,8 @@ ALTER TABLE calendar_blocks ENABLE ROW LEVEL SECURITY;
 ALTER TABLE tasks ENABLE ROW LEVEL SECURITY;
 ALTER TABLE expenses ENABLE ROW LEVEL SECURITY;
 ALTER TABLE owner_statements ENABLE ROW LEVEL SECURITY;
+ALTER TABLE owner_statement_snapshots ENABLE ROW LEVEL SECURITY;
+ALTER TABLE org_table_versions ENABLE ROW LEVEL SECURITY;
 ALTER TABLE pricing_templates ENABLE ROW LEVEL SECURITY;
 ALTER TABLE pricing_template_lines ENABLE ROW LEVEL SECURITY;
 ALTER TABLE listings ENABLE ROW LEVEL SECURITY;
@@ -2503,6 +2624,15 @@ CREATE POLICY owner_statements_org_member_all
   USING (is_org_member(organization_id))
   WITH CHECK (is_org_member(organization_id));
 
+CREATE POLICY owner_statement_snapshots_org_member_all
+  ON owner_statement_snapshots FOR ALL
+  USING (is_org_member(organization_id))
+  WITH CHECK (is_org_member(organization_id));
+
+CREATE POLICY org_table_versions_org_member_read
+  ON org_table_versions FOR SELECT
+  USING (is_org_member(organization_id));
+
 CREATE POLICY pricing_templates_org_member_all
   ON pricing_templates FOR ALL
   USING (is_org_member(organization_id))